@@ -4,11 +4,12 @@
 Menu d'affichage de la bibliothèque musicale de l'application FunkyTunes.
 """
 
-from PySide6.QtWidgets import QWidget, QFrame,  QHBoxLayout, QVBoxLayout
+from PySide6.QtWidgets import QWidget, QFrame,  QHBoxLayout, QVBoxLayout, QLabel
 from PySide6.QtCore import Qt, QSortFilterProxyModel
 
 from app.UI.molecules.menus.menu_library import MenuLibrary
 from app.UI.atoms.library.library_display import TracksTableView
+from app.view_models.model_lazy_tracks import LazyTracksTableModel
 
 
 class LibraryDisplayMenu(QWidget):
@@ -40,6 +41,12 @@ class LibraryDisplayMenu(QWidget):
         self.tracks_layout = QVBoxLayout(self.tracks_container)
         self.tracks_layout.setContentsMargins(0, 0, 0, 0)     
         
+        # Indicateur de chargement de la bibliothèque
+        self.loading_label = QLabel("Chargement de la bibliothèque…")
+        self.loading_label.setAlignment(Qt.AlignCenter)
+        self.loading_label.hide()
+        self.tracks_layout.addWidget(self.loading_label)
+        
         # Vue des tracks
         self.tracks_view = TracksTableView()
         self.tracks_layout.addWidget(self.tracks_view)
@@ -55,14 +62,28 @@ class LibraryDisplayMenu(QWidget):
     def set_tracks_model(self, model):
         """
         Injecte le modèle Qt dans la vue via un proxy pour filtrage.
+
+        Un modèle virtuel (LazyTracksTableModel) est branché directement, tri
+        désactivé : un proxy de tri lirait toutes ses lignes.
         """
         
         self.tracks_table_model = model
         
+        if isinstance(model, LazyTracksTableModel):
+            self.tracks_proxy_model = None
+            self.tracks_view.setSortingEnabled(False)
+            self.tracks_view.setModel(model)
+            return
+        
         self.tracks_proxy_model = QSortFilterProxyModel()
         self.tracks_proxy_model.setSourceModel(model)
         self.tracks_proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
         self.tracks_proxy_model.setFilterKeyColumn(2)  # filtrer sur colonne Artiste
 
+        self.tracks_view.setSortingEnabled(True)
         self.tracks_view.setModel(self.tracks_proxy_model)
-        
\ No newline at end of file
+        
+        
+    def set_loading(self, loading: bool):
+        """Affiche ou masque l'indicateur de chargement de la bibliothèque."""
+        self.loading_label.setVisible(loading)
@@ -66,10 +66,10 @@ class TracksByAlbumView(QWidget):
     
     album_selected = Signal(object)
 
-    def __init__(self, albums: Dict[str, List[Track]], album_icons: Dict[str, str] = None, parent=None):
+    def __init__(self, albums: Dict[int, List[Track]], album_icons: Dict[int, str] = None, parent=None):
         """
-        albums: dict[album_name -> list[Track]]
-        album_icons: dict[album_name -> path_to_image]
+        albums: dict[album_id -> list[Track]]
+        album_icons: dict[album_id -> path_to_image]
         """
         super().__init__(parent)
         
@@ -77,12 +77,12 @@ class TracksByAlbumView(QWidget):
         
         
         items = {
-            album: {
-                "title": album.title,
-                "icon": album_icons.get(album, "resources/icons/album_icon.svg"),
+            album_id: {
+                "title": tracks[0].album,
+                "icon": self.album_icons.get(album_id, "resources/icons/album_icon.svg"),
                 "payload": tracks
             }
-            for album, tracks in albums.items()
+            for album_id, tracks in albums.items()
         }
         
         layout = QVBoxLayout(self)
@@ -133,7 +133,7 @@ class TracksByGenreView(QWidget):
     Vue pour afficher les genres.
     Cliquer sur un genre émet la liste de tracks de ce genre.
     """
-    genre_selected = Signal(list)
+    genre_selected = Signal(object)
 
     def __init__(self, genres: Dict[str, List[Track]], parent=None):
         super().__init__(parent)
@@ -142,7 +142,7 @@ class TracksByGenreView(QWidget):
             genre: {
                 "title": genre,
                 "icon": "resources/icons/genre_icon.svg",
-                "tracks": tracks
+                "payload": tracks
             }
             for genre, tracks in genres.items()
         }
@@ -155,22 +155,6 @@ class TracksByGenreView(QWidget):
 
         layout.addWidget(explorer)
 
-        self._populate()
-        self.list_widget.itemClicked.connect(self._on_item_clicked)
-
-
-    def _populate(self):
-        self.list_widget.clear()
-        for genre_name, tracks in sorted(self.genres.items()):
-            item = QListWidgetItem(genre_name)
-            item.setData(256, tracks)
-            self.list_widget.addItem(item)
-
-
-    def _on_item_clicked(self, item: QListWidgetItem):
-        tracks: List[Track] = item.data(256)
-        self.genre_selected.emit(tracks)
-
 
 # ============================ #
 #   Vue Favoris                #
@@ -8,7 +8,9 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout
 from PySide6.QtCore import Qt, Signal
 
 from app.UI.atoms.icons_button import IconButton
+from app.UI.atoms.label import Label
 from app.UI.atoms.progress_bar import ProgressBar
+from app.application.import_track.import_progress import ImportProgress
 
 class ProgressBarComplete(QWidget):
     """
@@ -20,6 +22,7 @@ class ProgressBarComplete(QWidget):
     Composants :
         icons_button : bouton d'annulation
         progress_bar  : barre de progression standard
+        details_label : phase, débit, temps restant et erreurs de l'import
     """
     
     # ============== #
@@ -51,9 +54,33 @@ class ProgressBarComplete(QWidget):
         # Ajouter la barre de progression au layout
         self.progress_bar_complete_layout.addWidget(self.progress_bar)
 
+        # Détail de la progression
+        self.details_label = Label()
+        self.progress_bar_complete_layout.addWidget(self.details_label)
+
        
         
         # Définir le layout principal
         self.setLayout(self.progress_bar_complete_layout)
-        
-        
\ No newline at end of file
+
+
+    # ================================ #
+    #    Méthodes pour le controller   #
+    # ================================ #
+    def set_details(self, progress: ImportProgress):
+        """
+        Affiche le détail de la progression d'un import.
+
+        Args:
+            progress (ImportProgress): instantané émis par l'ImportWorker
+        """
+        parts = [progress.phase.value, f"{progress.processed} fichiers"]
+        if progress.files_per_second:
+            parts.append(f"{progress.files_per_second:.0f} fichiers/s")
+        if progress.eta_seconds is not None:
+            minutes, seconds = divmod(int(progress.eta_seconds), 60)
+            parts.append(f"reste ~{minutes}:{seconds:02d}")
+        if progress.errors:
+            parts.append(f"{progress.errors} erreurs")
+
+        self.details_label.setText(" · ".join(parts))
@@ -79,6 +79,8 @@ class ImportSourceDialog(QDialog):
             QMessageBox.information(
                 self,
                 "Import réussi", f"{result.imported} fichiers importés avec succès."
+                + self._incremental_summary(result)
+                + self._duplicates_summary(result)
             )
             
         elif result.status == ImportStatus.EMPTY:
@@ -94,8 +96,27 @@ class ImportSourceDialog(QDialog):
                 "Import partiel",
                 f"{result.imported} fichiers importés.\n"
                 f"{len(result.errors)} erreurs."
+                + self._incremental_summary(result)
+                + self._duplicates_summary(result)
             )    
             
+    @staticmethod
+    def _incremental_summary(result) -> str:
+        """Détail du réimport incrémental (vide si rien d'autre que des ajouts)."""
+        if not (result.updated or result.removed or result.skipped):
+            return ""
+        return (
+            f"\n{result.updated} mis à jour, {result.removed} supprimés, "
+            f"{result.skipped} inchangés."
+        )
+
+    @staticmethod
+    def _duplicates_summary(result) -> str:
+        """Nombre de doublons détectés (vide s'il n'y en a aucun)."""
+        if not result.duplicates:
+            return ""
+        return f"\n{len(result.duplicates)} doublons d'un morceau déjà présent dans la bibliothèque."
+            
         
     def show_message(self, title, message):    
         QMessageBox.information(self, title, message)
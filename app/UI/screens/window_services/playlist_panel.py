@@ -11,6 +11,7 @@ from PySide6.QtCore import Qt, Signal, QModelIndex, QSortFilterProxyModel
 from app.UI.atoms.buttons import AppButton
 from app.UI.atoms.library.library_display import TracksTableView
 from app.view_models.model_tracks import TracksTableModel
+from app.view_models.track_store import TrackStore
 from app.UI.screens.window_services.create_playlist_dialog import CreatePlaylistDialog
 
 from core.entities.track import Track
@@ -144,6 +145,31 @@ class PlaylistPanel(QWidget):
         self.show_tracks_table()
 
 
+    def append_tracks(self, tracks: List[Track]) -> None:
+        """Ajoute des pistes en fin de table, sans réinitialiser l'affichage."""
+        self.tracks_model.append_tracks(tracks)
+
+
+    def update_tracks(self, tracks: TrackStore) -> None:
+        """Remplace les pistes de la table sans changer la vue affichée (instantané partagé du LibraryCache)."""
+        self.tracks_model.set_tracks(tracks)
+
+
+    def share_tracks(self, tracks: TrackStore) -> None:
+        """Partage le store du LibraryCache dont la table affiche déjà les lignes (fin de chargement)."""
+        self.tracks_model.share_tracks(tracks)
+
+
+    def current_view_name(self) -> Optional[str]:
+        """Nom de la vue contextuelle affichée, None quand la table des pistes est affichée."""
+        if not self.tracks_table_view.isHidden():
+            return None
+        for view_name, widget in self.dynamic_views.items():
+            if widget is self.current_dynamic_view:
+                return view_name
+        return None
+
+
     def show_tracks_table(self):
         """Affiche la table principale et cache la vue dynamique."""
         if self.current_dynamic_view:
@@ -182,19 +208,27 @@ class PlaylistPanel(QWidget):
         Affiche un widget contextuel dans le container dynamique.
 
         Args:
-            view_name (str): clé unique pour réutiliser le widget
+            view_name (str): clé unique du widget (un autre widget sous la même clé remplace le précédent)
             widget (QWidget): widget à afficher
         """
         self.tracks_table_view.hide()
         self.dynamic_container_widget.show()
 
-        if view_name in self.dynamic_views:
+        previous = self.dynamic_views.get(view_name)
+        if previous is widget:
             if self.current_dynamic_view:
                 self.current_dynamic_view.hide()
-            self.current_dynamic_view = self.dynamic_views[view_name]
+            self.current_dynamic_view = widget
             self.current_dynamic_view.show()
             return
 
+        if previous is not None:
+            # Vue reconstruite (pistes rechargées) : l'ancienne est remplacée
+            if self.current_dynamic_view is previous:
+                self.current_dynamic_view = None
+            self.dynamic_container_layout.removeWidget(previous)
+            previous.deleteLater()
+
         # Ajout et affichage le nouveau widget
         self.dynamic_container_layout.addWidget(widget)
         self.dynamic_views[view_name] = widget
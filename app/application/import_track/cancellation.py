@@ -0,0 +1,55 @@
+# app/application/import_track/cancellation.py
+
+
+import threading
+from typing import Callable, List
+
+from core.logger import logger
+
+
+class CancellationToken:
+    """
+    Jeton d'annulation coopératif d'un import, partagé par toutes ses étapes.
+
+    Rôle :
+        - Être consulté entre deux unités de travail (entrée de dossier, fichier,
+          tranche d'écriture) : l'arrêt intervient à la prochaine vérification
+        - Relayer l'annulation aux composants qui ne le consultent pas eux-mêmes
+          (process d'extraction, pool des pochettes) via on_cancel
+
+    cancel() peut être appelé depuis n'importe quel thread, plusieurs fois.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+
+    def cancel(self) -> None:
+        """Demande l'annulation et prévient les composants abonnés (une seule fois)."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("CancellationToken : Échec d'un callback d'annulation")
+
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Appelle callback à l'annulation (immédiatement si elle a déjà eu lieu)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
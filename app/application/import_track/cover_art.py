@@ -0,0 +1,229 @@
+# app/application/import_track/cover_art.py
+
+
+import os
+import base64
+import hashlib
+import threading
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Sequence, Set
+
+from mutagen import File as MutagenFile
+from mutagen.flac import Picture
+from mutagen.id3 import ID3
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+
+from core.logger import logger
+
+
+COVER_CACHE_DIR = Path(__file__).resolve().parents[3] / "cache" / "covers"
+
+
+class CoverArtCache:
+    """
+    Cache disque des vignettes de pochette, adressé par le contenu de l'image source.
+
+    Rôle :
+        - Trouver la pochette d'un fichier audio : image embarquée (APIC ID3,
+          PICTURE FLAC, METADATA_BLOCK_PICTURE Ogg), sinon cover.jpg / folder.jpg… voisin
+        - Écrire une vignette JPEG par taille de SIZES, une seule fois par image :
+          deux albums à la même pochette partagent leurs vignettes
+        - Retrouver la vignette la mieux adaptée à une taille d'affichage
+
+    Album.jacket_path pointe vers la plus grande vignette ; les autres tailles
+    sont ses voisines (<hash>_<taille>.jpg).
+    """
+
+    SIZES = (64, 256)
+    SIBLING_NAMES = ("cover", "folder", "front", "album")
+    SIBLING_EXTENSIONS = (".jpg", ".jpeg", ".png")
+    JPEG_QUALITY = 85
+    # Fichiers d'un même album examinés avant de conclure qu'il n'a pas de pochette
+    MAX_FILES_PER_ALBUM = 3
+
+    def __init__(self, root: Path = COVER_CACHE_DIR):
+        self.root = Path(root)
+
+
+    # ========================== #
+    #        Vignettes           #
+    # ========================== #
+    def extract(self, file_paths: Sequence[str]) -> Optional[str]:
+        """
+        Met en cache la pochette d'un album, d'après le premier de ses fichiers qui en porte une.
+
+        Args:
+            file_paths: fichiers de l'album (au plus MAX_FILES_PER_ALBUM sont ouverts)
+
+        Returns:
+            str : chemin de la plus grande vignette, None si aucune pochette exploitable
+        """
+        for file_path in file_paths[:self.MAX_FILES_PER_ALBUM]:
+            data = self.find_picture(file_path)
+            if data:
+                return self.store(data)
+        return None
+
+
+    def store(self, image_data: bytes) -> Optional[str]:
+        """Écrit (si besoin) les vignettes d'une image et retourne la plus grande."""
+        key = hashlib.blake2b(image_data, digest_size=16).hexdigest()
+        paths = {size: self._thumbnail_path(key, size) for size in self.SIZES}
+        largest = paths[max(self.SIZES)]
+        if all(path.exists() for path in paths.values()):
+            return str(largest)
+
+        image = QImage.fromData(image_data)
+        if image.isNull():
+            return None
+
+        paths[max(self.SIZES)].parent.mkdir(parents=True, exist_ok=True)
+        for size, path in paths.items():
+            thumbnail = image
+            # Jamais d'agrandissement
+            if image.width() > size or image.height() > size:
+                thumbnail = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Écriture atomique : un lecteur ne voit jamais de vignette tronquée
+            tmp_path = path.with_name(f"{path.stem}.{threading.get_ident()}.tmp.jpg")
+            if not thumbnail.save(str(tmp_path), "JPG", self.JPEG_QUALITY):
+                return None
+            os.replace(tmp_path, path)
+
+        return str(largest)
+
+
+    @classmethod
+    def sized(cls, jacket_path: str, size: int) -> str:
+        """Plus petite vignette couvrant size, à partir d'Album.jacket_path (inchangé hors cache)."""
+        path = Path(jacket_path)
+        key, _, current = path.stem.rpartition("_")
+        if not key or not current.isdigit():
+            return jacket_path
+
+        for candidate in sorted(s for s in cls.SIZES if s >= size):
+            sibling = path.with_name(f"{key}_{candidate}.jpg")
+            if sibling.exists():
+                return str(sibling)
+        return jacket_path
+
+
+    def _thumbnail_path(self, key: str, size: int) -> Path:
+        return self.root / key[:2] / f"{key}_{size}.jpg"
+
+
+    # ========================== #
+    #     Recherche de l'image   #
+    # ========================== #
+    def find_picture(self, file_path: str) -> Optional[bytes]:
+        """Image embarquée (couverture avant de préférence), sinon image du dossier."""
+        try:
+            data = self._embedded_picture(file_path)
+        except Exception as e:
+            logger.debug(f"CoverArtCache : Pochette embarquée illisible pour {file_path} ({e})")
+            data = None
+        return data or self._sibling_picture(os.path.dirname(file_path))
+
+
+    @staticmethod
+    def _embedded_picture(file_path: str) -> Optional[bytes]:
+        audio = MutagenFile(file_path)
+        if audio is None:
+            return None
+
+        pictures = []
+        if isinstance(audio.tags, ID3):
+            pictures = [(frame.type, frame.data) for frame in audio.tags.getall("APIC")]
+        elif hasattr(audio, "pictures"):
+            # FLAC
+            pictures = [(picture.type, picture.data) for picture in audio.pictures]
+        elif audio.tags is not None:
+            # Ogg : blocs PICTURE FLAC encodés en base64
+            for value in audio.tags.get("metadata_block_picture", []):
+                picture = Picture(base64.b64decode(value))
+                pictures.append((picture.type, picture.data))
+
+        if not pictures:
+            return None
+        # Type 3 : couverture avant
+        front = [data for picture_type, data in pictures if picture_type == 3]
+        return (front or [pictures[0][1]])[0]
+
+
+    def _sibling_picture(self, directory: str) -> Optional[bytes]:
+        try:
+            names = {name.lower(): name for name in os.listdir(directory)}
+        except OSError:
+            return None
+
+        for base in self.SIBLING_NAMES:
+            for ext in self.SIBLING_EXTENSIONS:
+                name = names.get(base + ext)
+                if name is None:
+                    continue
+                try:
+                    with open(os.path.join(directory, name), "rb") as f:
+                        return f.read()
+                except OSError:
+                    continue
+        return None
+
+
+class CoverArtExtractor:
+    """
+    Extraction des pochettes en tâche de fond, une fois par album.
+
+    Rôle :
+        - Recevoir au fil de l'import les fichiers des albums sans pochette en cache
+        - Extraire et réduire les images sur un petit pool de threads, hors du
+          thread qui écrit en base
+        - Restituer les chemins obtenus ({album_id: jacket_path}), que le thread
+          d'import enregistre lui-même
+    """
+
+    def __init__(self, cache: Optional[CoverArtCache] = None, workers: int = 2):
+        self.cache = cache or CoverArtCache()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cover-art")
+        self._pending: Dict[int, Future] = {}
+        # Albums déjà soumis par cet import (avec ou sans pochette trouvée)
+        self.requested: Set[int] = set()
+
+
+    def submit(self, album_id: int, file_paths: Sequence[str]) -> None:
+        """Planifie l'extraction de la pochette d'un album (ignoré si déjà demandé)."""
+        if album_id in self.requested:
+            return
+        self.requested.add(album_id)
+        self._pending[album_id] = self._executor.submit(self.cache.extract, list(file_paths))
+
+
+    def results(self, wait: bool = False) -> Dict[int, str]:
+        """
+        Pochettes prêtes depuis le dernier appel.
+
+        Args:
+            wait: attendre la fin de toutes les extractions en cours
+
+        Returns:
+            Dict[int, str] : {album_id: jacket_path}
+        """
+        jackets: Dict[int, str] = {}
+        for album_id, future in list(self._pending.items()):
+            if not (wait or future.done()):
+                continue
+            del self._pending[album_id]
+            try:
+                path = future.result()
+            except Exception as e:
+                logger.warning(f"CoverArtExtractor : Pochette de l'album {album_id} non extraite ({e})")
+                continue
+            if path:
+                jackets[album_id] = path
+        return jackets
+
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """Arrête le pool ; cancel=True abandonne les extractions pas encore commencées."""
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+        self._pending.clear()
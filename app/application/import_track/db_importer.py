@@ -1,9 +1,21 @@
 # services/file_services/library_services/db_importer.py
 
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select, update, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from repositories.artist_repository import ArtistRepository
 from repositories.album_repository import AlbumRepository
 from repositories.track_repository import TrackRepository
+from repositories.duplicate_file_repository import DuplicateFileRepository
+
+from app.models.artist import Artist
+from app.models.album import Album
+from app.models.track import Track
+from app.application.import_track.import_result import BatchImportResult
+from app.application.import_track.identity_cache import ImportIdentityCache
+from app.application.import_track.cancellation import CancellationToken
 
 from core.logger import logger
 
@@ -16,15 +28,36 @@ class DBImporter:
         - Vérifie si l'artiste/album existe déjà.
         - Crée de nouvelles entrées si nécessaire.
         - Assure la persistance des tracks avec commit sécurisé.
+        - Import en masse par lots (une transaction par tranche).
+        - Mise à jour / suppression groupées pour le réimport incrémental.
+        - Enregistrement des copies de tracks existants (doublons liés).
+        - Enregistrement des pochettes extraites (Album.jacket_path).
     """
-    def __init__(self, db_session: Session):
+
+    REQUIRED_KEYS = ("file_path", "title", "artist", "album", "format", "duration", "track_number")
+
+    def __init__(
+        self,
+        db_session: Session,
+        identity_cache: Optional[ImportIdentityCache] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ):
         """
         Initialise l'importeur DB.
 
         Args:
             db_session: Session SQLAlchemy
+            identity_cache: cache Artist/Album de l'import, consulté avant toute requête SQL
+            cancel_token: annulation de l'import ; la tranche en cours est validée,
+                          les suivantes ne sont pas écrites
         """
         self.db = db_session
+        self.identity_cache = identity_cache or ImportIdentityCache()
+        self.cancel_token = cancel_token
+        self.artist_repo = ArtistRepository(self.db)
+        self.album_repo = AlbumRepository(self.db)
+        self.track_repo = TrackRepository(self.db)
+        self.duplicate_repo = DuplicateFileRepository(self.db)
 
     def import_track(self, metadata: dict):
         """
@@ -36,40 +69,367 @@ class DBImporter:
         Raises:
             Exception: si l'insertion échoue
         """
+        cache = self.identity_cache
         try:
-            # Gestion de l'artiste
-            artist_repo = ArtistRepository(self.db)
-            artist = artist_repo.create(name=metadata["artist"])
-            logger.debug(f"DBImporter : Artiste traité: {artist.name} (ID {artist.id})")
+            # Gestion de l'artiste (cache d'abord, SQL seulement si inconnu)
+            artist_id = cache.get_artist(metadata["artist"])
+            if artist_id is None:
+                artist = self.artist_repo.create(name=metadata["artist"])
+                artist_id = artist.id
+                cache.add_artist(metadata["artist"], artist_id)
+            logger.debug(f"DBImporter : Artiste traité: {metadata['artist']} (ID {artist_id})")
 
             # Gestion de l'album
-            album_repo = AlbumRepository(self.db)
-            album = album_repo.create(
-                title=metadata["album"],
-                artist_id=artist.id,
-                release_year=metadata.get("year")
-            )
-            logger.debug(f"DBImporter : Album traité: {album.title} (ID {album.id})")
+            album_id = cache.get_album(metadata["album"], artist_id)
+            if album_id is None:
+                album = self.album_repo.create(
+                    title=metadata["album"],
+                    artist_id=artist_id,
+                    release_year=metadata.get("year")
+                )
+                album_id = album.id
+                cache.add_album(metadata["album"], artist_id, album_id)
+            logger.debug(f"DBImporter : Album traité: {metadata['album']} (ID {album_id})")
 
             # Création du track
-            track_repo = TrackRepository(self.db)
-            track = track_repo.create(
+            track = self.track_repo.create(
                 title=metadata["title"],
                 file_path=metadata["file_path"],
-                artist_id=artist.id,
-                album_id=album.id,
+                artist_id=artist_id,
+                album_id=album_id,
                 format=metadata["format"],
                 duration_seconds=metadata["duration"],
-                track_number=metadata["track_number"]
+                track_number=metadata["track_number"],
+                file_size=metadata.get("file_size"),
+                file_mtime_ns=metadata.get("file_mtime_ns")
             )
+            if track is None:
+                raise ValueError(f"Track déjà présent en base : {metadata['file_path']}")
             logger.info(f"DBImporter : Track importé: {track.title}")
 
             # Commit après chaque track pour éviter la perte en cas d'erreur
             self.db.commit()
+            cache.commit()
 
         except Exception as e:
             logger.exception(f"Erreur lors de l'import du track {metadata.get('title')}")
             self.db.rollback()
+            cache.rollback()
+            raise
+
+
+    # ========================== #
+    #       Import en masse      #
+    # ========================== #
+    def import_batch(self, metadata_batch: Iterable[dict], chunk_size: int = 500) -> BatchImportResult:
+        """
+        Insère un lot de métadonnées en quelques requêtes par tranche.
+
+        Les artistes et albums sont résolus en mémoire (une lecture groupée,
+        puis insertion des manquants), les tracks sont insérés en executemany
+        avec ON CONFLICT DO NOTHING. Chaque tranche est une transaction.
+
+        Args:
+            metadata_batch: métadonnées produites par FileImporter.extract_metadata
+            chunk_size: nombre de tracks par transaction
+
+        Returns:
+            BatchImportResult : nombre de tracks insérés et erreurs par fichier
+        """
+        result = self._run_in_chunks(list(metadata_batch), chunk_size, self._import_chunk)
+        logger.info(f"DBImporter : {result.imported} tracks importés, {len(result.errors)} rejetés")
+        return result
+
+
+    def update_batch(self, metadata_batch: Iterable[dict], chunk_size: int = 500) -> BatchImportResult:
+        """
+        Met à jour en place des tracks existants à partir de métadonnées réextraites.
+
+        Chaque dictionnaire doit porter la clé "track_id" du track à mettre à jour ;
+        l'id est conservé, ce qui préserve les liens de playlist et les favoris.
+
+        Args:
+            metadata_batch: métadonnées enrichies de "track_id"
+            chunk_size: nombre de tracks par transaction
+
+        Returns:
+            BatchImportResult : nombre de tracks mis à jour et erreurs par fichier
+        """
+        result = self._run_in_chunks(list(metadata_batch), chunk_size, self._update_chunk)
+        logger.info(f"DBImporter : {result.imported} tracks mis à jour, {len(result.errors)} rejetés")
+        return result
+
+
+    def delete_tracks(self, track_ids: Iterable[int]) -> int:
+        """
+        Supprime des tracks dont le fichier a disparu.
+
+        Returns:
+            int : nombre de tracks supprimés
+        """
+        try:
+            deleted = self.track_repo.delete_many(track_ids)
+            self.db.commit()
+        except Exception:
+            logger.exception("DBImporter : Échec de la suppression des tracks disparus")
+            self.db.rollback()
+            raise
+
+        logger.info(f"DBImporter : {deleted} tracks supprimés (fichiers disparus)")
+        return deleted
+
+
+    def album_files(self, metadata_batch: Iterable[dict]) -> Dict[int, List[str]]:
+        """
+        Albums d'un lot déjà écrit, résolus via le cache d'identités (sans SQL).
+
+        Returns:
+            Dict[int, List[str]] : {album_id: fichiers du lot dans cet album}
+        """
+        cache = self.identity_cache
+        albums: Dict[int, List[str]] = {}
+        for m in metadata_batch:
+            artist_id = cache.get_artist(m["artist"])
+            album_id = cache.get_album(m["album"], artist_id) if artist_id is not None else None
+            if album_id is not None:
+                albums.setdefault(album_id, []).append(m["file_path"])
+        return albums
+
+
+    def set_album_jackets(self, jackets: Dict[int, str]) -> None:
+        """Enregistre les pochettes extraites : {album_id: jacket_path}."""
+        try:
+            self.album_repo.set_jackets(jackets)
+            self.db.commit()
+        except Exception:
+            logger.exception("DBImporter : Échec de l'enregistrement des pochettes")
+            self.db.rollback()
+            raise
+
+        logger.info(f"DBImporter : {len(jackets)} pochettes enregistrées")
+
+
+    def link_duplicates(self, rows: List[dict]) -> None:
+        """
+        Enregistre des fichiers comme copies de tracks existants, sans les importer.
+
+        Args:
+            rows: [{"file_path", "track_id", "content_hash", "file_size", "file_mtime_ns"}]
+        """
+        try:
+            self.duplicate_repo.upsert_many(rows)
+            self.db.commit()
+        except Exception:
+            logger.exception("DBImporter : Échec de l'enregistrement des doublons")
+            self.db.rollback()
             raise
-        
-        
\ No newline at end of file
+
+        logger.info(f"DBImporter : {len(rows)} doublons liés à un track existant")
+
+
+    def forget_duplicates(self, file_paths: Iterable[str]) -> int:
+        """
+        Oublie des copies enregistrées (fichier disparu, modifié ou redevenu unique).
+
+        Returns:
+            int : nombre de copies oubliées
+        """
+        try:
+            deleted = self.duplicate_repo.delete_by_paths(file_paths)
+            self.db.commit()
+        except Exception:
+            logger.exception("DBImporter : Échec de la suppression des doublons")
+            self.db.rollback()
+            raise
+
+        return deleted
+
+
+    def _run_in_chunks(self, batch: List[dict], chunk_size: int, handler) -> BatchImportResult:
+        """
+        Applique handler tranche par tranche, une transaction par tranche.
+
+        Une tranche est validée ou annulée en entier ; après une annulation,
+        les tranches restantes ne sont pas écrites (result.interrupted).
+        """
+        result = BatchImportResult()
+
+        for start in range(0, len(batch), chunk_size):
+            if self.cancel_token is not None and self.cancel_token.cancelled:
+                result.interrupted = len(batch) - start
+                logger.info(f"DBImporter : Annulation, {result.interrupted} tracks non écrits")
+                break
+            chunk = batch[start:start + chunk_size]
+            try:
+                inserted, row_errors = handler(chunk)
+                self.db.commit()
+                self.identity_cache.commit()
+            except Exception as e:
+                logger.exception(f"DBImporter : Échec de la tranche de {len(chunk)} tracks")
+                self.db.rollback()
+                self.identity_cache.rollback()
+                result.errors.extend((m.get("file_path"), str(e)) for m in chunk)
+                continue
+
+            result.imported += inserted
+            result.errors.extend(row_errors)
+
+        return result
+
+
+    def _validate_chunk(self, chunk: List[dict]) -> Tuple[List[dict], List[Tuple[str, str]]]:
+        """Sépare les métadonnées exploitables des lignes invalides."""
+        errors: List[Tuple[str, str]] = []
+        rows: List[dict] = []
+        seen_paths: Set[str] = set()
+
+        # Validation ligne par ligne
+        for metadata in chunk:
+            missing = [key for key in self.REQUIRED_KEYS if key not in metadata]
+            if missing:
+                errors.append((metadata.get("file_path"), f"Métadonnées incomplètes : {', '.join(missing)}"))
+            elif metadata["file_path"] in seen_paths:
+                errors.append((metadata["file_path"], "Fichier présent plusieurs fois dans le lot"))
+            else:
+                seen_paths.add(metadata["file_path"])
+                rows.append(metadata)
+
+        return rows, errors
+
+
+    def _track_rows(self, rows: List[dict]) -> List[dict]:
+        """Résout artistes/albums d'une tranche et construit les lignes de la table tracks."""
+        artist_ids = self._resolve_artists({m["artist"] for m in rows})
+        album_ids = self._resolve_albums({
+            (m["album"], artist_ids[m["artist"]]): m.get("year") for m in rows
+        })
+
+        return [
+            {
+                "title": m["title"],
+                "file_path": m["file_path"],
+                "artist_id": artist_ids[m["artist"]],
+                "album_id": album_ids[(m["album"], artist_ids[m["artist"]])],
+                "format": m["format"],
+                "duration_seconds": m["duration"],
+                "track_number": m["track_number"],
+                "file_size": m.get("file_size"),
+                "file_mtime_ns": m.get("file_mtime_ns"),
+                "quick_key": m.get("quick_key"),
+                "content_hash": m.get("content_hash"),
+            }
+            for m in rows
+        ]
+
+
+    def _import_chunk(self, chunk: List[dict]) -> Tuple[int, List[Tuple[str, str]]]:
+        """Insère une tranche sans commit. Retourne (nb insérés, erreurs par ligne)."""
+        rows, errors = self._validate_chunk(chunk)
+        if not rows:
+            return 0, errors
+
+        track_rows = self._track_rows(rows)
+        stmt = (
+            sqlite_insert(Track.__table__)
+            .on_conflict_do_nothing()
+            .returning(Track.__table__.c.file_path)
+        )
+        inserted_paths = set(self.db.execute(stmt, track_rows).scalars())
+
+        for m in rows:
+            if m["file_path"] not in inserted_paths:
+                errors.append((
+                    m["file_path"],
+                    "Track ignoré : fichier déjà importé ou numéro de piste déjà présent dans l'album"
+                ))
+
+        return len(inserted_paths), errors
+
+
+    def _update_chunk(self, chunk: List[dict]) -> Tuple[int, List[Tuple[str, str]]]:
+        """Met à jour une tranche par clé primaire (executemany), sans commit."""
+        rows, errors = self._validate_chunk(chunk)
+        rows_with_id = []
+        for m in rows:
+            if m.get("track_id") is None:
+                errors.append((m["file_path"], "Mise à jour impossible : track_id manquant"))
+            else:
+                rows_with_id.append(m)
+
+        if not rows_with_id:
+            return 0, errors
+
+        track_rows = self._track_rows(rows_with_id)
+        for m, row in zip(rows_with_id, track_rows):
+            row["id"] = m["track_id"]
+
+        self.db.execute(update(Track), track_rows)
+        return len(track_rows), errors
+
+
+    def _resolve_artists(self, names: Set[str]) -> Dict[str, int]:
+        """Retourne {nom: id}, via le cache puis en base, en créant les artistes manquants."""
+        cache = self.identity_cache
+        ids: Dict[str, int] = {}
+        for name in names:
+            artist_id = cache.get_artist(name)
+            if artist_id is not None:
+                ids[name] = artist_id
+
+        unknown = names - ids.keys()
+        if not unknown:
+            return ids
+
+        ids.update(self.db.execute(select(Artist.name, Artist.id).where(Artist.name.in_(unknown))).all())
+
+        missing = unknown - ids.keys()
+        if missing:
+            self.db.execute(
+                sqlite_insert(Artist.__table__).on_conflict_do_nothing(),
+                [{"name": name} for name in missing]
+            )
+            ids.update(self.db.execute(select(Artist.name, Artist.id).where(Artist.name.in_(missing))).all())
+
+        for name in unknown:
+            cache.add_artist(name, ids[name])
+
+        return ids
+
+
+    def _resolve_albums(self, albums: Dict[Tuple[str, int], object]) -> Dict[Tuple[str, int], int]:
+        """Retourne {(titre, artist_id): id} à partir de {(titre, artist_id): année}, via le cache puis en base."""
+        def fetch(keys) -> Dict[Tuple[str, int], int]:
+            rows = self.db.execute(
+                select(Album.title, Album.artist_id, Album.id)
+                .where(tuple_(Album.title, Album.artist_id).in_(list(keys)))
+            ).all()
+            return {(title, artist_id): album_id for title, artist_id, album_id in rows}
+
+        cache = self.identity_cache
+        ids: Dict[Tuple[str, int], int] = {}
+        for title, artist_id in albums:
+            album_id = cache.get_album(title, artist_id)
+            if album_id is not None:
+                ids[(title, artist_id)] = album_id
+
+        unknown = albums.keys() - ids.keys()
+        if not unknown:
+            return ids
+
+        ids.update(fetch(unknown))
+
+        missing = unknown - ids.keys()
+        if missing:
+            self.db.execute(
+                sqlite_insert(Album.__table__).on_conflict_do_nothing(),
+                [
+                    {"title": title, "artist_id": artist_id, "release_year": albums[(title, artist_id)]}
+                    for title, artist_id in missing
+                ]
+            )
+            ids.update(fetch(missing))
+
+        for title, artist_id in unknown:
+            cache.add_album(title, artist_id, ids[(title, artist_id)])
+
+        return ids
@@ -0,0 +1,191 @@
+# app/application/import_track/duplicate_detector.py
+
+
+from enum import Enum
+from itertools import chain
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.application.import_track.fingerprint import FileFingerprinter
+from repositories.track_repository import TrackRepository
+
+from core.logger import logger
+
+
+class DuplicatePolicy(str, Enum):
+    SKIP = "skip"        # la copie n'est pas importée (enregistrée dans duplicate_files pour ne pas être relue)
+    LINK = "link"        # la copie n'est pas importée mais liée au track (importée si l'original est rejeté)
+    REPORT = "report"    # la copie est importée comme un fichier ordinaire
+
+
+@dataclass(frozen=True)
+class Duplicate:
+    """Fichier dont la charge audio est identique à celle d'un fichier déjà retenu."""
+    file_path: str
+    original_path: str
+    # None : original retenu par le même import, pas encore en base
+    original_id: Optional[int] = None
+
+
+class _Candidate:
+    """Fichier de référence (track en base ou fichier retenu par l'import) pour une clé rapide."""
+    __slots__ = ("track_id", "file_path", "file_size", "quick_key", "content_hash", "dirty")
+
+    def __init__(self, track_id, file_path, file_size=None, quick_key=None, content_hash=None):
+        self.track_id = track_id
+        self.file_path = file_path
+        self.file_size = file_size
+        self.quick_key = quick_key
+        self.content_hash = content_hash
+        # Empreinte calculée ici, à enregistrer sur le track
+        self.dirty = False
+
+
+class DuplicateDetector:
+    """
+    Détection des fichiers déjà présents dans la bibliothèque sous un autre chemin.
+
+    Rôle :
+        - Comparer la clé rapide (taille + échantillons, calculée à l'extraction)
+          aux tracks en base et aux fichiers déjà retenus par l'import en cours
+        - Ne calculer le hash complet de la charge audio qu'en cas de collision,
+          des deux côtés, et le mémoriser sur le track pour les imports suivants
+        - Compléter paresseusement les empreintes des tracks importés avant leur
+          existence (candidats de même taille seulement)
+
+    Une requête par lot ; aucun fichier n'est lu en entier sans collision.
+    """
+
+    def __init__(self, db_session: Session, fingerprinter: Optional[FileFingerprinter] = None):
+        """
+        Args:
+            db_session: Session SQLAlchemy (celle de l'import)
+            fingerprinter: calcul des empreintes
+        """
+        self.db = db_session
+        self.track_repo = TrackRepository(self.db)
+        self.fingerprinter = fingerprinter or FileFingerprinter()
+        # Fichiers retenus par cet import : {clé rapide: [candidats]}
+        self._seen: Dict[str, List[_Candidate]] = {}
+
+
+    def split(self, metadata_batch: Iterable[dict]) -> Tuple[List[dict], List[Tuple[dict, Duplicate]]]:
+        """
+        Sépare les nouveaux fichiers d'un lot en fichiers uniques et doublons.
+
+        Les métadonnées dont le hash complet a été calculé reçoivent la clé "content_hash".
+
+        Args:
+            metadata_batch: métadonnées de fichiers absents de la base (clé "quick_key")
+
+        Returns:
+            Tuple : (métadonnées uniques, [(métadonnées, Duplicate)])
+        """
+        batch = list(metadata_batch)
+        keyed = [m for m in batch if m.get("quick_key")]
+        if not keyed:
+            return batch, []
+
+        candidates = self._load_candidates(keyed)
+        unique: List[dict] = []
+        duplicates: List[Tuple[dict, Duplicate]] = []
+
+        for metadata in batch:
+            key = metadata.get("quick_key")
+            if not key:
+                unique.append(metadata)
+                continue
+
+            in_db = candidates.get(key, [])
+            db_paths = {c.file_path for c in in_db}
+            # Un fichier retenu plus tôt par cet import peut déjà être en base : comparé une seule fois
+            pending = [c for c in self._seen.get(key, ()) if c.file_path not in db_paths]
+            original = self._find_original(metadata, chain(in_db, pending))
+            if original is not None:
+                duplicates.append((metadata, Duplicate(metadata["file_path"], original.file_path, original.track_id)))
+                continue
+
+            unique.append(metadata)
+            self._seen.setdefault(key, []).append(
+                _Candidate(None, metadata["file_path"], metadata.get("file_size"), key, metadata.get("content_hash"))
+            )
+
+        self._save_fingerprints(chain.from_iterable(candidates.values()))
+
+        if duplicates:
+            logger.info(f"DuplicateDetector : {len(duplicates)} doublons sur {len(batch)} fichiers")
+        return unique, duplicates
+
+
+    # ========================== #
+    #        Comparaison         #
+    # ========================== #
+    def _load_candidates(self, rows: List[dict]) -> Dict[str, List[_Candidate]]:
+        """Tracks en base de même clé rapide (ou de même taille, sans clé) : {clé: [candidats]}."""
+        keys = {m["quick_key"] for m in rows}
+        sizes = {m["file_size"] for m in rows if m.get("file_size") is not None}
+        by_key: Dict[str, List[_Candidate]] = {}
+
+        for track_id, file_path, size, quick_key, content_hash in self.track_repo.get_fingerprint_candidates(keys, sizes):
+            candidate = _Candidate(track_id, file_path, size, quick_key, content_hash)
+            if quick_key is None:
+                # Track antérieur aux empreintes : clé calculée une fois pour toutes
+                try:
+                    candidate.quick_key = self.fingerprinter.quick_key(file_path)
+                except OSError:
+                    continue
+                candidate.dirty = True
+            if candidate.content_hash is None:
+                # Hash déjà calculé pendant cet import (fichier retenu dans un lot précédent)
+                for seen in self._seen.get(candidate.quick_key, ()):
+                    if seen.file_path == file_path and seen.content_hash is not None:
+                        candidate.content_hash = seen.content_hash
+                        candidate.dirty = True
+            by_key.setdefault(candidate.quick_key, []).append(candidate)
+
+        # Les clés calculées sans collision sont tout de même enregistrées (_save_fingerprints)
+        return by_key
+
+
+    def _find_original(self, metadata: dict, candidates: Iterable[_Candidate]) -> Optional[_Candidate]:
+        """Premier candidat dont la charge audio est identique, en ne hachant qu'à la demande."""
+        for candidate in candidates:
+            if candidate.file_path == metadata["file_path"]:
+                continue
+            if candidate.content_hash is None:
+                try:
+                    candidate.content_hash = self.fingerprinter.content_hash(candidate.file_path)
+                except OSError:
+                    continue
+                candidate.dirty = True
+
+            if metadata.get("content_hash") is None:
+                try:
+                    metadata["content_hash"] = self.fingerprinter.content_hash(metadata["file_path"])
+                except OSError as e:
+                    logger.warning(f"DuplicateDetector : Hash impossible pour {metadata['file_path']} ({e})")
+                    return None
+
+            if metadata["content_hash"] == candidate.content_hash:
+                return candidate
+        return None
+
+
+    def _save_fingerprints(self, candidates: Iterable[_Candidate]) -> None:
+        """Enregistre sur les tracks les empreintes calculées pendant la comparaison."""
+        rows = [
+            {"id": c.track_id, "quick_key": c.quick_key, "content_hash": c.content_hash}
+            for c in candidates if c.dirty and c.track_id is not None
+        ]
+        if not rows:
+            return
+
+        try:
+            self.track_repo.set_fingerprints(rows)
+            self.db.commit()
+        except Exception:
+            # Simple cache : l'import continue, les empreintes seront recalculées
+            logger.exception("DuplicateDetector : Échec de l'enregistrement des empreintes")
+            self.db.rollback()
@@ -2,7 +2,12 @@
 
 import os
 from mutagen import File as MutagenFile
-from typing import List, Dict, Optional, Callable
+from mutagen.id3 import ID3
+from typing import List, Dict, Optional, Callable, Iterator
+
+from app.application.import_track.tag_reader import FastTagReader, TagInfo, WANTED_KEYS
+from app.application.import_track.fingerprint import FileFingerprinter
+from app.application.import_track.cancellation import CancellationToken
 
 from core.logger import logger
 
@@ -13,78 +18,139 @@ class FileImporter:
 
     Rôle :
         - Identifier les fichiers audio valides
-        - Extraire les métadonnées via Mutagen
+        - Extraire les métadonnées (lecture rapide des en-têtes, Mutagen en repli)
+        - Calculer la clé rapide de contenu (détection des doublons)
         - Fournir un callback pour suivre la progression
     """
     
     SUPPORTED_EXTENSIONS = (".mp3", ".wav", ".flac", ".aac", ".ogg")
     
-    def __init__(self, progress_callback: Optional[Callable[[int], None]] = None):
+    # Frames ID3 des tags non "easy" (WAV) -> clés easy
+    _ID3_EASY_KEYS = {"TIT2": "title", "TPE1": "artist", "TALB": "album", "TDRC": "date", "TRCK": "tracknumber"}
+
+    def __init__(
+        self,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        fast_tags: bool = True,
+        fingerprints: bool = True
+    ):
         """
         Initialise le scanner de fichiers audio.
 
         Args:
             progress_callback: Fonction appelée avec un int (0-100) pour indiquer la progression
+            fast_tags: lire les tags via FastTagReader (Mutagen seulement en repli)
+            fingerprints: calculer la clé rapide de contenu de chaque fichier
         """
         self.progress_callback = progress_callback  
+        self.tag_reader = FastTagReader() if fast_tags else None
+        self.fingerprinter = FileFingerprinter() if fingerprints else None
+        # Dossiers illisibles lors du dernier scan (leurs fichiers sont inconnus, pas disparus)
+        self.unreadable_dirs: List[str] = []
     
     
-    def scan_directory(self, root_path: str) -> List[str]:
+    def scan_directory(self, root_path: str, cancel_token: Optional[CancellationToken] = None) -> Iterator[str]:
         """
-        Scanne récursivement un dossier et retourne tous les fichiers audio valides.
+        Scanne récursivement un dossier et produit les fichiers audio au fil de l'eau.
+
+        Parcours unique via os.scandir : aucun pré-comptage de l'arborescence,
+        les chemins sont disponibles dès qu'un dossier a été lu. La progression
+        est estimée sur les dossiers traités / dossiers découverts.
+
+        L'annulation est vérifiée à chaque entrée de dossier : un scan annulé
+        s'arrête sans attendre la fin d'un dossier volumineux (partage réseau…).
 
         Args:
             root_path: Chemin du dossier à scanner
+            cancel_token: annulation de l'import en cours
 
-        Returns:
-            Liste des chemins complets des fichiers audio trouvés
+        Yields:
+            Chemins complets des fichiers audio trouvés
         """
-        audio_files: List[str] = []
-        total_files = sum(len(files) for _, _, files in os.walk(root_path))
-        scanned = 0
-
-        for root, _, files in os.walk(root_path):
-            for file in files:
-                scanned += 1
-                if file.lower().endswith(self.SUPPORTED_EXTENSIONS):
-                    audio_files.append(os.path.join(root, file))
-                # Callback de progression globale
-                if self.progress_callback and total_files > 0:
-                    percent = int((scanned / total_files) * 100)
+        self.unreadable_dirs = []
+        pending: List[str] = [root_path]
+        discovered = 1
+        processed = 0
+        found = 0
+        last_percent = -1
+
+        cancelled = (lambda: cancel_token.cancelled) if cancel_token else (lambda: False)
+
+        while pending and not cancelled():
+            current = pending.pop()
+            audio_files: List[str] = []
+
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if cancelled():
+                            break
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                                discovered += 1
+                            elif entry.is_file() and entry.name.lower().endswith(self.SUPPORTED_EXTENSIONS):
+                                audio_files.append(entry.path)
+                        except OSError:
+                            logger.warning(f"FileImporter : Entrée illisible ignorée {entry.path}")
+            except OSError as e:
+                logger.warning(f"FileImporter : Dossier inaccessible {current} ({e})")
+                self.unreadable_dirs.append(current)
+
+            if cancelled():
+                # Dossier partiellement lu : ses fichiers ne sont pas produits
+                break
+
+            # Le dossier est fermé avant de rendre la main au consommateur
+            found += len(audio_files)
+            yield from audio_files
+
+            processed += 1
+            # Callback de progression (monotone, uniquement sur changement)
+            if self.progress_callback:
+                percent = max(last_percent, int((processed / discovered) * 100))
+                if percent != last_percent:
+                    last_percent = percent
                     self.progress_callback(percent)
 
-        logger.info(f"FileImporter : {len(audio_files)} fichiers audio trouvés dans {root_path}")
-        return audio_files
+        if cancelled():
+            logger.info(f"FileImporter : Scan de {root_path} annulé ({found} fichiers audio trouvés)")
+            return
+        logger.info(f"FileImporter : {found} fichiers audio trouvés dans {root_path}")
     
     
     def extract_metadata(self, file_path: str) -> Dict[str, object]:
         """
-        Extrait les métadonnées d'un fichier audio via Mutagen.
+        Extrait les métadonnées d'un fichier audio.
+
+        Les formats courants sont lus par FastTagReader, qui ne lit que les
+        en-têtes utiles ; Mutagen prend le relais pour tout le reste.
 
         Args:
             file_path: Chemin complet du fichier audio
 
         Returns:
             Dictionnaire contenant les informations : file_path, title, artist, album,
-            year, track_number, duration, format
+            year, track_number, duration, format, file_size, file_mtime_ns, quick_key
         """
-        audio = MutagenFile(file_path, easy=True)
-        if audio is None:
-            raise ValueError(f"Fichier audio invalide: {file_path}")
+        tags = self.tag_reader.read(file_path) if self.tag_reader else None
+        if tags is None:
+            tags = self._read_with_mutagen(file_path)
         
         # Extraction des tags avec valeurs par défaut
-        title = audio.get("title", [os.path.splitext(os.path.basename(file_path))[0]])[0]
-        artist = audio.get("artist", ["Artiste inconnu"])[0]
-        album = audio.get("album", ["Album inconnu"])[0]
-        year = audio.get("date", ["Année inconnue"])[0]
-        track_number_raw = audio.get("tracknumber", [0])[0]
+        title = tags.get("title", os.path.splitext(os.path.basename(file_path))[0])
+        artist = tags.get("artist", "Artiste inconnu")
+        album = tags.get("album", "Album inconnu")
+        year = tags.get("date", "Année inconnue")
+        track_number_raw = tags.get("tracknumber", 0)
         try:
             track_number = int(str(track_number_raw).split("/")[0])
         except ValueError:
             track_number = 0
 
-        duration = int(audio.info.length) if audio.info else 0
+        duration = int(tags.get("length") or 0)
         format_ = os.path.splitext(file_path)[1].replace(".", "").lower()
+        stat = os.stat(file_path)
 
         metadata = {
             "file_path": file_path,
@@ -95,10 +161,34 @@ class FileImporter:
             "track_number": track_number,
             "duration": duration,
             "format": format_,
+            "file_size": stat.st_size,
+            "file_mtime_ns": stat.st_mtime_ns,
+            "quick_key": self.fingerprinter.quick_key(file_path, stat.st_size) if self.fingerprinter else None,
         }
         
         logger.debug(f"FileImporter : Métadonnées extraites pour {file_path}: {metadata}")
         
         return metadata
-    
-    
\ No newline at end of file
+
+
+    def _read_with_mutagen(self, file_path: str) -> TagInfo:
+        """Lecture complète via Mutagen, au même format que FastTagReader."""
+        audio = MutagenFile(file_path, easy=True)
+        if audio is None:
+            raise ValueError(f"Fichier audio invalide: {file_path}")
+
+        tags: TagInfo = {}
+        if isinstance(audio.tags, ID3):
+            # Pas de variante easy (WAV…) : frames ID3 lues directement
+            for frame_id, key in self._ID3_EASY_KEYS.items():
+                frame = audio.tags.get(frame_id)
+                if frame is not None and frame.text:
+                    tags[key] = str(frame.text[0])
+        else:
+            for key in WANTED_KEYS:
+                values = audio.get(key)
+                if values:
+                    tags[key] = values[0]
+
+        tags["length"] = audio.info.length if audio.info else 0
+        return tags
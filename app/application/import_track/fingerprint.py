@@ -0,0 +1,156 @@
+# app/application/import_track/fingerprint.py
+
+
+import os
+import struct
+import hashlib
+from typing import BinaryIO, Optional, Tuple
+
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+class FileFingerprinter:
+    """
+    Empreintes de contenu des fichiers audio, pour la détection des doublons.
+
+    Rôle :
+        - Clé rapide : taille de la charge audio + hash de trois échantillons
+          pris dans celle-ci (début, milieu, fin), quelques dizaines de Ko lus
+          quelle que soit la taille
+        - Hash complet de la charge audio, calculé seulement quand deux clés
+          rapides coïncident
+
+    La charge audio exclut les tags ID3v2/ID3v1, les blocs de métadonnées FLAC
+    et les chunks RIFF hors "data" : deux copies d'un même morceau aux tags
+    différents ont la même clé rapide et le même hash.
+
+    Deux fichiers de même clé rapide sont des candidats ; seul un hash complet
+    identique en fait des doublons.
+    """
+
+    SAMPLE_SIZE = 8 * 1024
+    READ_SIZE = 1024 * 1024
+    DIGEST_SIZE = 16
+
+    def quick_key(self, file_path: str, size: Optional[int] = None) -> str:
+        """
+        Clé rapide "taille de la charge audio:hash" d'un fichier.
+
+        Args:
+            file_path: chemin du fichier
+            size: taille déjà connue (évite un stat)
+
+        Returns:
+            str : clé comparable entre fichiers
+        """
+        if size is None:
+            size = os.path.getsize(file_path)
+
+        ext = os.path.splitext(file_path)[1].lower()
+        digest = hashlib.blake2b(digest_size=self.DIGEST_SIZE)
+        with open(file_path, "rb") as f:
+            start, end = self._payload_range(f, size, ext)
+            length = end - start
+            if length <= 3 * self.SAMPLE_SIZE:
+                f.seek(start)
+                digest.update(f.read(length))
+            else:
+                for offset in (0, (length - self.SAMPLE_SIZE) // 2, length - self.SAMPLE_SIZE):
+                    f.seek(start + offset)
+                    digest.update(f.read(self.SAMPLE_SIZE))
+
+        return f"{length}:{digest.hexdigest()}"
+
+
+    def content_hash(self, file_path: str) -> str:
+        """Hash complet de la charge audio (indépendant des tags)."""
+        digest = hashlib.blake2b(digest_size=self.DIGEST_SIZE)
+        ext = os.path.splitext(file_path)[1].lower()
+
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            start, end = self._payload_range(f, size, ext)
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                data = f.read(min(self.READ_SIZE, remaining))
+                if not data:
+                    break
+                digest.update(data)
+                remaining -= len(data)
+
+        return digest.hexdigest()
+
+
+    # ========================== #
+    #      Charge audio          #
+    # ========================== #
+    def _payload_range(self, f: BinaryIO, size: int, ext: str) -> Tuple[int, int]:
+        """Retourne (début, fin) des octets audio ; tout le fichier si la structure est inattendue."""
+        start = self._skip_id3v2(f, 0, size)
+        end = size
+
+        if ext == ".wav":
+            data_range = self._wav_data_range(f, size)
+            if data_range:
+                return data_range
+        elif ext == ".flac":
+            start = self._skip_flac_metadata(f, start, size)
+
+        if ext in (".mp3", ".aac") and end - start >= 128:
+            f.seek(end - 128)
+            if f.read(3) == b"TAG":
+                end -= 128
+
+        return start, max(start, end)
+
+
+    @staticmethod
+    def _skip_id3v2(f: BinaryIO, offset: int, size: int) -> int:
+        """Saute les tags ID3v2 successifs en début de fichier."""
+        while offset + 10 <= size:
+            f.seek(offset)
+            header = f.read(10)
+            if header[:3] != b"ID3" or any(b & 0x80 for b in header[6:10]):
+                break
+            # Drapeau "footer" : 10 octets de plus
+            offset += 10 + _syncsafe(header[6:10]) + (10 if header[5] & 0x10 else 0)
+        return min(offset, size)
+
+
+    @staticmethod
+    def _skip_flac_metadata(f: BinaryIO, offset: int, size: int) -> int:
+        """Position de la première trame FLAC, après les blocs de métadonnées."""
+        f.seek(offset)
+        if f.read(4) != b"fLaC":
+            return offset
+
+        position = offset + 4
+        while position + 4 <= size:
+            header = f.read(4)
+            position += 4 + int.from_bytes(header[1:4], "big")
+            if header[0] & 0x80:
+                break
+            f.seek(position)
+        return min(position, size)
+
+
+    @staticmethod
+    def _wav_data_range(f: BinaryIO, size: int) -> Optional[Tuple[int, int]]:
+        """Octets du chunk "data" d'un WAV, ou None hors RIFF/WAVE."""
+        f.seek(0)
+        header = f.read(12)
+        if header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+
+        position = 12
+        while position + 8 <= size:
+            f.seek(position)
+            chunk_id, chunk_size = struct.unpack("<4sI", f.read(8))
+            if chunk_id == b"data":
+                return position + 8, min(size, position + 8 + chunk_size)
+            # Chunks alignés sur 2 octets
+            position += 8 + chunk_size + (chunk_size & 1)
+        return None
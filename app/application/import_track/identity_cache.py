@@ -0,0 +1,96 @@
+# app/application/import_track/identity_cache.py
+
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.artist import Artist
+from app.models.album import Album
+
+from core.logger import logger
+
+
+class ImportIdentityCache:
+    """
+    Cache d'identité Artist/Album en mémoire, valable le temps d'un import.
+
+    Rôle :
+        - Précharger les tables artists/albums au démarrage de l'import
+        - Résoudre artiste et album sans requête SQL quand ils sont connus
+        - Identifier artistes et albums par leur nom exact, comme les
+          contraintes d'unicité de la base (artists.name, albums.title + artist_id)
+        - Oublier les entrées créées dans une transaction annulée
+    """
+
+    def __init__(self):
+        self._artists: Dict[str, int] = {}
+        self._albums: Dict[Tuple[str, int], int] = {}
+        # Entrées ajoutées depuis le dernier commit, à oublier en cas de rollback
+        self._pending_artists: List[str] = []
+        self._pending_albums: List[Tuple[str, int]] = []
+
+
+    def warm(self, session: Session) -> None:
+        """
+        Précharge tous les artistes et albums existants.
+
+        Args:
+            session: session SQLAlchemy active
+        """
+        for artist_id, name in session.execute(select(Artist.id, Artist.name)):
+            self._artists.setdefault(name, artist_id)
+
+        for album_id, title, artist_id in session.execute(select(Album.id, Album.title, Album.artist_id)):
+            self._albums.setdefault((title, artist_id), album_id)
+
+        logger.info(
+            f"ImportIdentityCache : {len(self._artists)} artistes et "
+            f"{len(self._albums)} albums préchargés"
+        )
+
+
+    # ========================== #
+    #         Artistes           #
+    # ========================== #
+    def get_artist(self, name: str) -> Optional[int]:
+        return self._artists.get(name)
+
+
+    def add_artist(self, name: str, artist_id: int) -> None:
+        if name not in self._artists:
+            self._artists[name] = artist_id
+            self._pending_artists.append(name)
+
+
+    # ========================== #
+    #          Albums            #
+    # ========================== #
+    def get_album(self, title: str, artist_id: int) -> Optional[int]:
+        return self._albums.get((title, artist_id))
+
+
+    def add_album(self, title: str, artist_id: int, album_id: int) -> None:
+        key = (title, artist_id)
+        if key not in self._albums:
+            self._albums[key] = album_id
+            self._pending_albums.append(key)
+
+
+    # ========================== #
+    #       Transactions         #
+    # ========================== #
+    def commit(self) -> None:
+        """Valide les entrées ajoutées depuis le dernier commit."""
+        self._pending_artists.clear()
+        self._pending_albums.clear()
+
+
+    def rollback(self) -> None:
+        """Oublie les entrées dont la création en base a été annulée."""
+        for key in self._pending_artists:
+            self._artists.pop(key, None)
+        for key in self._pending_albums:
+            self._albums.pop(key, None)
+        self.commit()
@@ -0,0 +1,139 @@
+# app/application/import_track/import_checkpoint.py
+
+
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from app.models.import_job import ImportJob, ImportJobStatus
+from app.application.import_track.import_result import ImportResult
+from repositories.import_job_repository import ImportJobRepository
+from mappers.import_job_mapper import job_to_result
+
+from core.logger import logger
+
+
+class ImportCheckpoint:
+    """
+    Persistance de l'avancement d'un import dans la table import_jobs.
+
+    Rôle :
+        - Marquer le job comme en cours et reprendre ses compteurs précédents
+        - Enregistrer périodiquement le point de reprise et les compteurs
+        - Clore le job (terminé, annulé, échoué) et reconstruire son ImportResult
+
+    Utilise ses propres sessions courtes : les écritures du job ne se mêlent
+    jamais aux transactions de l'import.
+
+    Une reprise rescanne le dossier en mode incrémental : les fichiers déjà
+    importés sont alors vus comme inchangés et les fichiers en erreur sont
+    retentés. Les ajouts/mises à jour/suppressions se cumulent d'une exécution
+    à l'autre ; progression, erreurs et doublons reflètent la dernière exécution.
+    """
+
+    SAVE_INTERVAL = 2.0  # secondes entre deux sauvegardes
+    CUMULATIVE = ("imported", "updated", "removed")
+
+    def __init__(self, session_factory, job_id: int):
+        """
+        Ouvre (ou rouvre) le job et mémorise ses compteurs des exécutions précédentes.
+
+        Args:
+            session_factory: factory SQLAlchemy
+            job_id: identifiant du job d'import
+        """
+        self.session_factory = session_factory
+        self.job_id = job_id
+        self._last_save = time.monotonic()
+
+        with self.session_factory() as session:
+            job = ImportJobRepository(session).get_by_id(job_id)
+            if job is None:
+                raise ValueError(f"Job d'import introuvable : {job_id}")
+
+            self.root_path = job.root_path
+            self._base: Dict[str, int] = {name: getattr(job, name) for name in self.CUMULATIVE}
+            # Fichiers écrits par les exécutions précédentes, revus comme inchangés
+            self._already_done = job.imported + job.updated
+
+            job.status = ImportJobStatus.RUNNING.value
+            job.finished_at = None
+            job.acknowledged = False
+            session.commit()
+
+        if self._already_done:
+            logger.info(f"ImportCheckpoint : Reprise du job {job_id} ({self._already_done} fichiers déjà importés)")
+
+
+    def save(
+        self,
+        counters: Dict[str, int],
+        errors: List[Tuple[str, str]],
+        last_path: Optional[str] = None,
+        force: bool = False,
+        duplicates: List[Tuple[str, str]] = ()
+    ) -> None:
+        """
+        Enregistre l'avancement (au plus une fois par SAVE_INTERVAL sauf force=True).
+
+        Args:
+            counters: compteurs de l'exécution courante
+                      (processed, imported, updated, removed, skipped, error_count)
+            errors: erreurs de l'exécution courante
+            last_path: dernier fichier traité
+            duplicates: doublons détectés par l'exécution courante
+        """
+        now = time.monotonic()
+        if not force and now - self._last_save < self.SAVE_INTERVAL:
+            return
+        self._last_save = now
+
+        with self.session_factory() as session:
+            job = ImportJobRepository(session).get_by_id(self.job_id)
+            self._apply(job, counters, errors, last_path, duplicates)
+            session.commit()
+
+
+    def finish(
+        self,
+        status: ImportJobStatus,
+        counters: Dict[str, int],
+        errors: List[Tuple[str, str]],
+        last_path: Optional[str] = None,
+        duplicates: List[Tuple[str, str]] = ()
+    ) -> ImportResult:
+        """
+        Clôt le job et retourne le résultat cumulé de toutes ses exécutions.
+        """
+        with self.session_factory() as session:
+            job = ImportJobRepository(session).get_by_id(self.job_id)
+            self._apply(job, counters, errors, last_path, duplicates)
+            job.status = status.value
+            job.finished_at = datetime.now(timezone.utc)
+            session.commit()
+            result = job_to_result(job)
+
+        logger.info(f"ImportCheckpoint : Job {self.job_id} clos ({status.value})")
+        return result
+
+
+    def _apply(
+        self,
+        job: ImportJob,
+        counters: Dict[str, int],
+        errors: List[Tuple[str, str]],
+        last_path: Optional[str],
+        duplicates: List[Tuple[str, str]] = ()
+    ) -> None:
+        for name in self.CUMULATIVE:
+            setattr(job, name, self._base[name] + counters.get(name, 0))
+        job.skipped = max(0, counters.get("skipped", 0) - self._already_done)
+        job.processed = counters.get("processed", 0)
+        job.error_count = counters.get("error_count", 0)
+        job.errors = [
+            [str(path), str(message)] for path, message in errors[:ImportJob.MAX_STORED_ERRORS]
+        ]
+        job.duplicate_count = len(duplicates)
+        job.duplicates = [list(duplicate) for duplicate in list(duplicates)[:ImportJob.MAX_STORED_ERRORS]]
+        if last_path:
+            job.last_path = last_path
@@ -0,0 +1,148 @@
+# app/application/import_track/import_progress.py
+
+
+import time
+from enum import Enum
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+class ImportPhase(Enum):
+    SCANNING = "Analyse des dossiers"
+    IMPORTING = "Import des fichiers"
+    CLEANUP = "Nettoyage"
+    FINISHED = "Terminé"
+
+
+@dataclass(frozen=True)
+class ImportProgress:
+    """Instantané de la progression d'un import, transmis au thread GUI."""
+    percent: int
+    phase: ImportPhase
+    processed: int = 0
+    discovered: int = 0
+    errors: int = 0
+    files_per_second: float = 0.0
+    eta_seconds: Optional[float] = None
+
+
+class ProgressReporter:
+    """
+    Limiteur de progression entre le thread d'import et le thread GUI.
+
+    Rôle :
+        - Agréger les mises à jour (scan, extraction, écriture) en un seul état
+        - N'émettre qu'en cas de changement, au plus MAX_RATE_HZ fois par seconde
+          (sauf changement de phase ou émission forcée)
+        - Calculer débit (fichiers/s) et temps restant estimé
+
+    Chaque émission devient un signal Qt en file d'attente sur la boucle GUI :
+    sans limite, un import de plusieurs milliers de fichiers la sature.
+    """
+
+    MAX_RATE_HZ = 20
+
+    def __init__(self, callback: Callable[[ImportProgress], None], max_rate_hz: float = MAX_RATE_HZ):
+        """
+        Args:
+            callback: appelé (dans le thread d'import) avec un ImportProgress
+            max_rate_hz: fréquence maximale d'émission
+        """
+        self.callback = callback
+        self._min_interval = 1.0 / max_rate_hz
+        self._started = time.monotonic()
+        self._last_emit = 0.0
+        self._last_sent: Optional[ImportProgress] = None
+
+        self._phase = ImportPhase.SCANNING
+        self._scan_percent = 0
+        self._percent = 0
+        self._processed = 0
+        self._discovered = 0
+        self._errors = 0
+
+
+    def update(
+        self,
+        phase: Optional[ImportPhase] = None,
+        scan_percent: Optional[int] = None,
+        processed: Optional[int] = None,
+        discovered: Optional[int] = None,
+        errors: Optional[int] = None,
+        force: bool = False
+    ) -> None:
+        """
+        Met à jour l'état ; n'émet que si quelque chose a changé et que le débit le permet.
+
+        Args:
+            phase: phase courante de l'import
+            scan_percent: avancement du parcours des dossiers (0-100)
+            processed: fichiers traités (importés, ignorés ou en erreur)
+            discovered: fichiers audio trouvés jusqu'ici
+            errors: nombre d'erreurs
+            force: émettre sans tenir compte de la limite de débit
+        """
+        phase_changed = phase is not None and phase != self._phase
+        if phase is not None:
+            self._phase = phase
+        if scan_percent is not None:
+            self._scan_percent = scan_percent
+        if processed is not None:
+            self._processed = processed
+        if discovered is not None:
+            self._discovered = discovered
+        if errors is not None:
+            self._errors = errors
+
+        self._percent = self._compute_percent()
+
+        now = time.monotonic()
+        if not (force or phase_changed) and now - self._last_emit < self._min_interval:
+            return
+
+        progress = self._snapshot(now)
+        if not force and progress == self._last_sent:
+            return
+
+        self._last_emit = now
+        self._last_sent = progress
+        self.callback(progress)
+
+
+    def finish(self) -> None:
+        """Émet l'état final (100 %)."""
+        self.update(phase=ImportPhase.FINISHED, force=True)
+
+
+    def _compute_percent(self) -> int:
+        """
+        Le scan devance l'extraction : l'avancement est le plus petit des deux
+        (dossiers parcourus, fichiers traités / trouvés), jamais décroissant.
+        """
+        if self._phase == ImportPhase.FINISHED:
+            return 100
+
+        percent = self._scan_percent
+        if self._discovered:
+            percent = min(percent, int(self._processed * 100 / self._discovered))
+        return max(self._percent, min(percent, 99))
+
+
+    def _snapshot(self, now: float) -> ImportProgress:
+        elapsed = now - self._started
+        rate = self._processed / elapsed if elapsed > 0 else 0.0
+
+        eta = None
+        if 0 < self._percent < 100:
+            eta = elapsed * (100 - self._percent) / self._percent
+
+        return ImportProgress(
+            percent=self._percent,
+            phase=self._phase,
+            processed=self._processed,
+            discovered=self._discovered,
+            errors=self._errors,
+            # Arrondis : deux instantanés sans changement réel restent égaux
+            files_per_second=round(rate, 1) if self._processed else 0.0,
+            eta_seconds=round(eta) if eta is not None else None,
+        )
@@ -2,9 +2,9 @@
 
 
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 class ImportStatus(Enum):
@@ -21,4 +21,32 @@ class ImportStatus(Enum):
 class ImportResult:
     status: ImportStatus
     imported: int = 0
-    errors: List[Tuple[str, Exception]] = None    
+    errors: List[Tuple[str, Exception]] = None
+    # Réimport incrémental
+    updated: int = 0
+    removed: int = 0
+    skipped: int = 0
+    # Job persisté associé (reprise / résultat différé)
+    job_id: Optional[int] = None
+    # Doublons détectés : (fichier, fichier d'origine)
+    duplicates: List[Tuple[str, str]] = field(default_factory=list)
+    # Import interrompu : seuls les lots déjà validés sont conservés
+    cancelled: bool = False
+
+    @property
+    def kept(self) -> int:
+        """Tracks ajoutés ou mis à jour par l'import et conservés en base (y compris après annulation)."""
+        return self.imported + self.updated
+
+
+@dataclass
+class BatchImportResult:
+    """
+    Résultat de l'insertion d'un lot de métadonnées par DBImporter.
+
+    Les erreurs sont rapportées ligne par ligne, sans interrompre le lot.
+    """
+    imported: int = 0
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+    # Lignes non écrites : import annulé avant leur tranche
+    interrupted: int = 0
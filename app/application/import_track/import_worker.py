@@ -1,9 +1,13 @@
 # services/file_sevices/library_services/import_worker.py
 
 
+from typing import Optional
+
 from PySide6.QtCore import QThread, Signal
 from services.file_services.library_services.library_services import LibraryServices
 from app.application.import_track.import_result import ImportResult
+from app.application.import_track.import_progress import ImportProgress
+from app.application.import_track.cancellation import CancellationToken
 
 from core.logger import logger
 
@@ -14,45 +18,63 @@ class ImportWorker(QThread):
 
     Rôle :
         - Exécuter l'import dans un thread séparé
-        - Émettre la progression
-        - Permettre l'annulation propre via LibraryServices
+        - Émettre la progression (déjà limitée en débit par ProgressReporter)
+        - Permettre l'annulation propre via LibraryServices (propre à ce worker :
+          d'autres imports peuvent tourner en parallèle)
     """
 
     progress = Signal(int)
+    # ImportProgress : phase, débit, temps restant, erreurs
+    progress_details = Signal(object)
     finished = Signal(ImportResult)
-    cancelled = Signal()
+    # Résultat partiel : tracks conservés jusqu'à l'annulation
+    cancelled = Signal(ImportResult)
+    failed = Signal(str)
 
-    def __init__(self, library_service: LibraryServices, path: str):
+    def __init__(
+        self,
+        library_service: LibraryServices,
+        path: str,
+        incremental: bool = False,
+        job_id: Optional[int] = None
+    ):
         super().__init__()
         self._library_service = library_service
         self._path = path
+        self._incremental = incremental
+        self._job_id = job_id
+        self._cancel_token = CancellationToken()
 
     def run(self):
         """Méthode exécutée dans le thread."""
         logger.info(f"ImportWorker : Démarrage de l'import pour {self._path}")
 
-        def progress_callback(percent: int):
-            self.progress.emit(percent)
+        def progress_callback(progress: ImportProgress):
+            self.progress.emit(progress.percent)
+            self.progress_details.emit(progress)
 
         try:
             result = self._library_service.import_from_directory(
-                self._path, progress_callback=progress_callback
+                self._path, progress_callback=progress_callback,
+                incremental=self._incremental, job_id=self._job_id,
+                cancel_token=self._cancel_token
             )
 
-            if getattr(self._library_service, "_cancelled", False):
-                logger.info("ImportWorker : Import annulé, signal émis")
-                self.cancelled.emit()
+            if result.cancelled:
+                logger.info(f"ImportWorker : Import annulé, {result.kept} tracks conservés")
+                self.cancelled.emit(result)
             else:
                 logger.info("ImportWorker : Import terminé, signal finished émis")
                 self.finished.emit(result)
         except Exception as e:
             logger.exception(f"ImportWorker : Erreur critique lors de l'import de {self._path}")
+            self.failed.emit(str(e))
 
 
     def cancel(self):
         """Demande l'annulation de l'import en cours."""
         logger.info("ImportWorker : Annulation demandée")
-        self._library_service.cancel_import()
+        self._library_service.cancel_import(self._cancel_token)
 
         
                     
\ No newline at end of file
@@ -0,0 +1,173 @@
+# app/application/import_track/metadata_extractor.py
+
+
+import os
+import multiprocessing
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.application.import_track.file_importer import FileImporter
+from app.application.import_track.cancellation import CancellationToken
+
+from core.logger import logger
+
+
+# Lot produit par l'extraction : (métadonnées extraites, erreurs (chemin, message))
+ExtractionBatch = Tuple[List[Dict[str, object]], List[Tuple[str, str]]]
+
+
+# Événement d'annulation partagé, installé dans chaque process worker
+_worker_cancel_event = None
+
+
+def _init_worker(cancel_event, log_level: int = None) -> None:
+    """Initialise un process worker avec l'événement d'annulation partagé et le niveau de log du parent."""
+    global _worker_cancel_event
+    _worker_cancel_event = cancel_event
+    if log_level is not None:
+        logger.setLevel(log_level)
+
+
+def _extract_batch(file_paths: List[str], cancel_event=None) -> ExtractionBatch:
+    """
+    Extrait les métadonnées d'un lot de fichiers (exécuté dans un process worker).
+
+    S'interrompt entre deux fichiers si l'annulation a été demandée.
+
+    Args:
+        file_paths: fichiers du lot
+        cancel_event: annulation propre à l'appelant (extraction dans le thread appelant,
+                      où l'événement global serait partagé entre imports concurrents)
+    """
+    cancel_event = cancel_event or _worker_cancel_event
+    file_importer = FileImporter()
+    metadata: List[Dict[str, object]] = []
+    errors: List[Tuple[str, str]] = []
+
+    for file_path in file_paths:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        try:
+            metadata.append(file_importer.extract_metadata(file_path))
+        except Exception as e:
+            errors.append((file_path, str(e)))
+
+    return metadata, errors
+
+
+class ParallelMetadataExtractor:
+    """
+    Étape d'extraction parallèle des métadonnées (Mutagen) sur un pool de process.
+
+    Rôle :
+        - Découper le flux de chemins en lots et les répartir sur plusieurs cœurs
+        - Restituer les lots dans leur ordre d'achèvement (ordre non garanti)
+        - Propager l'annulation aux process workers
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = 32):
+        """
+        Initialise l'extracteur.
+
+        Args:
+            workers: nombre de process workers (défaut : nombre de cœurs).
+                     Avec 1 worker, l'extraction reste dans le thread appelant.
+            batch_size: nombre de fichiers envoyés à un worker par lot
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.batch_size = max(1, batch_size)
+        # "spawn" : pas de fork d'un process qui exécute des threads Qt
+        self._context = multiprocessing.get_context("spawn")
+        self._cancel_event = self._context.Event()
+
+
+    def cancel(self) -> None:
+        """Demande l'arrêt de l'extraction, y compris dans les workers."""
+        logger.info("ParallelMetadataExtractor : Annulation demandée")
+        self._cancel_event.set()
+
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+
+    def extract(
+        self,
+        file_paths: Iterable[str],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[ExtractionBatch]:
+        """
+        Extrait les métadonnées d'un flux de chemins.
+
+        Args:
+            file_paths: itérable (éventuellement paresseux) de chemins audio
+            cancel_token: annulation de l'import, relayée aux process workers
+                          (arrêt au fichier suivant)
+
+        Yields:
+            ExtractionBatch : (métadonnées, erreurs) d'un lot terminé
+        """
+        self._cancel_event.clear()
+        if cancel_token is not None:
+            # Appelé immédiatement si l'import est déjà annulé
+            cancel_token.on_cancel(self.cancel)
+        paths = iter(file_paths)
+
+        if self.workers == 1:
+            yield from self._extract_serial(paths)
+            return
+
+        logger.info(f"ParallelMetadataExtractor : Extraction sur {self.workers} process")
+        max_in_flight = self.workers * 2
+        in_flight: Dict[Future, List[str]] = {}
+
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._context,
+            initializer=_init_worker,
+            initargs=(self._cancel_event, logger.level),
+        )
+        try:
+            exhausted = False
+            while True:
+                # Alimente le pool sans jamais matérialiser tout le flux
+                while not exhausted and not self.cancelled and len(in_flight) < max_in_flight:
+                    batch = list(islice(paths, self.batch_size))
+                    if not batch:
+                        exhausted = True
+                        break
+                    in_flight[executor.submit(_extract_batch, batch)] = batch
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = in_flight.pop(future)
+                    if future.cancelled():
+                        continue
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        logger.exception("ParallelMetadataExtractor : Échec d'un lot d'extraction")
+                        yield [], [(file_path, str(e)) for file_path in batch]
+
+                if self.cancelled:
+                    for future in in_flight:
+                        future.cancel()
+        finally:
+            # Consommateur interrompu ou annulation : les workers s'arrêtent au fichier suivant
+            if in_flight:
+                self._cancel_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+    def _extract_serial(self, paths: Iterator[str]) -> Iterator[ExtractionBatch]:
+        """Extraction dans le thread appelant, par lots, sans pool de process."""
+        while not self.cancelled:
+            batch = list(islice(paths, self.batch_size))
+            if not batch:
+                break
+            yield _extract_batch(batch, self._cancel_event)
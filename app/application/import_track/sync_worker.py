@@ -0,0 +1,38 @@
+# app/application/import_track/sync_worker.py
+
+
+from PySide6.QtCore import QThread, Signal
+from services.file_services.library_services.library_services import LibraryServices
+from app.application.import_track.import_result import ImportResult
+
+from core.logger import logger
+
+
+class SyncWorker(QThread):
+    """
+    Worker dédié à la synchronisation de fichiers isolés (surveillance des dossiers).
+
+    Rôle :
+        - Répercuter en base, hors du thread GUI, les fichiers créés/modifiés/supprimés
+        - Émettre le résultat avec les chemins traités pour la mise à jour de l'UI
+    """
+
+    synced = Signal(ImportResult, list, list)
+
+    def __init__(self, library_service: LibraryServices, changed_paths: list, removed_paths: list):
+        super().__init__()
+        self._library_service = library_service
+        self._changed_paths = changed_paths
+        self._removed_paths = removed_paths
+
+    def run(self):
+        """Méthode exécutée dans le thread."""
+        logger.info(
+            f"SyncWorker : Synchronisation de {len(self._changed_paths)} fichiers modifiés, "
+            f"{len(self._removed_paths)} supprimés"
+        )
+        try:
+            result = self._library_service.sync_paths(self._changed_paths, self._removed_paths)
+            self.synced.emit(result, self._changed_paths, self._removed_paths)
+        except Exception:
+            logger.exception("SyncWorker : Erreur critique lors de la synchronisation")
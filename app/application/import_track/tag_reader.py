@@ -0,0 +1,628 @@
+# app/application/import_track/tag_reader.py
+
+
+import os
+import re
+import struct
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from core.logger import logger
+
+
+# Tags lus, clés identiques à celles de Mutagen en mode easy :
+# title, artist, album, date, tracknumber (str) et length (float, secondes)
+TagInfo = Dict[str, object]
+
+WANTED_KEYS = ("title", "artist", "album", "date", "tracknumber")
+
+
+class UnsupportedFile(Exception):
+    """Structure non gérée par la lecture rapide : la lecture revient à Mutagen."""
+
+
+# ========================== #
+#      Tables MPEG audio     #
+# ========================== #
+# (version, couche) -> débits en kbit/s, indexés par les 4 bits de l'en-tête
+_MPEG_BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MPEG_BITRATES[(2, 3)] = _MPEG_BITRATES[(2, 2)]
+for _layer in (1, 2, 3):
+    _MPEG_BITRATES[(2.5, _layer)] = _MPEG_BITRATES[(2, _layer)]
+
+_MPEG_SAMPLE_RATES = {
+    1: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    2.5: [11025, 12000, 8000],
+}
+
+# Frames ID3v2 utiles (v2.2 ramenées à leur équivalent v2.3/v2.4)
+_ID3_FRAMES = {
+    b"TIT2": "TIT2", b"TPE1": "TPE1", b"TALB": "TALB", b"TRCK": "TRCK",
+    b"TDRC": "TDRC", b"TYER": "TYER", b"TDAT": "TDAT", b"TIME": "TIME",
+}
+_ID3V22_FRAMES = {
+    b"TT2": "TIT2", b"TP1": "TPE1", b"TAL": "TALB", b"TRK": "TRCK",
+    b"TYE": "TYER", b"TDA": "TDAT", b"TIM": "TIME",
+}
+_ID3_KEYS = {"TIT2": "title", "TPE1": "artist", "TALB": "album", "TRCK": "tracknumber", "TDRC": "date"}
+_FRAME_ID = re.compile(rb"[A-Z0-9]{3,4}\Z")
+
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+class FastTagReader:
+    """
+    Lecture rapide des tags et de la durée, sans Mutagen.
+
+    Rôle :
+        - Ne lire que les octets nécessaires : en-tête ID3v2 (frames utiles seulement,
+          pochettes sautées), blocs de métadonnées FLAC, premières pages Ogg,
+          fin de fichier (ID3v1, dernière page Ogg), chunks RIFF d'un WAV
+        - Reproduire les valeurs de Mutagen (easy) pour les champs stockés
+        - Refuser (None) tout ce qui sort des cas courants : tag désynchronisé ou
+          compressé, FLAC précédé d'ID3, flux Ogg multiplexé, format inconnu…
+          L'appelant se rabat alors sur Mutagen.
+    """
+
+    # Fenêtre de recherche de la première trame MPEG après les tags ID3v2
+    MP3_SYNC_WINDOW = 64 * 1024
+    # Trames MPEG consécutives exigées en l'absence d'en-tête Xing/VBRI (comme Mutagen)
+    MP3_MIN_FRAMES = 4
+    # Taille maximale des en-têtes Ogg (commentaires + pochette éventuelle)
+    MAX_OGG_HEADER_BYTES = 16 * 1024 * 1024
+    # Fin de fichier lue pour trouver la dernière page Ogg
+    OGG_TAIL_BYTES = 256 * 256
+
+    def __init__(self):
+        self._readers = {
+            ".mp3": self._read_mp3,
+            ".flac": self._read_flac,
+            ".ogg": self._read_ogg,
+            ".wav": self._read_wav,
+        }
+
+
+    def read(self, file_path: str) -> Optional[TagInfo]:
+        """
+        Lit les tags utiles d'un fichier.
+
+        Args:
+            file_path: chemin du fichier audio
+
+        Returns:
+            TagInfo, ou None si le format n'est pas géré (lecture via Mutagen)
+        """
+        reader = self._readers.get(os.path.splitext(file_path)[1].lower())
+        if reader is None:
+            return None
+
+        try:
+            with open(file_path, "rb") as f:
+                return reader(f)
+        except (UnsupportedFile, OSError, struct.error, ValueError, IndexError) as e:
+            logger.debug(f"FastTagReader : Repli sur Mutagen pour {file_path} ({e})")
+            return None
+
+
+    # ========================== #
+    #            MP3             #
+    # ========================== #
+    def _read_mp3(self, f: BinaryIO) -> TagInfo:
+        frames, _, version = self._read_id3v2(f, 0)
+
+        # Comme Mutagen : ID3v1 complète les frames absentes de l'ID3v2
+        # (année en TYER sous un tag v2.2/v2.3, fusionnée ensuite avec TDAT/TIME)
+        year_frame = "TYER" if version in (2, 3) else "TDRC"
+        for frame_id, value in self._read_id3v1(f, year_frame).items():
+            frames.setdefault(frame_id, value)
+
+        tags = self._id3_to_tags(frames)
+        tags["length"] = self._mpeg_length(f)
+        return tags
+
+
+    def _read_id3v2(self, f: BinaryIO, offset: int) -> Tuple[Dict[str, str], int, int]:
+        """
+        Lit les frames utiles d'un tag ID3v2 situé à offset.
+
+        Returns:
+            ({frame_id: texte}, offset de fin du tag, version majeure) ; ({}, offset, 0) sans tag
+        """
+        f.seek(offset)
+        header = f.read(10)
+        if len(header) < 10 or header[:3] != b"ID3":
+            return {}, offset, 0
+
+        major, flags = header[3], header[5]
+        if major not in (2, 3, 4):
+            raise UnsupportedFile(f"ID3v2.{major}")
+        if flags & 0x80:
+            raise UnsupportedFile("tag ID3 désynchronisé")
+
+        end = offset + 10 + _syncsafe(header[6:10])
+        pos = offset + 10
+
+        if flags & 0x40 and major > 2:
+            f.seek(pos)
+            size = f.read(4)
+            pos += (4 + struct.unpack(">I", size)[0]) if major == 3 else _syncsafe(size)
+
+        if major == 2:
+            header_size, id_size, known = 6, 3, _ID3V22_FRAMES
+        else:
+            header_size, id_size, known = 10, 4, _ID3_FRAMES
+
+        frames: Dict[str, str] = {}
+        while pos + header_size <= end:
+            f.seek(pos)
+            frame_header = f.read(header_size)
+            frame_id = frame_header[:id_size]
+            if frame_id[0] == 0:
+                # Padding
+                break
+            if not _FRAME_ID.match(frame_id):
+                raise UnsupportedFile("frame ID3 invalide")
+
+            if major == 2:
+                size, frame_flags = int.from_bytes(frame_header[3:6], "big"), 0
+            elif major == 3:
+                size, frame_flags = struct.unpack(">IH", frame_header[4:10])
+            else:
+                size, frame_flags = _syncsafe(frame_header[4:8]), struct.unpack(">H", frame_header[8:10])[0]
+
+            pos += header_size
+            if pos + size > end:
+                raise UnsupportedFile("frame ID3 hors du tag")
+
+            name = known.get(frame_id)
+            if name and name not in frames:
+                # Compression, chiffrement, désynchronisation : laissés à Mutagen
+                if (major == 3 and frame_flags & 0x00C0) or (major == 4 and frame_flags & 0x000E):
+                    raise UnsupportedFile("frame ID3 compressée ou chiffrée")
+                data = f.read(size)
+                if major == 4 and frame_flags & 0x0001:
+                    data = data[4:]
+                frames[name] = self._decode_text_frame(data)
+
+            # Les autres frames (pochettes…) ne sont jamais lues
+            pos += size
+
+        return frames, end, major
+
+
+    @staticmethod
+    def _decode_text_frame(data: bytes) -> str:
+        """Première valeur d'une frame texte ID3."""
+        if not data:
+            return ""
+        encoding, raw = data[0], data[1:]
+        if encoding == 0:
+            text = raw.decode("latin-1")
+        elif encoding in (1, 2):
+            if len(raw) % 2:
+                raw = raw[:-1]
+            text = raw.decode("utf-16" if encoding == 1 else "utf-16-be")
+        elif encoding == 3:
+            text = raw.decode("utf-8")
+        else:
+            raise UnsupportedFile("encodage ID3 inconnu")
+
+        return text.rstrip("\x00").split("\x00")[0].lstrip("\ufeff")
+
+
+    @staticmethod
+    def _read_id3v1(f: BinaryIO, year_frame: str = "TDRC") -> Dict[str, str]:
+        """Lit un tag ID3v1(.1) en fin de fichier."""
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, size - 131))
+        data = f.read(131)
+
+        index = data.find(b"TAG")
+        if index == -1:
+            return {}
+        # "TAG" de la signature d'un tag APEv2
+        ape_index = data.find(b"APETAGEX")
+        if ape_index != -1 and ape_index + 5 == index:
+            return {}
+        data = data[index:]
+        if not 124 <= len(data) <= 128:
+            return {}
+
+        _, title, artist, album, year, comment, _ = struct.unpack(
+            "3s30s30s30s%ds30sB" % (len(data) - 124), data
+        )
+
+        def fix(value: bytes) -> str:
+            return value.split(b"\x00")[0].strip().decode("latin-1")
+
+        frames = {}
+        for frame_id, value in (("TIT2", title), ("TPE1", artist), ("TALB", album), (year_frame, year)):
+            value = fix(value)
+            if value:
+                frames[frame_id] = value
+        if comment[-2] == 0 and comment[-1]:
+            frames["TRCK"] = str(comment[-1])
+        return frames
+
+
+    @staticmethod
+    def _id3_to_tags(frames: Dict[str, str]) -> TagInfo:
+        """Frames ID3 -> clés easy (TYER/TDAT/TIME fusionnées en date, comme Mutagen)."""
+        frames = dict(frames)
+        tyer, tdat, time = frames.pop("TYER", ""), frames.pop("TDAT", ""), frames.pop("TIME", "")
+        if "TDRC" not in frames and tyer:
+            ym = re.match(r"([0-9]{4})(-[0-9]{2}-[0-9]{2})?\Z", tyer)
+            dm = re.match(r"([0-9]{2})([0-9]{2})\Z", tdat)
+            tm = re.match(r"([0-9]{2})([0-9]{2})\Z", time)
+            if ym:
+                year, month_day = ym.groups()
+                if dm:
+                    month_day = "-%s-%s" % dm.groups()[::-1]
+                timestamp = year
+                if month_day:
+                    timestamp += month_day
+                    if tm:
+                        timestamp += "T%s:%s:00" % tm.groups()
+                frames["TDRC"] = timestamp
+
+        return {key: frames[frame_id] for frame_id, key in _ID3_KEYS.items() if frame_id in frames}
+
+
+    def _mpeg_length(self, f: BinaryIO) -> float:
+        """Durée d'un flux MPEG : en-tête Xing/VBRI, sinon estimation CBR sur la taille."""
+        # Tags ID3v2 empilés (WMP) : tous sautés
+        offset = 0
+        while True:
+            f.seek(offset)
+            header = f.read(10)
+            size = _syncsafe(header[6:10]) if len(header) == 10 and header[:3] == b"ID3" else 0
+            if not size:
+                break
+            offset += 10 + size
+
+        f.seek(offset)
+        window = f.read(self.MP3_SYNC_WINDOW)
+        file_size = os.fstat(f.fileno()).st_size
+
+        index = window.find(b"\xff")
+        while index != -1:
+            if index + 1 < len(window) and window[index + 1] & 0xE0 == 0xE0:
+                frame = self._probe_mpeg_frames(window, index)
+                if frame is not None:
+                    length, bitrate, frame_start = frame
+                    if length is not None:
+                        return length
+                    # Estimation CBR, identique à Mutagen (ID3v1 compris)
+                    return 8 * (file_size - offset - frame_start) / float(bitrate)
+            index = window.find(b"\xff", index + 1)
+
+        raise UnsupportedFile("aucune trame MPEG dans la fenêtre de lecture")
+
+
+    def _probe_mpeg_frames(self, window: bytes, start: int) -> Optional[Tuple[Optional[float], int, int]]:
+        """
+        Vérifie une suite de trames à partir de start.
+
+        Returns:
+            (durée si en-tête Xing/VBRI sinon None, débit, offset de la trame retenue)
+            ou None si la synchronisation est fausse
+        """
+        frames: List[Tuple[int, int]] = []
+        pos = start
+        for _ in range(self.MP3_MIN_FRAMES):
+            parsed = self._parse_mpeg_frame(window, pos)
+            if parsed is None:
+                break
+            frame_length, bitrate, length = parsed
+            if length is not None:
+                # En-tête Xing/VBRI : fait foi (trame retenue par Mutagen)
+                return length, bitrate, pos
+            frames.append((pos, bitrate))
+            pos += frame_length
+
+        if len(frames) >= self.MP3_MIN_FRAMES:
+            first_pos, first_bitrate = frames[0]
+            return None, first_bitrate, first_pos
+        return None
+
+
+    def _parse_mpeg_frame(self, window: bytes, pos: int) -> Optional[Tuple[int, int, Optional[float]]]:
+        """En-tête d'une trame : (longueur, débit en bit/s, durée Xing/VBRI ou None)."""
+        if pos + 4 > len(window):
+            raise UnsupportedFile("trame MPEG hors de la fenêtre de lecture")
+
+        header = int.from_bytes(window[pos:pos + 4], "big")
+        if header >> 21 != 0x7FF:
+            return None
+        version_bits = (header >> 19) & 0x3
+        layer_bits = (header >> 17) & 0x3
+        bitrate_index = (header >> 12) & 0xF
+        rate_index = (header >> 10) & 0x3
+        padding = (header >> 9) & 0x1
+        mode = (header >> 6) & 0x3
+
+        if version_bits == 1 or layer_bits == 0 or rate_index == 3 or bitrate_index in (0, 15):
+            return None
+
+        version = [2.5, None, 2, 1][version_bits]
+        layer = 4 - layer_bits
+        bitrate = _MPEG_BITRATES[(1 if version == 1 else version, layer)][bitrate_index] * 1000
+        sample_rate = _MPEG_SAMPLE_RATES[version][rate_index]
+
+        if layer == 1:
+            frame_size, slot = 384, 4
+        elif version >= 2 and layer == 3:
+            frame_size, slot = 576, 1
+        else:
+            frame_size, slot = 1152, 1
+        frame_length = ((frame_size // 8 * bitrate) // sample_rate + padding) * slot
+
+        length = None
+        if layer == 3:
+            length = self._parse_vbr_header(window, pos, version, mode, frame_size, sample_rate, frame_length)
+        return frame_length, bitrate, length
+
+
+    @staticmethod
+    def _parse_vbr_header(
+        window: bytes, pos: int, version: float, mode: int,
+        frame_size: int, sample_rate: int, frame_length: int
+    ) -> Optional[float]:
+        """Durée donnée par un en-tête Xing/Info (avec délai LAME) ou VBRI, sinon None."""
+        if version == 1:
+            xing = pos + (36 if mode != 3 else 21)
+        else:
+            xing = pos + (21 if mode != 3 else 13)
+
+        if window[xing:xing + 4] in (b"Xing", b"Info"):
+            flags = struct.unpack_from(">I", window, xing + 4)[0]
+            cursor = xing + 8
+            frames = -1
+            if flags & 0x1:
+                frames = struct.unpack_from(">I", window, cursor)[0]
+                cursor += 4
+            cursor += 4 if flags & 0x2 else 0
+            cursor += 100 if flags & 0x4 else 0
+            cursor += 4 if flags & 0x8 else 0
+            if frames == -1:
+                # En-tête sans nombre de trames : Mutagen retombe sur l'estimation CBR
+                return None
+
+            samples = frame_size * frames
+            delay, padding = FastTagReader._lame_delay(window, cursor)
+            samples = max(0, samples - delay - padding)
+            return float(samples) / sample_rate
+
+        vbri = pos + 36
+        if window[vbri:vbri + 4] == b"VBRI" and struct.unpack_from(">H", window, vbri + 4)[0] == 1:
+            frames = struct.unpack_from(">I", window, vbri + 14)[0]
+            return float(frame_size * frames) / sample_rate
+
+        return None
+
+
+    @staticmethod
+    def _lame_delay(window: bytes, pos: int) -> Tuple[int, int]:
+        """Délai encodeur et remplissage (en échantillons) d'un en-tête LAME >= 3.90."""
+        data = window[pos:pos + 20]
+        if len(data) != 20 or not data.startswith((b"LAME", b"L3.99")):
+            return 0, 0
+
+        rest = data.lstrip(b"EMAL")
+        major, rest = rest[0:1], rest[1:].lstrip(b".")
+        minor = re.match(rb"[0-9]*", rest).group()
+        rest = rest[len(minor):]
+        try:
+            version = (int(major), int(minor))
+        except ValueError:
+            return 0, 0
+
+        if version < (3, 90) or (version == (3, 90) and rest[-11:-10] == b"(") or len(rest) < 11:
+            return 0, 0
+
+        payload = window[pos + 9:pos + 36]
+        if len(payload) != 27 or payload[0] >> 4 != 0:
+            return 0, 0
+        packed = int.from_bytes(payload[12:15], "big")
+        return packed >> 12, packed & 0xFFF
+
+
+    # ========================== #
+    #            FLAC            #
+    # ========================== #
+    def _read_flac(self, f: BinaryIO) -> TagInfo:
+        if f.read(4) != b"fLaC":
+            # FLAC précédé d'un tag ID3 : cas rare, laissé à Mutagen
+            raise UnsupportedFile("en-tête FLAC absent")
+
+        tags: TagInfo = {}
+        length = None
+        comments_read = False
+
+        while True:
+            block_header = f.read(4)
+            if len(block_header) != 4:
+                raise UnsupportedFile("blocs FLAC tronqués")
+            last = block_header[0] & 0x80
+            block_type = block_header[0] & 0x7F
+            size = int.from_bytes(block_header[1:4], "big")
+
+            if block_type == 0:
+                data = f.read(size)
+                packed = int.from_bytes(data[10:18], "big")
+                sample_rate = packed >> 44
+                total_samples = packed & 0xFFFFFFFFF
+                if not sample_rate:
+                    raise UnsupportedFile("fréquence FLAC nulle")
+                length = total_samples / float(sample_rate)
+            elif block_type == 4 and not comments_read:
+                tags.update(self._parse_vorbis_comment(f.read(size)))
+                comments_read = True
+            else:
+                # PICTURE, SEEKTABLE, PADDING… jamais lus
+                f.seek(size, 1)
+
+            if last:
+                break
+
+        if length is None:
+            raise UnsupportedFile("STREAMINFO absent")
+        tags["length"] = length
+        return tags
+
+
+    @staticmethod
+    def _parse_vorbis_comment(data: bytes) -> Dict[str, str]:
+        """Premières valeurs des clés utiles d'un bloc Vorbis comment."""
+        vendor_length = struct.unpack_from("<I", data, 0)[0]
+        pos = 4 + vendor_length
+        count = struct.unpack_from("<I", data, pos)[0]
+        pos += 4
+
+        tags: Dict[str, str] = {}
+        for _ in range(count):
+            length = struct.unpack_from("<I", data, pos)[0]
+            pos += 4
+            entry = data[pos:pos + length]
+            pos += length
+            if len(entry) != length:
+                raise UnsupportedFile("Vorbis comment tronqué")
+
+            key, sep, value = entry.partition(b"=")
+            if not sep:
+                continue
+            key = key.decode("ascii", "replace").lower()
+            if key in WANTED_KEYS and key not in tags:
+                tags[key] = value.decode("utf-8", "replace")
+                if len(tags) == len(WANTED_KEYS):
+                    break
+
+        return tags
+
+
+    # ========================== #
+    #            OGG             #
+    # ========================== #
+    def _read_ogg(self, f: BinaryIO) -> TagInfo:
+        (identification, comment), serial = self._ogg_header_packets(f, 2)
+
+        if identification.startswith(b"\x01vorbis"):
+            sample_rate = struct.unpack_from("<I", identification, 12)[0]
+            pre_skip = 0
+            prefix = b"\x03vorbis"
+        elif identification.startswith(b"OpusHead"):
+            sample_rate = 48000
+            pre_skip = struct.unpack_from("<H", identification, 10)[0]
+            prefix = b"OpusTags"
+        else:
+            raise UnsupportedFile("flux Ogg ni Vorbis ni Opus")
+
+        if not comment.startswith(prefix) or not sample_rate:
+            raise UnsupportedFile("en-têtes Ogg inattendus")
+
+        tags: TagInfo = self._parse_vorbis_comment(comment[len(prefix):])
+        position = self._ogg_last_position(f, serial)
+        tags["length"] = max(0, position - pre_skip) / float(sample_rate)
+        return tags
+
+
+    def _ogg_header_packets(self, f: BinaryIO, count: int) -> Tuple[List[bytes], int]:
+        """Reconstitue les count premiers paquets du flux en lisant page par page."""
+        packets: List[bytes] = []
+        current = bytearray()
+        serial = None
+        read = 0
+
+        while len(packets) < count:
+            header = f.read(27)
+            if len(header) != 27 or header[:4] != b"OggS":
+                raise UnsupportedFile("page Ogg invalide")
+            page_serial = struct.unpack_from("<I", header, 14)[0]
+            segments = f.read(header[26])
+            if serial is None:
+                serial = page_serial
+            elif page_serial != serial:
+                raise UnsupportedFile("flux Ogg multiplexé")
+
+            data = f.read(sum(segments))
+            read += 27 + len(segments) + len(data)
+            if read > self.MAX_OGG_HEADER_BYTES:
+                raise UnsupportedFile("en-têtes Ogg trop volumineux")
+
+            # Un segment de 255 octets prolonge le paquet sur le segment suivant
+            start = offset = 0
+            for lacing in segments:
+                offset += lacing
+                if lacing < 255:
+                    current += data[start:offset]
+                    packets.append(bytes(current))
+                    current = bytearray()
+                    start = offset
+            current += data[start:offset]
+
+        return packets[:count], serial
+
+
+    def _ogg_last_position(self, f: BinaryIO, serial: int) -> int:
+        """Position (granule) de la dernière page du flux, lue en fin de fichier."""
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, size - self.OGG_TAIL_BYTES))
+        tail = f.read()
+
+        index = tail.rfind(b"OggS")
+        if index == -1 or len(tail) - index < 27:
+            raise UnsupportedFile("dernière page Ogg introuvable")
+
+        header_type, position, page_serial = struct.unpack_from("<BqI", tail, index + 5)
+        # Dernière page complète du flux : sinon Mutagen parcourt tout le fichier
+        if page_serial != serial or position == -1 or not header_type & 0x04:
+            raise UnsupportedFile("fin de flux Ogg non standard")
+        return position
+
+
+    # ========================== #
+    #            WAV             #
+    # ========================== #
+    def _read_wav(self, f: BinaryIO) -> TagInfo:
+        header = f.read(12)
+        if len(header) != 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            raise UnsupportedFile("en-tête RIFF/WAVE absent")
+
+        size = os.fstat(f.fileno()).st_size
+        fmt = None
+        data_size = None
+        id3_offset = None
+        pos = 12
+
+        # Parcours des chunks : seuls "fmt " et l'en-tête ID3 sont lus
+        while pos + 8 <= size:
+            f.seek(pos)
+            chunk_id, chunk_size = struct.unpack("<4sI", f.read(8))
+            if chunk_id == b"fmt ":
+                fmt = f.read(16)
+            elif chunk_id == b"data":
+                data_size = chunk_size
+            elif chunk_id.lower() == b"id3 ":
+                id3_offset = pos + 8
+            pos += 8 + chunk_size + (chunk_size & 1)
+
+        if fmt is None or len(fmt) < 16:
+            raise UnsupportedFile("chunk fmt absent")
+
+        _, _, sample_rate, _, block_align, _ = struct.unpack("<HHIIHH", fmt)
+        samples = data_size / block_align if data_size is not None and block_align else 0
+
+        tags: TagInfo = {}
+        if id3_offset is not None:
+            frames, _, _ = self._read_id3v2(f, id3_offset)
+            tags = self._id3_to_tags(frames)
+        tags["length"] = samples / sample_rate if sample_rate else 0.0
+        return tags
@@ -18,7 +18,7 @@ class HomeScreenController:
         - ouverture des paramètres et de l'aide
     """
     
-    def __init__(self, home_screen, library_service, player_service, library_presenter, window_manager) -> None:
+    def __init__(self, home_screen, library_service, player_service, library_presenter, window_manager, library_watcher=None, import_scheduler=None) -> None:
         """
         Initialise le contrôleur du HomeScreen.
 
@@ -27,6 +27,8 @@ class HomeScreenController:
             library_service: Service métier de gestion de la bibliothèque musicale.
             player_service: Service de lecture audio.
             library_presenter: Presenter chargé de rafraîchir l'affichage de la bibliothèque.
+            library_watcher: Surveillance des dossiers (les dossiers importés y sont ajoutés).
+            import_scheduler: File d'attente des imports, partagée par l'application.
         """
         
         self._view = home_screen
@@ -34,6 +36,8 @@ class HomeScreenController:
         self._player_service = player_service
         self._library_presenter = library_presenter
         self._window_manager = window_manager
+        self._library_watcher = library_watcher
+        self._import_scheduler = import_scheduler
         
         # Fenêtres secondaires / controllers
         # Fenêtres secondaires / controllers
@@ -76,7 +80,9 @@ class HomeScreenController:
             self._import_controller = ImportSourceController(
                 dialog=dialog,
                 library_service=self._library_service,
-                presenter=self._library_presenter
+                presenter=self._library_presenter,
+                library_watcher=self._library_watcher,
+                import_scheduler=self._import_scheduler
             )
             return dialog
         
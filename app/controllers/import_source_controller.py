@@ -2,11 +2,12 @@
 
 
 from typing import Optional
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QFileDialog
 
 from services.file_services.library_services.library_services import LibraryServices
 from services.file_services.import_services.import_services import ImportServices
-from app.application.import_track.import_worker import ImportWorker
+from services.file_services.import_services.import_scheduler import ImportScheduler
 
 from core.logger import logger
 
@@ -17,18 +18,36 @@ class ImportSourceController:
 
     Rôle :
         - Lancement du service et passe les callbacks.
+        - Présentation des résultats d'imports terminés fenêtre fermée.
     """
     
-    def __init__(self, dialog, library_service: LibraryServices, presenter):
+    def __init__(
+        self,
+        dialog,
+        library_service: LibraryServices,
+        presenter,
+        library_watcher=None,
+        import_scheduler: Optional[ImportScheduler] = None
+    ):
         self._dialog = dialog
         self._library_service = library_service
         self._presenter = presenter
-
-        # Service dédié à l'import
-        self._import_service = ImportServices(library_service=self._library_service)
+        self._library_watcher = library_watcher
+        # Dossier à surveiller une fois l'import terminé (dossier local uniquement, pas l'USB)
+        self._root_to_watch: Optional[str] = None
+        # Import suivi par cette fenêtre (clé du scheduler)
+        self._import_key: Optional[int] = None
+
+        # Service dédié à l'import (file d'attente partagée par l'application)
+        self._import_service = ImportServices(
+            library_service=self._library_service,
+            import_scheduler=import_scheduler
+        )
 
         logger.info("ImportSourceController : initialisé")
         self._bind_signals()
+        # Une fois la fenêtre affichée
+        QTimer.singleShot(0, self._show_pending_results)
 
     def _bind_signals(self):
         """Connecte les signaux de la vue aux méthodes du controller."""
@@ -38,14 +57,14 @@ class ImportSourceController:
         logger.info("Connexion des signaux de la vue aux slots du controller.")
 
         # Annulation de l'import via le bouton
-        self._dialog.load_bar.cancel_requested.connect(self._import_service.cancel_import)
+        self._dialog.load_bar.cancel_requested.connect(self._cancel_import)
 
     # ============================= #
     #   Slots pour chaque support   #
     # ============================= #
     def _import_folder(self):
         """Importe la musique depuis un dossier local."""
-        self._import_from_directory("Choisir un dossier musical")
+        self._import_from_directory("Choisir un dossier musical", watch=True)
         
 
     def _import_usb(self):
@@ -64,22 +83,41 @@ class ImportSourceController:
     # ====================== #
     #   Méthode utilitaire   #
     # ====================== #
-    def _import_from_directory(self, title: str):
+    def _import_from_directory(self, title: str, watch: bool = False):
+        if self._import_key is not None:
+            logger.warning("Import non lancé : cette fenêtre suit déjà un import")
+            return
+
         path = QFileDialog.getExistingDirectory(self._dialog, title)
         if not path:
             logger.info("Aucun dossier sélectionné pour l'import")
             return
+        self._root_to_watch = path if watch else None
     
        # Lancement de l'import via le service, avec callbacks pour UI
-        worker = self._import_service.start_import(
+        self._import_key = self._import_service.start_import(
             path=path,
             progress_callback=self._dialog.progress_bar_widget.set_progress,
+            details_callback=self._dialog.load_bar.set_details,
             finished_callback=lambda result: self._on_import_finished(result),
-            cancelled_callback=self._on_import_cancelled
+            cancelled_callback=self._on_import_cancelled,
+            failed_callback=self._on_import_failed,
+            incremental=True
         )
 
-        if not worker:
-            logger.warning("Import non lancé : un autre import est en cours")
+
+    def _cancel_import(self):
+        """Annule l'import suivi par cette fenêtre."""
+        if self._import_key is not None:
+            self._import_service.cancel_import(self._import_key)
+
+
+    def _show_pending_results(self):
+        """Affiche les résultats des imports terminés pendant que l'interface était fermée."""
+        for result in self._import_service.pending_results():
+            logger.info(f"Résultat différé de l'import {result.job_id}")
+            self._dialog.show_import_result(result)
+            self._import_service.acknowledge(result.job_id)
 
 
     # ============================= #
@@ -89,19 +127,52 @@ class ImportSourceController:
         """Callback quand l'import est terminé."""
         logger.info("Import terminé")
         self._dialog.show_import_result(result)
+        self._import_service.acknowledge(result.job_id)
         self._presenter.refresh_tracks()
-        self._import_service.cleanup_worker()
+        if self._library_watcher and self._root_to_watch:
+            self._library_watcher.add_root(self._root_to_watch)
+            self._root_to_watch = None
+        self._release_import()
         if self._dialog.isVisible():
             self._dialog.close()
             logger.info("Fenêtre d'import fermée automatiquement")
 
-    def _on_import_cancelled(self):
-        """Callback quand l'import est annulé."""
+    def _on_import_cancelled(self, result=None):
+        """Callback quand l'import est annulé (result : résultat partiel, None s'il n'avait pas démarré)."""
         logger.info("Import annulé")
-        self._dialog.show_message("Import annulé", "L'import a été interrompu par l'utilisateur.")
-        self._import_service.cleanup_worker()
+        kept = ""
+        if result is not None and result.kept:
+            kept = f"{result.kept} morceaux déjà importés ont été conservés.\n"
+            self._presenter.refresh_tracks()
+        self._dialog.show_message(
+            "Import annulé",
+            "L'import a été interrompu par l'utilisateur.\n"
+            f"{kept}"
+            "Il reprendra là où il s'est arrêté au prochain import de ce dossier."
+        )
+        self._release_import()
         if self._dialog.isVisible():
             self._dialog.close()
             logger.info("Fenêtre d'import fermée après annulation")
+
+    def _on_import_failed(self, message: str):
+        """Callback quand l'import s'arrête sur une erreur (les lots déjà écrits sont conservés)."""
+        logger.info("Import en échec")
+        self._presenter.refresh_tracks()
+        self._dialog.show_message(
+            "Import en échec",
+            "L'import s'est arrêté sur une erreur :\n"
+            f"{message}\n"
+            "Les morceaux déjà importés ont été conservés ; "
+            "il reprendra là où il s'est arrêté au prochain import de ce dossier."
+        )
+        self._release_import()
+        if self._dialog.isVisible():
+            self._dialog.close()
+            logger.info("Fenêtre d'import fermée après échec")
+
+    def _release_import(self):
+        self._import_service.cleanup_worker(self._import_key)
+        self._import_key = None
             
             
\ No newline at end of file
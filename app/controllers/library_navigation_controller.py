@@ -6,6 +6,7 @@ from PySide6.QtCore import QObject
 from app.UI.screens.home_screen import HomeScreen
 from app.UI.molecules.menus.menu_library import MenuLibrary
 from app.presenter.library_presenter import LibraryPresenter
+from app.controllers.playlist_controllers.playlist_controller import PlaylistController
 
 from core.logger import logger
 
@@ -16,7 +17,7 @@ class LibraryNavigationController(QObject):
     
     Rôle :
         - Écouter les signaux de l'UI (menu, bouton retour)
-        - Demander au presenter les données nécessaires
+        - Demander au presenter et au PlaylistController les données nécessaires
         - Mettre à jour l'UI en conséquence
     """
     
@@ -25,6 +26,7 @@ class LibraryNavigationController(QObject):
         menu_library: MenuLibrary,
         home_screen: HomeScreen,
         library_presenter: LibraryPresenter,
+        playlist_controller: PlaylistController,
         parent=None
     ) -> None:
         """
@@ -36,6 +38,8 @@ class LibraryNavigationController(QObject):
         :type home_screen: HomeScreen
         :param library_presenter: Description
         :type library_presenter: LibraryPresenter
+        :param playlist_controller: Affichage des pistes de la bibliothèque sur le panel
+        :type playlist_controller: PlaylistController
         :param parent: Description
         """
         super().__init__(parent)
@@ -43,6 +47,7 @@ class LibraryNavigationController(QObject):
         self.home_screen = home_screen
         self.playlist_panel = home_screen.content_stack.playlist_panel
         self.library_presenter = library_presenter
+        self.playlist_controller = playlist_controller
         
         self._bind_signals()
 
@@ -65,10 +70,8 @@ class LibraryNavigationController(QObject):
         """Affiche les playlists et leurs pistes."""
         logger.info("Affichage Playlist demandée")
         self.home_screen.content_stack.show_playlist()
-        # Récupère les pistes via le presenter
-        tracks = self.library_presenter.refresh_tracks()
-        # Affiche les pistes sur le panel
-        self.playlist_panel.display_tracks(tracks)
+        # Affiche les pistes de la bibliothèque sur le panel (tenues à jour après un import)
+        self.playlist_controller.show_library_tracks()
           
         
     def _on_back_requested(self):
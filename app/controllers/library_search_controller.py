@@ -0,0 +1,100 @@
+# app/controllers/library_search_controller.py
+
+
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, QTimer
+
+from app.UI.atoms.search_input import SearchInput
+from app.presenter.library_presenter import LibraryPresenter
+from core.entities.track import Track as TrackDataClass
+from services.file_services.library_services.query_executor import QueryExecutor
+from services.file_services.library_services.search_service import SearchService
+
+from core.logger import logger
+
+
+class LibrarySearchController(QObject):
+    """
+    Controller de la recherche dans la bibliothèque.
+
+    Rôle :
+        - Écouter la saisie du champ de recherche
+        - Attendre une pause dans la frappe (anti-rebond) avant d'interroger
+          l'index plein texte via SearchService, hors du thread GUI (QueryExecutor)
+        - Afficher les résultats via le presenter, ou la bibliothèque complète
+          quand le champ est vidé ; une recherche dépassée par une nouvelle
+          saisie est annulée, son résultat ignoré
+    """
+
+    # Pause dans la frappe avant de lancer la recherche (ms)
+    DEBOUNCE_MS = 200
+
+    def __init__(
+        self,
+        search_input: SearchInput,
+        library_presenter: LibraryPresenter,
+        query_executor: QueryExecutor,
+        parent=None
+    ) -> None:
+        """
+        Args:
+            search_input: champ de recherche du HomeScreen
+            library_presenter: presenter de la bibliothèque (affichage des résultats)
+            query_executor: exécuteur des lectures hors du thread GUI
+        """
+        super().__init__(parent)
+        self.search_input = search_input
+        self.library_presenter = library_presenter
+        self.query_executor = query_executor
+        self._searching = False
+        # Recherche en cours (clé QueryExecutor)
+        self._search_request: Optional[int] = None
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._run_search)
+
+        # Chaque frappe relance le délai : une seule recherche par pause
+        self.search_input.textChanged.connect(self._debounce.start)
+        self.search_input.returnPressed.connect(self._run_search)
+
+
+    # ========================= #
+    #   Slots                   #
+    # ========================= #
+    def _run_search(self) -> None:
+        """Lance la recherche de la saisie courante ; la précédente, dépassée, est annulée."""
+        self._debounce.stop()
+        user_text = self.search_input.text().strip()
+        self._cancel_search()
+
+        if not SearchService.build_query(user_text):
+            if self._searching:
+                self._searching = False
+                self.library_presenter.clear_search()
+            return
+
+        self._search_request = self.query_executor.submit(
+            lambda session: SearchService(session).search(user_text),
+            on_result=self._on_results,
+            on_error=lambda message: self._on_search_failed(user_text, message),
+        )
+
+
+    def _cancel_search(self) -> None:
+        if self._search_request is not None:
+            self.query_executor.cancel(self._search_request)
+            self._search_request = None
+
+
+    def _on_results(self, tracks: List[TrackDataClass]) -> None:
+        self._search_request = None
+        self._searching = True
+        self.library_presenter.show_search_results(tracks)
+
+
+    def _on_search_failed(self, user_text: str, message: str) -> None:
+        self._search_request = None
+        logger.error(f"LibrarySearchController : Échec de la recherche '{user_text}' : {message}")
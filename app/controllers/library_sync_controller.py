@@ -0,0 +1,91 @@
+# app/controllers/library_sync_controller.py
+
+
+from typing import Optional, Set, Tuple
+
+from PySide6.QtCore import QObject
+
+from app.application.import_track.import_result import ImportResult
+from services.file_services.import_services.import_scheduler import ImportScheduler
+from services.file_services.library_services.library_watcher import LibraryWatcher
+from app.presenter.library_presenter import LibraryPresenter
+
+from core.logger import logger
+
+
+class LibrarySyncController(QObject):
+    """
+    Controller de synchronisation en direct de la bibliothèque.
+
+    Rôle :
+        - Recevoir les fichiers modifiés détectés par LibraryWatcher
+        - Les répercuter en base via l'ImportScheduler (priorité WATCH : une
+          synchronisation passe devant les imports de masse ; une seule à la fois)
+        - Regrouper les changements arrivés pendant une synchronisation
+        - Mettre à jour le modèle du presenter de façon incrémentale
+    """
+
+    def __init__(
+        self,
+        library_watcher: LibraryWatcher,
+        import_scheduler: ImportScheduler,
+        library_presenter: LibraryPresenter,
+        parent=None
+    ) -> None:
+        super().__init__(parent)
+        self.watcher = library_watcher
+        self.scheduler = import_scheduler
+        self.library_presenter = library_presenter
+
+        # Synchronisation en cours : (clé du scheduler, modifiés, supprimés)
+        self._in_flight: Optional[Tuple[int, list, list]] = None
+        self._pending_changed: Set[str] = set()
+        self._pending_removed: Set[str] = set()
+
+        self.watcher.changes_detected.connect(self._on_changes_detected)
+        self.scheduler.job_finished.connect(self._on_job_finished)
+        self.scheduler.job_failed.connect(self._on_job_failed)
+
+
+    # ========================= #
+    #   Slots                   #
+    # ========================= #
+    def _on_changes_detected(self, changed_paths: list, removed_paths: list) -> None:
+        """Fusionne les changements : le dernier état connu d'un fichier l'emporte."""
+        self._pending_changed.difference_update(removed_paths)
+        self._pending_changed.update(changed_paths)
+        self._pending_removed.difference_update(changed_paths)
+        self._pending_removed.update(removed_paths)
+        self._start_next()
+
+
+    def _start_next(self) -> None:
+        if self._in_flight is not None:
+            return
+        if not (self._pending_changed or self._pending_removed):
+            return
+
+        changed, removed = sorted(self._pending_changed), sorted(self._pending_removed)
+        self._pending_changed.clear()
+        self._pending_removed.clear()
+
+        key = self.scheduler.enqueue_sync(changed, removed)
+        self._in_flight = (key, changed, removed)
+
+
+    def _on_job_finished(self, key: int, result: ImportResult) -> None:
+        if self._in_flight is None or self._in_flight[0] != key:
+            return
+        _, changed_paths, removed_paths = self._in_flight
+        logger.info(f"LibrarySyncController : Synchronisation terminée ({result.status.name})")
+        self.library_presenter.apply_library_changes(changed_paths, removed_paths)
+        self._in_flight = None
+        self._start_next()
+
+
+    def _on_job_failed(self, key: int, message: str) -> None:
+        if self._in_flight is None or self._in_flight[0] != key:
+            return
+        logger.error(f"LibrarySyncController : Synchronisation en échec ({message})")
+        self._in_flight = None
+        self._start_next()
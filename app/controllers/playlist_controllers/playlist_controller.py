@@ -1,7 +1,7 @@
 # app/controllers/playlist_controller.py
 
 
-from typing import Optional, List
+from typing import Callable, Optional, List, Sequence
 
 from PySide6.QtCore import Qt, QObject
 
@@ -11,10 +11,12 @@ from app.controllers.tracks_sort_controller import TracksBySortController
 
 from services.file_services.player_services.player_services import PlayerServices
 from services.file_services.playlist_services.playlist_services import PlaylistServices
-from services.file_services.library_services.track_read_service import TrackReadService
+from services.file_services.library_services.library_cache import LibraryCache
+from services.file_services.library_services.query_executor import QueryExecutor
 
 from core.logger import logger
 from core.entities.track import Track
+from app.view_models.track_store import TrackRow, TrackStore
 
 
 class PlaylistController(QObject):
@@ -22,7 +24,8 @@ class PlaylistController(QObject):
     Controller principal pour la gestion de la playlist et de la bibliothèque musicale.
 
     Responsabilités :
-        - Charger et initialiser la bibliothèque depuis LibraryServices
+        - Charger et initialiser la bibliothèque depuis le LibraryCache, hors du
+          thread GUI : première page affichée d'abord, puis la suite par pages
         - Gérer les playlists via PlaylistServices
         - Préparer la lecture via PlayerServices
         - Réagir aux actions utilisateur via l'UI PlaylistPanel
@@ -35,7 +38,8 @@ class PlaylistController(QObject):
         playlist_service: PlaylistServices,
         player_service: PlayerServices,
         session_factory: callable,
-        sort_tracks_widget
+        sort_tracks_widget,
+        library_cache: Optional[LibraryCache] = None
     ):
         super().__init__()
 
@@ -43,23 +47,24 @@ class PlaylistController(QObject):
         self.playlist: PlaylistServices = playlist_service
         self.player: PlayerServices = player_service
         self.session_factory = session_factory
+        self.library_cache = library_cache or LibraryCache(QueryExecutor(session_factory))
+        # Incrémenté à chaque affichage : les pages d'un chargement remplacé sont ignorées
+        self._library_request = 0
+        # La table affiche toute la bibliothèque (rafraîchie quand le cache est relu)
+        self._library_shown = False
+        # Vrai pendant que le controller remplit lui-même la table avec la bibliothèque
+        self._filling_library = False
         
         # Instanciation du controller de tri
-        self.sort_controller = TracksBySortController(self.ui, self._get_track_read_service)
         self._bind_sort_buttons(sort_tracks_widget)
 
         # Lier UI et services
         self._bind_service()
 
-        # Charger la bibliothèque et la playlist au démarrage
+        # Charger la bibliothèque et la playlist au démarrage (en arrière-plan)
         self.init_library()
         self.show_library_tracks()
         
-        
-    def _get_track_read_service(self) -> TrackReadService:
-        """Instancie un TrackReadService avec une session SQLAlchemy locale."""
-        session = self.session_factory()
-        return TrackReadService(session)
 
 
     # ========================= #
@@ -69,6 +74,9 @@ class PlaylistController(QObject):
         """Connecte les signaux des services PlaylistServices aux slots du controller."""
         self.playlist.playlist_changed.connect(self._refresh_ui)
         self.playlist.track_changed.connect(self._on_track_changed)
+        self.library_cache.refreshed.connect(self._on_library_refreshed)
+        # Toute autre liste affichée (album, artiste…) remplace la bibliothèque
+        self.ui.tracks_model.modelReset.connect(self._on_tracks_replaced)
 
 
     # ========================= #
@@ -76,11 +84,16 @@ class PlaylistController(QObject):
     # ========================= #
     def init_library(self) -> None:
         """
-        Charge la bibliothèque depuis LibraryServices dans PlaylistServices
-        et prépare la lecture du premier titre.
+        Charge la bibliothèque depuis le LibraryCache dans PlaylistServices
+        et prépare la lecture du premier titre, à l'arrivée des pistes.
         """
-        track_read_service = self._get_track_read_service()
-        tracks_paths = track_read_service.get_track_file_paths()
+        self.library_cache.request_tracks(
+            lambda tracks: self._on_library_paths([t.file_path for t in tracks])
+        )
+
+
+    def _on_library_paths(self, tracks_paths: List[str]) -> None:
+        """Reçoit les chemins de la bibliothèque (thread GUI)."""
         if not tracks_paths:
             logger.warning("Aucune piste trouvée dans la bibliothèque")
             return
@@ -124,7 +137,7 @@ class PlaylistController(QObject):
         
         
     def _bind_sort_buttons(self, sort_widget):
-        self.sort_controller = TracksBySortController(self.ui, self._get_track_read_service())
+        self.sort_controller = TracksBySortController(self.ui, self.library_cache)
         sort_widget.sort_by_artist.connect(self.sort_controller.show_by_artist)
         sort_widget.sort_by_album.connect(self.sort_controller.show_by_album)
         sort_widget.sort_by_genre.connect(self.sort_controller.show_by_genre)
@@ -139,12 +152,65 @@ class PlaylistController(QObject):
         Met à jour l'affichage des tracks dans le panel.
 
         Args:
-            tracks (Optional[List[Track]]): si None, charge toutes les tracks de LibraryServices
+            tracks (Optional[List[Track]]): si None, affiche toutes les tracks du LibraryCache
+                                            (au fil de leur lecture si elles ne sont pas en cache)
         """
-        if tracks is None:
-            track_read_service = self._get_track_read_service()
-            tracks = track_read_service.get_tracks()
-        self.ui.display_tracks(tracks)
+        self._library_request += 1
+        if tracks is not None:
+            self.ui.display_tracks(tracks)
+            return
+        request = self._library_request
+        self.library_cache.stream_tracks(
+            lambda page, first: self._on_library_page(request, page, first)
+        )
+        # Chargement terminé : la table partage l'instantané au lieu de sa copie page par page
+        self.library_cache.request_tracks(lambda tracks: self._share_library(request, tracks))
+
+
+    def _on_library_page(self, request: int, tracks: Sequence[TrackRow], first: bool) -> None:
+        """Affiche une page de la bibliothèque (thread GUI)."""
+        if request != self._library_request:
+            return
+
+        if first:
+            self._fill_library(self.ui.display_tracks, tracks)
+        else:
+            self.ui.append_tracks(tracks)
+
+
+    def _share_library(self, request: int, tracks: TrackStore) -> None:
+        # Chargement croisé par une écriture : la table sera mise à jour par refreshed
+        if request == self._library_request and tracks is self.library_cache.snapshot:
+            self.ui.share_tracks(tracks)
+
+
+    def _fill_library(self, fill: Callable[[Sequence[TrackRow]], None], tracks: Sequence[TrackRow]) -> None:
+        self._filling_library = True
+        try:
+            fill(tracks)
+        finally:
+            self._filling_library = False
+        self._library_shown = True
+
+
+    def _on_library_refreshed(self) -> None:
+        """Bibliothèque relue après un import : la table est mise à jour sans changer de vue."""
+        if self._library_shown:
+            self.library_cache.request_tracks(self._update_library)
+
+
+    def _update_library(self, tracks: TrackStore) -> None:
+        if self._library_shown:
+            self._fill_library(self.ui.update_tracks, tracks)
+
+
+    def _on_tracks_replaced(self) -> None:
+        """Une autre liste (album, artiste…) remplace la bibliothèque dans la table."""
+        if self._filling_library:
+            return
+        self._library_shown = False
+        # Pages restantes d'un chargement en cours ignorées
+        self._library_request += 1
 
 
     # ========================= #
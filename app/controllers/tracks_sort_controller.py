@@ -1,11 +1,12 @@
 # app/controllers/tracks_sort_controller.py
 
+import os
 from typing import List, Dict
 
 from PySide6.QtCore import QObject
 
 
-from services.file_services.library_services.library_services import LibraryServices
+from services.file_services.library_services.library_cache import LibraryCache
 from app.UI.organisms.playlist_files.tracks_view import (
     TracksView,
     TracksByAlbumView,
@@ -14,29 +15,55 @@ from app.UI.organisms.playlist_files.tracks_view import (
     TracksByFavoriteView
 )
 from app.UI.screens.window_services.playlist_panel import PlaylistPanel
+from app.application.import_track.cover_art import CoverArtCache
 
-from core.entities.track import Track
+from app.view_models.track_store import TrackRow, TrackStore
 from core.logger import logger
 
 
 class TracksBySortController(QObject):
     """
     Controller général pour l'exploration et le tri des tracks.
-    S'occupe de récupérer les données via LibraryServices et
-    de créer les vues correspondantes.
+    S'occupe de récupérer les données via le LibraryCache (sans relire la
+    BDD tant que la bibliothèque ne change pas) et de créer les vues
+    correspondantes. La vue affichée est reconstruite quand le cache est
+    relu après une modification de la bibliothèque (import, synchronisation).
     """
+
+    # Taille des icônes de la grille des albums (TracksByAlbumView)
+    ALBUM_ICON_SIZE = 60
     
-    def __init__(self, ui: PlaylistPanel, library_service: LibraryServices):
+    def __init__(self, ui: PlaylistPanel, library_cache: LibraryCache):
         super().__init__()
         self.ui = ui
-        self.library_service = library_service
+        self.library_cache = library_cache
+        # Nom de vue du panel -> construction de la vue depuis les pistes
+        self._builders = {
+            "library": self._show_library,
+            "albums": self._show_by_album,
+            "artists": self._show_by_artist,
+            "genres": self._show_by_genre,
+            "favorites": self._show_favorites,
+        }
+        self.library_cache.refreshed.connect(self._on_library_refreshed)
+
+
+    def _on_library_refreshed(self):
+        """Reconstruit la vue de tri affichée avec les pistes relues."""
+        builder = self._builders.get(self.ui.current_view_name())
+        if builder is not None:
+            logger.debug("TracksBySortController : Vue de tri reconstruite")
+            self.library_cache.request_tracks(builder)
     
     
     # =========================== #
     #   Affichage bibliothèque    #
     # =========================== #
     def show_library(self):
-        tracks: List[Track] = self.library_service.get_tracks()
+        self.library_cache.request_tracks(self._show_library)
+
+
+    def _show_library(self, tracks: TrackStore):
         tracks_view = TracksView(tracks)
         tracks_view.track_selected.connect(self.ui.display_tracks)
         self.ui.replace_main_view("library", tracks_view)
@@ -50,20 +77,24 @@ class TracksBySortController(QObject):
         Affiche les albums sous forme de grille type "Explorer".
         Cliquer sur un album émet les tracks de cet album.
         """
-        tracks: List[Track] = self.library_service.get_tracks()
-        
-        albums: Dict[str, List[Track]] = {}
-        album_icons: Dict[str, str] = {}
+        self.library_cache.request_tracks(self._show_by_album)
+
+
+    def _show_by_album(self, tracks: TrackStore):
+        albums: Dict[int, List[TrackRow]] = {}
+        album_icons: Dict[int, str] = {}
         
         for t in tracks:
             if not t.album:
                 continue
-            # Regrouper les tracks par album
-            albums.setdefault(t.album, []).append(t)
+            # Regrouper les tracks par album (id : deux albums de même titre restent distincts)
+            albums.setdefault(t.album_id, []).append(t)
 
-            # Récupérer l'icône si présente
-            if t.album.jacket_path:
-                album_icons.setdefault(t.album, t.album.jacket_path)
+            # Récupérer l'icône si présente (vignette à la taille de la grille)
+            if t.jacket_path and t.album_id not in album_icons:
+                icon = CoverArtCache.sized(t.jacket_path, self.ALBUM_ICON_SIZE)
+                if os.path.exists(icon):
+                    album_icons[t.album_id] = icon
 
         # Créer la vue type Explorer avec icônes
         album_view = TracksByAlbumView(albums, album_icons)
@@ -77,8 +108,11 @@ class TracksBySortController(QObject):
     #  Affichage par artistes     #
     # =========================== #
     def show_by_artist(self):
-        tracks: List[Track] = self.library_service.get_tracks()
-        artists: Dict[str, List[Track]] = {}
+        self.library_cache.request_tracks(self._show_by_artist)
+
+
+    def _show_by_artist(self, tracks: TrackStore):
+        artists: Dict[str, List[TrackRow]] = {}
         for t in tracks:
             artists.setdefault(t.artist, []).append(t)
 
@@ -91,8 +125,11 @@ class TracksBySortController(QObject):
     #    Affichage par genre      #
     # =========================== #
     def show_by_genre(self):
-        tracks: List[Track] = self.library_service.get_tracks()
-        genres: Dict[str, List[Track]] = {}
+        self.library_cache.request_tracks(self._show_by_genre)
+
+
+    def _show_by_genre(self, tracks: TrackStore):
+        genres: Dict[str, List[TrackRow]] = {}
         for t in tracks:
             genres.setdefault(t.genre, []).append(t)
 
@@ -105,8 +142,11 @@ class TracksBySortController(QObject):
     #      Affichage favoris      #
     # =========================== #
     def show_favorites(self):
-        tracks: List[Track] = self.library_service.get_tracks()
-        favorites: List[Track] = [t for t in tracks if t.is_favorite]
+        self.library_cache.request_tracks(self._show_favorites)
+
+
+    def _show_favorites(self, tracks: TrackStore):
+        favorites: List[TrackRow] = [t for t in tracks if t.is_favorite]
 
         favorite_view = TracksByFavoriteView(favorites)
         favorite_view.favorite_selected.connect(self.ui.display_tracks)
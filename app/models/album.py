@@ -5,7 +5,7 @@ Modèle de données pour un album dans l'application FunkyTunes.
 """
 
 from typing import TYPE_CHECKING, Optional, List
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database.base import Base
 
@@ -33,6 +33,8 @@ class Album(Base):
 
     __table_args__ = (
         UniqueConstraint("title", "artist_id", name="uix_album_artist"),
+        # Albums d'un artiste, triés par titre
+        Index("ix_albums_artist_title", "artist_id", "title"),
     )
 
     def __repr__(self) -> str:
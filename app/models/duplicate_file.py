@@ -0,0 +1,30 @@
+# app/models/duplicate_file.py
+
+"""
+Modèle de données pour une copie d'un morceau déjà présent dans la bibliothèque FunkyTunes.
+"""
+
+from typing import Optional
+from datetime import datetime, timezone
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from database.base import Base
+
+
+class DuplicateFile(Base):
+    __tablename__ = "duplicate_files"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    file_path: Mapped[str] = mapped_column(unique=True, nullable=False)
+    # Track dont ce fichier est une copie (même charge audio)
+    track_id: Mapped[int] = mapped_column(ForeignKey("tracks.id"), nullable=False, index=True)
+    content_hash: Mapped[str] = mapped_column(nullable=False)
+    # Empreinte du fichier (réimport incrémental)
+    file_size: Mapped[Optional[int]] = mapped_column(nullable=True)
+    file_mtime_ns: Mapped[Optional[int]] = mapped_column(nullable=True)
+    found_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<DuplicateFile(file_path='{self.file_path}', track_id={self.track_id})>"
@@ -0,0 +1,77 @@
+# app/models/import_job.py
+
+"""
+Modèle de données pour un travail d'import (reprise après interruption) dans l'application FunkyTunes.
+"""
+
+from enum import Enum
+from typing import Optional, List
+from datetime import datetime, timezone
+from sqlalchemy import JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from database.base import Base
+
+
+class ImportJobStatus(str, Enum):
+    RUNNING = "running"
+    INTERRUPTED = "interrupted"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+    COMPLETED = "completed"
+
+
+# Un job dans l'un de ces états peut être repris
+RESUMABLE_STATUSES = (
+    ImportJobStatus.RUNNING.value,
+    ImportJobStatus.INTERRUPTED.value,
+    ImportJobStatus.CANCELLED.value,
+    ImportJobStatus.FAILED.value,
+)
+
+
+class ImportJob(Base):
+    __tablename__ = "import_jobs"
+
+    # Nombre maximal d'erreurs conservées en base (le compteur reste exact)
+    MAX_STORED_ERRORS = 1000
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    root_path: Mapped[str] = mapped_column(nullable=False, index=True)
+    incremental: Mapped[bool] = mapped_column(default=False, nullable=False)
+    status: Mapped[str] = mapped_column(default=ImportJobStatus.RUNNING.value, nullable=False)
+
+    # Point de reprise
+    last_path: Mapped[Optional[str]] = mapped_column(nullable=True)
+    processed: Mapped[int] = mapped_column(default=0, nullable=False)
+
+    # Compteurs cumulés sur toutes les exécutions du job
+    imported: Mapped[int] = mapped_column(default=0, nullable=False)
+    updated: Mapped[int] = mapped_column(default=0, nullable=False)
+    removed: Mapped[int] = mapped_column(default=0, nullable=False)
+    skipped: Mapped[int] = mapped_column(default=0, nullable=False)
+    error_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    errors: Mapped[List[List[str]]] = mapped_column(JSON, default=list, nullable=False)
+    # Doublons détectés par la dernière exécution : [fichier, fichier d'origine]
+    duplicate_count: Mapped[Optional[int]] = mapped_column(default=0, nullable=True)
+    duplicates: Mapped[Optional[List[List[str]]]] = mapped_column(JSON, default=list, nullable=True)
+
+    # Résultat présenté à l'utilisateur (faux si terminé fenêtre fermée)
+    acknowledged: Mapped[bool] = mapped_column(default=False, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        # Résultats en attente de présentation (lus au démarrage)
+        Index("ix_import_jobs_status_ack", "status", "acknowledged", "finished_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ImportJob(root_path='{self.root_path}', status='{self.status}', processed={self.processed})>"
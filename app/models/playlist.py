@@ -7,7 +7,7 @@ Modèle de données pour une playlist musicale dans l'application FunkyTunes.
 
 from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime, timezone
-from sqlalchemy import Table, ForeignKey, Column, Integer, DateTime
+from sqlalchemy import Table, ForeignKey, Column, Index, Integer, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database.base import Base
 
@@ -23,6 +23,8 @@ playlist_track_association = Table(
     Base.metadata,
     Column("playlist_id", ForeignKey("playlists.id"), primary_key=True),
     Column("track_id", ForeignKey("tracks.id"), primary_key=True),
+    # La clé primaire sert les lectures par playlist ; celui-ci, les playlists d'un track
+    Index("ix_playlist_track_track_id", "track_id"),
 )
 
 
@@ -5,7 +5,7 @@ Modèle de données pour une piste musicale dans l'application FunkyTunes.
 """
 
 from typing import TYPE_CHECKING, Optional, List
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database.base import Base
 from app.models.playlist import playlist_track_association
@@ -28,6 +28,12 @@ class Track(Base):
     track_number: Mapped[Optional[int]] = mapped_column(nullable=True)
     genre: Mapped[Optional[str]] = mapped_column(nullable=True)
     is_favorite: Mapped[bool] = mapped_column(default=False, nullable=False)
+    # Empreinte du fichier au moment de l'import (réimport incrémental)
+    file_size: Mapped[Optional[int]] = mapped_column(nullable=True, index=True)
+    file_mtime_ns: Mapped[Optional[int]] = mapped_column(nullable=True)
+    # Empreintes de contenu (détection des doublons) : clé rapide, hash complet calculé à la demande
+    quick_key: Mapped[Optional[str]] = mapped_column(nullable=True, index=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(nullable=True, index=True)
 
     artist_id: Mapped[int] = mapped_column(ForeignKey("artists.id"), nullable=False)
     album_id: Mapped[int] = mapped_column(ForeignKey("albums.id"), nullable=False)
@@ -39,8 +45,14 @@ class Track(Base):
         back_populates="tracks"
     )
 
+    # uix_album_track_number sert aussi les lectures par album (tri par numéro)
+    # et le chargement de la bibliothèque (tri album_id, track_number).
+    # Les autres accès gardent le même ordre de tri, servi par l'index.
     __table_args__ = (
         UniqueConstraint("album_id", "track_number", name="uix_album_track_number"),
+        Index("ix_tracks_artist_album", "artist_id", "album_id", "track_number"),
+        Index("ix_tracks_genre_album", "genre", "album_id", "track_number"),
+        Index("ix_tracks_favorite_album", "is_favorite", "album_id", "track_number"),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,22 @@
+# app/models/watched_folder.py
+
+"""
+Modèle de données pour un dossier racine surveillé de la bibliothèque FunkyTunes.
+"""
+
+from datetime import datetime, timezone
+from sqlalchemy.orm import Mapped, mapped_column
+from database.base import Base
+
+
+class WatchedFolder(Base):
+    __tablename__ = "watched_folders"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    path: Mapped[str] = mapped_column(unique=True, nullable=False)
+    added_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<WatchedFolder(path='{self.path}')>"
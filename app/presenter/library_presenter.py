@@ -2,11 +2,13 @@
 
 
 from contextlib import contextmanager
-from typing import Generator, Callable
+from typing import Generator, Callable, Optional
 from sqlalchemy.orm import Session
 
 from app.view_models.model_tracks import TracksTableModel
+from app.view_models.model_lazy_tracks import LazyTracksTableModel
 from core.entities.track import Track as TrackDataClass
+from services.file_services.library_services.query_executor import QueryExecutor
 from services.file_services.library_services.track_read_service import TrackReadService
 
 from core.logger import logger
@@ -22,16 +24,24 @@ class LibraryPresenter:
         - Fournir des méthodes de rafraîchissement pour la vue
     """
     
-    def __init__(self, view, session_factory: Callable[[], Session]):
+    def __init__(
+        self,
+        view,
+        session_factory: Callable[[], Session],
+        query_executor: Optional[QueryExecutor] = None
+    ):
         """
         Initialise le presenter.
 
         Args:
             view: Instance de LibraryDisplayMenu
             session_factory: factory SQLAlchemy pour créer une session
+            query_executor: exécuteur des lectures hors du thread GUI
+                            (défaut : un exécuteur sur session_factory)
         """
         self.view = view
         self.session_factory = session_factory
+        self.query_executor = query_executor or QueryExecutor(session_factory)
         self._tracks_model = None
         logger.info("LibraryPresenter : Chargement initial des tracks...")
         self.load_tracks()
@@ -50,40 +60,79 @@ class LibraryPresenter:
 
     def load_tracks(self) -> None:
         """
-        Charge les pistes depuis la BDD et les injecte dans la vue.
+        Branche la bibliothèque sur la vue.
 
-        Crée un TracksTableModel et l'assigne à la vue.
+        Crée un LazyTracksTableModel (pistes lues par blocs au défilement, hors
+        du thread GUI) et l'assigne à la vue, qui affiche le chargement jusqu'à
+        l'arrivée du premier bloc.
         """
         try:
-            with self.track_read_service_scope() as service:
-                tracks: list[TrackDataClass] = service.get_tracks()
-                self._tracks_model = TracksTableModel(tracks)
-                self.view.set_tracks_model(self._tracks_model)
-                logger.info(f"LibraryPresenter : {len(tracks)} tracks chargées")
+            self._tracks_model = LazyTracksTableModel(self.query_executor)
+            self._tracks_model.loading_changed.connect(self.view.set_loading)
+            self.view.set_loading(True)
+            self.view.set_tracks_model(self._tracks_model)
         except Exception as e:
             logger.error(f"Erreur lors du chargement des tracks: {e}", exc_info=True)
             
             
     def refresh_tracks(self) -> None:
         """
-        Recharge les pistes depuis la BDD et met à jour le modèle existant.
+        Recharge le modèle de la bibliothèque.
 
-        Si aucun modèle n'existe encore, crée un nouveau TracksTableModel.
+        Si aucun modèle n'existe encore, crée un nouveau LazyTracksTableModel.
+        Les listes complètes de pistes sont servies par le LibraryCache.
         """
         try:
-            with self.track_read_service_scope() as service:
-                tracks = service.get_tracks()
-                if self._tracks_model is None:
-                    self._tracks_model = TracksTableModel(tracks)
-                    self.view.set_tracks_model(self._tracks_model)
-                else:
-                    self._tracks_model.set_tracks(tracks)
-                logger.info(f"LibraryPresenter : {len(tracks)} tracks rafraîchies")
-                return tracks
-            
+            if self._tracks_model is None:
+                self.load_tracks()
+            else:
+                self._tracks_model.reload()
+
         except Exception as e:
             logger.error(f"Erreur lors du rafraîchissement des tracks: {e}", exc_info=True)
-            return []
+
+
+    def apply_library_changes(self, changed_paths: list[str], removed_paths: list[str]) -> None:
+        """
+        Met à jour le modèle existant après des changements de fichiers.
+
+        Le modèle virtuel ne garde que quelques blocs : il est simplement
+        recompté et relu à la demande.
+
+        Args:
+            changed_paths: fichiers créés ou modifiés
+            removed_paths: fichiers supprimés
+        """
+        if self._tracks_model is None:
+            self.load_tracks()
+            return
+
+        try:
+            self._tracks_model.reload()
+            logger.info(
+                f"LibraryPresenter : {len(changed_paths)} fichiers mis à jour, "
+                f"{len(removed_paths)} fichiers retirés"
+            )
+        except Exception as e:
+            logger.error(f"Erreur lors de la mise à jour incrémentale des tracks: {e}", exc_info=True)
+
+
+    def show_search_results(self, tracks: list[TrackDataClass]) -> None:
+        """
+        Affiche des résultats de recherche à la place de la bibliothèque.
+
+        Le modèle de la bibliothèque est conservé (et reste tenu à jour) :
+        clear_search le réaffiche.
+        """
+        self.view.set_tracks_model(TracksTableModel(tracks))
+
+
+    def clear_search(self) -> None:
+        """Réaffiche la bibliothèque complète après une recherche."""
+        if self._tracks_model is None:
+            self.load_tracks()
+            return
+        self.view.set_tracks_model(self._tracks_model)
 
 
     @contextmanager
@@ -0,0 +1,230 @@
+# app/view_models/model_lazy_tracks.py
+
+from collections import OrderedDict
+from typing import Optional
+
+from PySide6.QtCore import Qt, QModelIndex, Signal
+
+from app.view_models.model_tracks import TracksTableModel
+from app.view_models.track_store import TrackRow, TrackStore
+from core.entities.track import Track
+from repositories.pagination import Cursor, Page
+from services.file_services.library_services.query_executor import QueryExecutor
+from services.file_services.library_services.track_read_service import TrackReadService
+
+from core.logger import logger
+
+
+class LazyTracksTableModel(TracksTableModel):
+    """
+    Modèle virtuel de la bibliothèque : les pistes sont lues à la demande.
+
+    Rôle :
+        - Annoncer le nombre total de lignes (COUNT(*)) sans charger les pistes
+        - Lire les lignes par blocs de BLOCK_SIZE quand la vue les affiche
+        - Ne garder que les MAX_BLOCKS blocs les plus récemment affichés (LRU) :
+          la mémoire reste la même pour 1 000 ou 1 000 000 de pistes
+
+    Les lectures passent par le QueryExecutor, hors du thread GUI : une ligne
+    pas encore lue s'affiche "Chargement…" puis est remplie à l'arrivée de
+    son bloc. Le comptage arrive avec le premier bloc, affiché d'emblée.
+
+    Un bloc qui suit un bloc déjà lu est lu par clé (curseur du bloc précédent) ;
+    un saut direct (barre de défilement) est lu par position.
+    """
+
+    # True pendant le comptage (chargement initial, rechargement)
+    loading_changed = Signal(bool)
+
+    BLOCK_SIZE = 256
+    MAX_BLOCKS = 64
+    # Blocs en attente : au-delà, les plus anciens demandés (déjà défilés) sont annulés
+    MAX_PENDING = 8
+    LOADING_TEXT = "Chargement…"
+
+    def __init__(self, query_executor: QueryExecutor, parent=None):
+        """
+        Args:
+            query_executor: exécuteur des lectures hors du thread GUI
+        """
+        super().__init__(None, parent)
+        self.query_executor = query_executor
+        self._count = 0
+        self._blocks: "OrderedDict[int, TrackStore]" = OrderedDict()
+        self._cursors: dict[int, Optional[Cursor]] = {0: None}
+        # Bloc -> clé de la lecture en cours
+        self._pending: "OrderedDict[int, int]" = OrderedDict()
+        # Clé du comptage (avec le premier bloc) en cours : hors de _pending, jamais évincé
+        self._count_request: Optional[int] = None
+        # Incrémentée à chaque rechargement : les résultats antérieurs sont ignorés
+        self._generation = 0
+        self.reload()
+
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._count
+
+
+    def track_at(self, row: int) -> Optional[TrackRow]:
+        """Retourne la piste de la ligne row, None si son bloc n'est pas encore lu."""
+        if not 0 <= row < self._count:
+            return None
+
+        number, offset = divmod(row, self.BLOCK_SIZE)
+        block = self._block(number)
+        if block is not None and offset < len(block):
+            return block[offset]
+        return None
+
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if (
+            role == Qt.DisplayRole and index.isValid() and index.column() == 1
+            and index.row() // self.BLOCK_SIZE not in self._blocks
+        ):
+            self._block(index.row() // self.BLOCK_SIZE)
+            return self.LOADING_TEXT
+        return super().data(index, role)
+
+
+    # Mise à jour de la bibliothèque
+    def reload(self) -> None:
+        """
+        Oublie les blocs lus, puis recompte les pistes et relit le premier bloc.
+
+        Les lignes ajoutées ou retirées le sont en fin de table, puis toute la
+        table est signalée modifiée : la vue relit les lignes visibles sans
+        revenir en haut de la liste.
+        """
+        for key in self._pending.values():
+            self.query_executor.cancel(key)
+        self._pending.clear()
+        if self._count_request is not None:
+            self.query_executor.cancel(self._count_request)
+        self._blocks.clear()
+        self._cursors = {0: None}
+        self._generation += 1
+        generation = self._generation
+
+        def count_and_first_block(session):
+            service = TrackReadService(session)
+            return service.count_tracks(), service.get_tracks_page(None, self.BLOCK_SIZE)
+
+        self.loading_changed.emit(True)
+        self._count_request = self.query_executor.submit(
+            count_and_first_block,
+            on_result=lambda result: self._on_count(generation, *result),
+            on_error=lambda message: self._on_count_failed(generation, message),
+            priority=1,
+        )
+
+
+    def set_tracks(self, tracks: list[Track]):
+        self.reload()
+
+
+    def upsert_tracks(self, tracks: list[Track]):
+        self.reload()
+
+
+    def remove_paths(self, file_paths: list[str]):
+        self.reload()
+
+
+    # ================ #
+    #      Helpers     #
+    # ================ #
+    def _block(self, number: int) -> Optional[TrackStore]:
+        """Retourne un bloc de lignes depuis le cache ; sinon demande sa lecture et retourne None."""
+        block = self._blocks.get(number)
+        if block is not None:
+            self._blocks.move_to_end(number)
+            return block
+
+        # Le premier bloc arrive avec le comptage
+        if number not in self._pending and not (number == 0 and self._count_request is not None):
+            self._request_block(number)
+        return None
+
+
+    def _request_block(self, number: int) -> None:
+        generation = self._generation
+        cursor_known = number in self._cursors
+        cursor = self._cursors.get(number)
+        position = number * self.BLOCK_SIZE
+        size = self.BLOCK_SIZE
+
+        def read_block(session):
+            service = TrackReadService(session)
+            if cursor_known:
+                return service.get_tracks_page(cursor, size)
+            return service.get_tracks_window(position, size)
+
+        self._pending[number] = self.query_executor.submit(
+            read_block,
+            on_result=lambda page: self._on_block(generation, number, page),
+            on_error=lambda message: self._on_block_failed(generation, number, message),
+        )
+
+        while len(self._pending) > self.MAX_PENDING:
+            _, key = self._pending.popitem(last=False)
+            self.query_executor.cancel(key)
+
+
+    def _on_count(self, generation: int, count: int, first_page: Page[Track]) -> None:
+        if generation != self._generation:
+            return
+        self._count_request = None
+
+        if count > self._count:
+            self.beginInsertRows(QModelIndex(), self._count, count - 1)
+            self._count = count
+            self.endInsertRows()
+        elif count < self._count:
+            self.beginRemoveRows(QModelIndex(), count, self._count - 1)
+            self._count = count
+            self.endRemoveRows()
+
+        self.loading_changed.emit(False)
+        self._on_block(generation, 0, first_page)
+        if self._count:
+            # Lignes lues avant le rechargement : à relire
+            self.dataChanged.emit(self.index(0, 0), self.index(self._count - 1, self.columnCount() - 1))
+        logger.debug(f"LazyTracksTableModel : {self._count} pistes")
+
+
+    def _on_block(self, generation: int, number: int, page: Page[Track]) -> None:
+        if generation != self._generation:
+            return
+
+        self._pending.pop(number, None)
+        if page.next_cursor is not None:
+            self._cursors[number + 1] = page.next_cursor
+
+        self._blocks[number] = TrackStore(page.items)
+        if len(self._blocks) > self.MAX_BLOCKS:
+            self._blocks.popitem(last=False)
+
+        first = number * self.BLOCK_SIZE
+        last = min(first + self.BLOCK_SIZE, self._count) - 1
+        if last >= first:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+
+
+    def _on_count_failed(self, generation: int, message: str) -> None:
+        if generation != self._generation:
+            return
+        self._count_request = None
+        self.loading_changed.emit(False)
+        logger.error(f"LazyTracksTableModel : Échec du comptage des pistes : {message}")
+
+
+    def _on_block_failed(self, generation: int, number: int, message: str) -> None:
+        if generation != self._generation:
+            return
+        self._pending.pop(number, None)
+        # Lignes laissées vides jusqu'au prochain rechargement (pas de nouvel essai à chaque affichage)
+        self._blocks[number] = TrackStore()
+        logger.error(f"LazyTracksTableModel : Échec de lecture du bloc {number} : {message}")
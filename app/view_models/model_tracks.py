@@ -1,21 +1,30 @@
 # app/view_models/model_tracks.py
 
+from dataclasses import replace
+
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 
 
+from app.view_models.track_store import TrackRow, TrackStore
 from core.entities.track import Track
 
 
 class TracksTableModel(QAbstractTableModel):
     """
     Modélisation de l'affichage des tarcks de funkytunes
+
+    Les lignes sont gardées dans un TrackStore (colonnes compactes) ;
+    track_at en rend une vue TrackRow. Un TrackStore reçu (instantané du
+    LibraryCache) est partagé, et copié seulement avant d'être modifié.
     """
     
     HEADERS = ["Pistes", "Titre", "Artiste", "Album", "Durée", "Année"]
     
     def __init__(self, tracks: list[Track] | None = None, parent = None):
         super().__init__(parent)
-        self._tracks: list[Track] = tracks or []
+        self._tracks: TrackStore = TrackStore(tracks or [])
+        # Store reçu de l'appelant : à copier avant toute modification
+        self._shared = False
         
         
     def rowCount(self, parent=QModelIndex()) -> int:
@@ -26,7 +35,7 @@ class TracksTableModel(QAbstractTableModel):
         return len(self.HEADERS)
 
     
-    def track_at(self, row: int) -> Track:
+    def track_at(self, row: int) -> TrackRow | None:
         return self._tracks[row]
 
 
@@ -34,7 +43,9 @@ class TracksTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
         
-        track = self._tracks[index.row()]
+        track = self.track_at(index.row())
+        if track is None:
+            return None
         column = index.column()
         
         if role == Qt.TextAlignmentRole:
@@ -66,7 +77,7 @@ class TracksTableModel(QAbstractTableModel):
     # ================ #
     #      Helpers     #
     # ================ #
-    def _data_for_column(self, track: Track, column: int):
+    def _data_for_column(self, track: TrackRow, column: int):
         match column:
             case 0: return track.counttrack
             case 1: return track.title
@@ -84,10 +95,80 @@ class TracksTableModel(QAbstractTableModel):
     
     
     # Mise à jour de la bibliothèque
-    def set_tracks(self, tracks: list[Track]):
+    def set_tracks(self, tracks: list[Track] | TrackStore):
         self.beginResetModel()
-        self._tracks = tracks
+        self._shared = isinstance(tracks, TrackStore)
+        self._tracks = tracks if self._shared else TrackStore(tracks)
         self.endResetModel()
+
+
+    def share_tracks(self, tracks: TrackStore) -> bool:
+        """
+        Adopte un store aux mêmes lignes que la table (instantané du LibraryCache
+        à la fin d'un chargement progressif) : la copie de la table est libérée,
+        sans réinitialiser l'affichage.
+
+        Returns:
+            bool : False si le nombre de lignes diffère (store non adopté)
+        """
+        if len(tracks) != len(self._tracks):
+            return False
+        self._tracks = tracks
+        self._shared = True
+        return True
+
+
+    def _own_tracks(self) -> TrackStore:
+        """Store modifiable : copie d'un store partagé."""
+        if self._shared:
+            self._tracks = TrackStore(self._tracks)
+            self._shared = False
+        return self._tracks
+
+
+    def append_tracks(self, tracks: list[Track]):
+        """Ajoute des lignes en fin de table (pages suivantes d'un chargement progressif)."""
+        if not tracks:
+            return
+        first = len(self._tracks)
+        self.beginInsertRows(QModelIndex(), first, first + len(tracks) - 1)
+        self._own_tracks().extend(tracks)
+        self.endInsertRows()
+
+
+    # Mise à jour incrémentale (surveillance des dossiers)
+    def upsert_tracks(self, tracks: list[Track]):
+        """Remplace les lignes existantes (même fichier) et ajoute les nouvelles en fin de table."""
+        rows = {t.file_path: row for row, t in enumerate(self._tracks)}
+        new_tracks = []
+        self._own_tracks()
+
+        for track in tracks:
+            row = rows.get(track.file_path)
+            if row is None:
+                new_tracks.append(track)
+                continue
+            self._tracks.set(row, track)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+        if new_tracks:
+            first = len(self._tracks)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_tracks) - 1)
+            self._tracks.extend(
+                replace(track, counttrack=first + i) for i, track in enumerate(new_tracks, start=1)
+            )
+            self.endInsertRows()
+
+
+    def remove_paths(self, file_paths: list[str]):
+        """Retire les lignes dont le fichier a été supprimé."""
+        removed = set(file_paths)
+        self._own_tracks()
+        for row in reversed(range(len(self._tracks))):
+            if self._tracks[row].file_path in removed:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                self._tracks.delete(row)
+                self.endRemoveRows()
         
         
  
@@ -0,0 +1,318 @@
+# app/view_models/track_store.py
+
+"""
+Stockage compact des lignes de pistes affichées (TracksTableModel).
+
+Une piste n'est pas gardée comme un objet par ligne mais en colonnes :
+    - identifiants, numéros, durées, années, albums (id) et favoris dans des
+      tableaux typés (array)
+    - artistes, albums, genres, pochettes et dossiers internés : chaque valeur
+      distincte n'est stockée qu'une fois, la ligne en garde l'indice
+    - titres et noms de fichiers encodés en UTF-8 dans un seul tampon
+
+Une ligne coûte ainsi une centaine d'octets (titre compris), contre près de
+500 pour une Track et ses chaînes. Les lignes sont lues au travers de vues
+TrackRow (__slots__), créées à la demande ; to_track en fait une copie complète.
+"""
+
+from array import array
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from core.entities.track import Track
+
+
+# Année inconnue dans le tableau des années
+_NO_YEAR = 0
+# Piste sans album dans le tableau des identifiants d'album
+_NO_ALBUM = -1
+UNKNOWN_YEAR = "Indisponible"
+
+
+def _split_path(file_path: str):
+    """Sépare dossier (séparateur final compris) et nom de fichier : dossier + nom == file_path."""
+    cut = max(file_path.rfind("/"), file_path.rfind("\\")) + 1
+    return file_path[:cut], file_path[cut:]
+
+
+class _StringPool:
+    """Valeurs distinctes (artistes, albums, genres, pochettes, dossiers) ; une ligne en garde l'indice, -1 pour None."""
+
+    __slots__ = ("_values", "_indexes")
+
+    def __init__(self):
+        self._values: List[str] = []
+        self._indexes: Dict[str, int] = {}
+
+    def index(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        index = self._indexes.get(value)
+        if index is None:
+            index = len(self._values)
+            self._values.append(value)
+            self._indexes[value] = index
+        return index
+
+    def indexes(self, values: Iterable[Optional[str]]) -> array:
+        """index() de chaque valeur, en un tableau."""
+        known, pool = self._indexes, self._values
+        result = array("i")
+        append = result.append
+        for value in values:
+            if value is None:
+                append(-1)
+                continue
+            index = known.get(value)
+            if index is None:
+                index = known[value] = len(pool)
+                pool.append(value)
+            append(index)
+        return result
+
+    def value(self, index: int) -> Optional[str]:
+        return self._values[index] if index >= 0 else None
+
+
+class _TextColumn:
+    """
+    Textes d'une colonne encodés dans un tampon unique (début et longueur par ligne).
+
+    Un texte remplacé est ajouté en fin de tampon ; l'ancien reste en place
+    jusqu'à la reconstruction du store (set_tracks).
+    """
+
+    __slots__ = ("_buffer", "_starts", "_lengths")
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._starts = array("I")
+        self._lengths = array("I")
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _encode(self, text: str):
+        data = text.encode("utf-8")
+        start = len(self._buffer)
+        self._buffer += data
+        return start, len(data)
+
+    def extend(self, texts: List[str]) -> None:
+        encoded = [text.encode("utf-8") for text in texts]
+        lengths = array("I", map(len, encoded))
+        start = len(self._buffer)
+        starts = array("I", accumulate(lengths, initial=start))
+        starts.pop()
+        self._buffer += b"".join(encoded)
+        self._starts.extend(starts)
+        self._lengths.extend(lengths)
+
+    def set(self, row: int, text: str) -> None:
+        self._starts[row], self._lengths[row] = self._encode(text)
+
+    def delete(self, row: int) -> None:
+        del self._starts[row]
+        del self._lengths[row]
+
+    def get(self, row: int) -> str:
+        start = self._starts[row]
+        return self._buffer[start:start + self._lengths[row]].decode("utf-8")
+
+
+class TrackRow:
+    """
+    Vue d'une ligne du store, aux attributs d'une Track.
+
+    Valable jusqu'à la prochaine modification du store (les lignes suivant
+    une ligne retirée changent d'indice).
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "TrackStore", row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def id(self) -> int:
+        return self._store._ids[self._row]
+
+    @property
+    def counttrack(self) -> int:
+        return self._store._counttracks[self._row]
+
+    @property
+    def title(self) -> str:
+        return self._store._titles.get(self._row)
+
+    @property
+    def file_path(self) -> str:
+        store = self._store
+        return store._strings.value(store._dirs[self._row]) + store._file_names.get(self._row)
+
+    @property
+    def artist(self) -> Optional[str]:
+        return self._store._strings.value(self._store._artists[self._row])
+
+    @property
+    def album(self) -> Optional[str]:
+        return self._store._strings.value(self._store._albums[self._row])
+
+    @property
+    def duration(self) -> int:
+        return self._store._durations[self._row]
+
+    @property
+    def year(self) -> Union[int, str]:
+        year = self._store._years[self._row]
+        return year if year != _NO_YEAR else UNKNOWN_YEAR
+
+    @property
+    def album_id(self) -> Optional[int]:
+        album_id = self._store._album_ids[self._row]
+        return album_id if album_id != _NO_ALBUM else None
+
+    @property
+    def jacket_path(self) -> Optional[str]:
+        return self._store._strings.value(self._store._jackets[self._row])
+
+    @property
+    def genre(self) -> Optional[str]:
+        return self._store._strings.value(self._store._genres[self._row])
+
+    @property
+    def is_favorite(self) -> bool:
+        return bool(self._store._favorites[self._row])
+
+    def to_track(self) -> Track:
+        """Copie la ligne dans une Track (hors du store), tous les champs compris."""
+        return Track(
+            id=self.id, counttrack=self.counttrack, title=self.title, file_path=self.file_path,
+            artist=self.artist, album=self.album, duration=self.duration, year=self.year,
+            album_id=self.album_id, jacket_path=self.jacket_path, genre=self.genre,
+            is_favorite=self.is_favorite
+        )
+
+    def __repr__(self) -> str:
+        return f"<TrackRow(row={self._row}, title='{self.title}')>"
+
+
+class TrackStore:
+    """
+    Lignes de pistes stockées en colonnes.
+
+    Rôle :
+        - Recevoir des Track (ou des TrackRow) et en garder tous les champs
+        - Rendre chaque ligne sous forme de TrackRow
+        - Ajouter, remplacer et retirer des lignes (mises à jour incrémentales)
+    """
+
+    __slots__ = (
+        "_ids", "_counttracks", "_durations", "_years", "_album_ids", "_favorites",
+        "_artists", "_albums", "_genres", "_jackets", "_dirs", "_strings",
+        "_titles", "_file_names",
+    )
+
+    def __init__(self, tracks: Iterable[Track] = ()):
+        self._ids = array("q")
+        self._counttracks = array("i")
+        self._durations = array("i")
+        self._years = array("h")
+        self._album_ids = array("q")
+        self._favorites = array("b")
+        # Indices dans _strings
+        self._artists = array("i")
+        self._albums = array("i")
+        self._genres = array("i")
+        self._jackets = array("i")
+        self._dirs = array("i")
+        self._strings = _StringPool()
+        self._titles = _TextColumn()
+        self._file_names = _TextColumn()
+        self.extend(tracks)
+
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+    def __getitem__(self, row: int) -> TrackRow:
+        if not 0 <= row < len(self._ids):
+            raise IndexError(row)
+        return TrackRow(self, row)
+
+
+    def __iter__(self) -> Iterator[TrackRow]:
+        return (TrackRow(self, row) for row in range(len(self._ids)))
+
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> List[TrackRow]:
+        """Vues des lignes start à stop (exclue), jusqu'à la fin par défaut."""
+        stop = len(self._ids) if stop is None else min(stop, len(self._ids))
+        return [TrackRow(self, row) for row in range(max(0, start), stop)]
+
+
+    # ================ #
+    #   Modification   #
+    # ================ #
+    def extend(self, tracks: Iterable[Track]) -> None:
+        """Ajoute des lignes en fin de store (colonne par colonne)."""
+        tracks = list(tracks)
+        strings = self._strings
+        file_paths = [t.file_path for t in tracks]
+        # Dossier (séparateur final compris) et nom de fichier, comme _split_path
+        cuts = [max(path.rfind("/"), path.rfind("\\")) + 1 for path in file_paths]
+
+        self._ids.extend([t.id for t in tracks])
+        self._counttracks.extend([t.counttrack for t in tracks])
+        self._durations.extend([t.duration or 0 for t in tracks])
+        self._years.extend([self._year(t.year) for t in tracks])
+        self._album_ids.extend([self._album_id(t.album_id) for t in tracks])
+        self._favorites.extend([1 if t.is_favorite else 0 for t in tracks])
+        self._artists.extend(strings.indexes(t.artist for t in tracks))
+        self._albums.extend(strings.indexes(t.album for t in tracks))
+        self._genres.extend(strings.indexes(t.genre for t in tracks))
+        self._jackets.extend(strings.indexes(t.jacket_path for t in tracks))
+        self._dirs.extend(strings.indexes(path[:cut] for path, cut in zip(file_paths, cuts)))
+        self._titles.extend([t.title or "" for t in tracks])
+        self._file_names.extend([path[cut:] for path, cut in zip(file_paths, cuts)])
+
+
+    def set(self, row: int, track: Track, counttrack: Optional[int] = None) -> None:
+        """Remplace la ligne row ; counttrack conservé si None."""
+        strings = self._strings
+        directory, file_name = _split_path(track.file_path)
+        self._ids[row] = track.id
+        if counttrack is not None:
+            self._counttracks[row] = counttrack
+        self._durations[row] = track.duration or 0
+        self._years[row] = self._year(track.year)
+        self._album_ids[row] = self._album_id(track.album_id)
+        self._favorites[row] = 1 if track.is_favorite else 0
+        self._artists[row] = strings.index(track.artist)
+        self._albums[row] = strings.index(track.album)
+        self._genres[row] = strings.index(track.genre)
+        self._jackets[row] = strings.index(track.jacket_path)
+        self._dirs[row] = strings.index(directory)
+        self._titles.set(row, track.title or "")
+        self._file_names.set(row, file_name)
+
+
+    def delete(self, row: int) -> None:
+        for column in (
+            self._ids, self._counttracks, self._durations, self._years, self._album_ids, self._favorites,
+            self._artists, self._albums, self._genres, self._jackets, self._dirs,
+        ):
+            del column[row]
+        self._titles.delete(row)
+        self._file_names.delete(row)
+
+
+    @staticmethod
+    def _year(year) -> int:
+        return year if isinstance(year, int) and 0 < year < 2 ** 15 else _NO_YEAR
+
+    @staticmethod
+    def _album_id(album_id: Optional[int]) -> int:
+        return album_id if album_id is not None else _NO_ALBUM
@@ -0,0 +1,212 @@
+# benchmarks/bench_import.py
+
+
+"""
+Benchmark de débit de l'import, sans interface (aucune fenêtre Qt).
+
+Rôle :
+- Générer un corpus synthétique (taille, formats et forme d'arborescence configurables)
+- Mesurer chaque phase isolément sur une base SQLite temporaire :
+    scan (FileImporter.scan_directory), extraction (ParallelMetadataExtractor),
+    écriture (DBImporter.import_batch)
+- Mesurer l'import complet (LibraryServices.import_from_directory), puis un
+  réimport incrémental sans changement
+- Afficher fichiers/s, durée, requêtes SQL et pic de mémoire (RSS) par phase,
+  éventuellement en JSON pour comparer deux versions
+
+Usage :
+    python -m benchmarks.bench_import --files 5000 --workers 4
+    python -m benchmarks.bench_import --files 2000 --flat --json resultats.json
+"""
+
+import os
+import json
+import time
+import logging
+import argparse
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.corpus import FORMATS, CorpusSpec, generate_corpus
+from database.engine import DEFAULT_PROFILE, SQLiteProfile, create_sqlite_engine
+from database.migrations import migrate
+from app.application.import_track.file_importer import FileImporter
+from app.application.import_track.metadata_extractor import ParallelMetadataExtractor
+from app.application.import_track.db_importer import DBImporter
+from app.application.import_track.duplicate_detector import DuplicatePolicy
+from services.file_services.library_services.library_services import LibraryServices
+
+from core.logger import logger
+
+
+@dataclass
+class PhaseResult:
+    """Mesures d'une phase."""
+    phase: str
+    files: int
+    seconds: float
+    queries: int
+    peak_rss_mb: Optional[float]
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds else 0.0
+
+
+class QueryCounter:
+    """Compte les requêtes émises par un engine (un executemany compte pour une)."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Pic de mémoire résidente du process et de ses workers (Mo), si mesurable."""
+    if resource is None:
+        return None
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # ru_maxrss : kilo-octets sous Linux, octets sous macOS
+    scale = 1024 * 1024 if os.uname().sysname == "Darwin" else 1024
+    return max(own, children) / scale
+
+
+def _session_factory(db_path: str, profile: SQLiteProfile = DEFAULT_PROFILE, echo: bool = False):
+    """Base SQLite neuve (pragmas du profil, ceux de l'application par défaut), avec compteur de requêtes."""
+    engine = create_sqlite_engine(f"sqlite:///{db_path}", profile, echo=echo)
+    migrate(engine)
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False), QueryCounter(engine)
+
+
+@contextmanager
+def _measure(results: List[PhaseResult], phase: str, counter: Optional[QueryCounter] = None) -> Iterator[dict]:
+    """Chronomètre un bloc ; le bloc renseigne state["files"]."""
+    state = {"files": 0}
+    queries_before = counter.count if counter else 0
+    start = time.perf_counter()
+    yield state
+    elapsed = time.perf_counter() - start
+    queries = (counter.count - queries_before) if counter else 0
+    results.append(PhaseResult(phase, state["files"], elapsed, queries, _peak_rss_mb()))
+
+
+def run(spec: CorpusSpec, workers: Optional[int], workdir: str) -> List[PhaseResult]:
+    """Exécute toutes les mesures dans workdir et retourne les résultats par phase."""
+    corpus = os.path.join(workdir, "corpus")
+    results: List[PhaseResult] = []
+
+    print(f"Génération de {spec.files} fichiers ({', '.join(spec.formats)})...")
+    generate_corpus(corpus, spec)
+
+    # Phase 1 : scan seul
+    with _measure(results, "scan") as state:
+        paths = list(FileImporter().scan_directory(corpus))
+        state["files"] = len(paths)
+
+    # Phase 2 : extraction seule
+    metadata = []
+    with _measure(results, "extraction") as state:
+        extractor = ParallelMetadataExtractor(workers=workers)
+        for batch, errors in extractor.extract(paths):
+            metadata.extend(batch)
+            state["files"] += len(batch) + len(errors)
+
+    # Phase 3 : écriture en base seule
+    session_factory, counter = _session_factory(os.path.join(workdir, "write.db"))
+    with _measure(results, "écriture base", counter) as state:
+        with session_factory() as session:
+            state["files"] = DBImporter(session).import_batch(metadata).imported
+
+    # Import complet puis réimport incrémental, sur une autre base
+    session_factory, counter = _session_factory(os.path.join(workdir, "import.db"))
+    # REPORT : tout le corpus est importé, même si des fichiers se révélaient identiques
+    library = LibraryServices(session_factory, extraction_workers=workers, duplicate_policy=DuplicatePolicy.REPORT)
+
+    with _measure(results, "import complet", counter) as state:
+        result = library.import_from_directory(corpus)
+        state["files"] = result.imported + len(result.errors)
+    _check_imported(result.imported, spec.files)
+
+    with _measure(results, "réimport incrémental", counter) as state:
+        result = library.import_from_directory(corpus, incremental=True)
+        state["files"] = result.skipped + result.updated + result.imported
+
+    return results
+
+
+def _check_imported(imported: int, expected: int) -> None:
+    """Un import partiel fausse les mesures des phases suivantes : le run échoue."""
+    if imported != expected:
+        raise RuntimeError(f"Import complet : {imported}/{expected} fichiers importés, mesures non comparables")
+
+
+def _print_results(results: List[PhaseResult]) -> None:
+    print(f"\n{'phase':<22}{'fichiers':>10}{'durée (s)':>12}{'fichiers/s':>12}{'requêtes':>10}{'pic RSS (Mo)':>14}")
+    for r in results:
+        rss = f"{r.peak_rss_mb:.0f}" if r.peak_rss_mb is not None else "n/a"
+        print(f"{r.phase:<22}{r.files:>10}{r.seconds:>12.3f}{r.files_per_second:>12.0f}{r.queries:>10}{rss:>14}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de débit de l'import")
+    parser.add_argument("--files", type=int, default=1000, help="nombre de fichiers du corpus")
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS), choices=FORMATS)
+    parser.add_argument("--tracks-per-album", type=int, default=12)
+    parser.add_argument("--albums-per-artist", type=int, default=3)
+    parser.add_argument("--flat", action="store_true", help="tous les fichiers dans un seul dossier")
+    parser.add_argument("--cover-bytes", type=int, default=0, help="taille de la pochette embarquée")
+    parser.add_argument("--workers", type=int, default=None, help="process d'extraction (défaut : nb de cœurs)")
+    parser.add_argument("--keep", metavar="DOSSIER", help="dossier de travail conservé (défaut : temporaire)")
+    parser.add_argument("--json", metavar="FICHIER", help="écrit aussi les résultats en JSON")
+    args = parser.parse_args()
+
+    # Les traces par fichier fausseraient la mesure
+    logger.setLevel(logging.WARNING)
+
+    spec = CorpusSpec(
+        files=args.files,
+        formats=args.formats,
+        tracks_per_album=args.tracks_per_album,
+        albums_per_artist=args.albums_per_artist,
+        cover_bytes=args.cover_bytes,
+        flat=args.flat,
+    )
+
+    if args.keep:
+        os.makedirs(args.keep, exist_ok=True)
+        results = run(spec, args.workers, args.keep)
+    else:
+        with tempfile.TemporaryDirectory(prefix="funkytunes-bench-") as workdir:
+            results = run(spec, args.workers, workdir)
+
+    _print_results(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "spec": {**asdict(spec), "formats": list(spec.formats)},
+                    "workers": args.workers,
+                    "phases": [{**asdict(r), "files_per_second": r.files_per_second} for r in results],
+                },
+                f, indent=2, ensure_ascii=False
+            )
+        print(f"\nRésultats écrits dans {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# benchmarks/bench_search.py
+
+
+"""
+Benchmark de la recherche plein texte (SearchService, index FTS5 tracks_search).
+
+Rôle :
+- Remplir une base migrée avec une bibliothèque synthétique (lignes SQL
+  directes, sans fichiers audio) : l'index est tenu à jour par les triggers
+- Chronométrer des saisies typiques (préfixes courts, mots complets,
+  accents omis, plusieurs mots) : identifiants classés seuls, puis pistes
+  chargées pour l'affichage
+- Comparer au filtrage d'origine : parcours Python de toutes les pistes
+  chargées, à chaque frappe
+
+Usage :
+    python -m benchmarks.bench_search --tracks 500000
+"""
+
+import os
+import re
+import time
+import random
+import itertools
+import logging
+import argparse
+import tempfile
+import statistics
+from typing import Callable, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from database.engine import create_sqlite_engine
+from database.migrations import migrate
+from services.file_services.library_services.search_service import SearchService
+
+from core.logger import logger
+
+
+COMMON_WORDS = [
+    "amour", "été", "soleil", "nuit", "rêve", "cœur", "ciel", "mer", "feu", "lumière",
+    "danse", "funky", "groove", "soul", "jazz", "blue", "night", "love", "city", "dream",
+    "beyoncé", "édith", "garçon", "déjà", "café", "noël", "fiancé", "naïve", "über", "señor",
+]
+SYLLABLES = ["ka", "lo", "mi", "ré", "su", "ta", "vi", "no", "bé", "za", "po", "fu", "ri", "da", "xo", "lé"]
+
+QUERIES = ["a", "lu", "fun", "lumiere", "beyonce cafe", "edith", "soul groove night", "kalo", "zzz"]
+
+
+def _vocabulary(rng: random.Random, size: int) -> List[str]:
+    """Mots courants puis mots rares générés : tirés selon une loi de Zipf (rang 1 = le plus fréquent)."""
+    words = list(COMMON_WORDS)
+    while len(words) < size:
+        words.append("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return words
+
+
+def _title(rng: random.Random, words: int, vocabulary: List[str], cum_weights: List[float]) -> str:
+    return " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=words)).capitalize()
+
+
+def populate(session_factory, tracks: int, seed: int = 1) -> float:
+    """Insère la bibliothèque synthétique ; retourne la durée d'écriture (triggers compris)."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng, 20000)
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+    artists = max(1, tracks // 100)
+    albums = max(1, tracks // 10)
+
+    start = time.perf_counter()
+    with session_factory() as session:
+        session.execute(
+            text("INSERT INTO artists (id, name) VALUES (:id, :name)"),
+            [{"id": i, "name": f"{_title(rng, 2, vocabulary, cum_weights)} {i}"} for i in range(1, artists + 1)],
+        )
+        session.execute(
+            text("INSERT INTO albums (id, title, artist_id) VALUES (:id, :title, :artist_id)"),
+            [{"id": i, "title": f"{_title(rng, 3, vocabulary, cum_weights)} {i}", "artist_id": (i % artists) + 1} for i in range(1, albums + 1)],
+        )
+        session.execute(
+            text(
+                "INSERT INTO tracks (id, title, file_path, track_number, is_favorite, artist_id, album_id) "
+                "VALUES (:id, :title, :file_path, :track_number, 0, :artist_id, :album_id)"
+            ),
+            [
+                {
+                    "id": i, "title": _title(rng, rng.randint(1, 4), vocabulary, cum_weights), "file_path": f"/musique/{i}.mp3",
+                    "track_number": i // albums + 1, "artist_id": (i % albums) % artists + 1,
+                    "album_id": i % albums + 1,
+                }
+                for i in range(1, tracks + 1)
+            ],
+        )
+        session.commit()
+    return time.perf_counter() - start
+
+
+def _median_ms(action: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = action()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def _python_filter(rows: List[Tuple[str, str, str]], user_text: str) -> int:
+    """Filtrage d'origine : expression régulière sur chaque ligne chargée."""
+    pattern = re.compile(re.escape(user_text), re.IGNORECASE)
+    return sum(1 for row in rows if any(pattern.search(value) for value in row))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recherche plein texte : latence par saisie")
+    parser.add_argument("--tracks", type=int, default=100000, help="nombre de pistes")
+    parser.add_argument("--repeat", type=int, default=5, help="mesures par saisie (médiane retenue)")
+    parser.add_argument("--limit", type=int, default=SearchService.DEFAULT_LIMIT, help="résultats par recherche")
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory(prefix="funkytunes-bench-") as workdir:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(workdir, 'search.db')}")
+        migrate(engine)
+        session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+        print(f"Insertion de {args.tracks} pistes...")
+        seconds = populate(session_factory, args.tracks)
+        print(f"  {seconds:.2f} s ({args.tracks / seconds:.0f} pistes/s, index plein texte compris)")
+
+        with session_factory() as session:
+            rows = session.execute(text(
+                "SELECT t.title, ar.name, al.title FROM tracks t "
+                "JOIN artists ar ON ar.id = t.artist_id JOIN albums al ON al.id = t.album_id"
+            )).all()
+
+            print(f"\n{'saisie':<22}{'résultats':>10}{'ids (ms)':>12}{'pistes (ms)':>14}{'filtre Python (ms)':>20}")
+            for user_text in QUERIES:
+                service = SearchService(session)
+                ids_ms, ids = _median_ms(lambda: service.search_ids(user_text, args.limit), args.repeat)
+                tracks_ms, _ = _median_ms(lambda: service.search(user_text, args.limit), args.repeat)
+                python_ms, _ = _median_ms(lambda: _python_filter(rows, user_text), 1)
+                print(f"{user_text:<22}{len(ids):>10}{ids_ms:>12.2f}{tracks_ms:>14.2f}{python_ms:>20.1f}")
+                session.expunge_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# benchmarks/bench_sqlite_profile.py
+
+
+"""
+Benchmark des pragmas SQLite : configuration d'origine contre le profil de l'application.
+
+Rôle :
+- Générer un corpus synthétique, une seule fois
+- Pour chaque configuration, sur une base neuve : d'origine (pragmas par défaut
+  de SQLite et écho SQL, sortie jetée), pragmas par défaut sans écho, puis
+  database.engine.DEFAULT_PROFILE :
+    import complet, réimport incrémental, synchronisations fichier par fichier
+    (un commit chacune, comme la surveillance des dossiers) et chargement de la
+    bibliothèque (TrackReadService.get_tracks, meilleur temps sur --repeat passes)
+- Afficher les mesures côte à côte et le gain du profil
+
+Usage :
+    python -m benchmarks.bench_sqlite_profile --files 2000 --syncs 200
+"""
+
+import os
+import logging
+import argparse
+import tempfile
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.corpus import FORMATS, CorpusSpec, generate_corpus
+from benchmarks.bench_import import PhaseResult, _check_imported, _measure, _session_factory
+from database.engine import DEFAULT_PROFILE, SQLITE_DEFAULTS, SQLiteProfile
+from app.application.import_track.duplicate_detector import DuplicatePolicy
+from app.application.import_track.file_importer import FileImporter
+from services.file_services.library_services.library_services import LibraryServices
+from services.file_services.library_services.track_read_service import TrackReadService
+
+from core.logger import logger
+
+
+# Nom -> (pragmas, écho SQL)
+PROFILES: Dict[str, Tuple[SQLiteProfile, bool]] = {
+    "d'origine": (SQLITE_DEFAULTS, True),
+    "sans écho": (SQLITE_DEFAULTS, False),
+    "application": (DEFAULT_PROFILE, False),
+}
+
+
+def run_profile(
+    profile: SQLiteProfile,
+    echo: bool,
+    corpus: str,
+    files: int,
+    db_path: str,
+    workers: Optional[int],
+    syncs: int,
+    repeat: int
+) -> List[PhaseResult]:
+    """Mesure les phases d'un profil sur une base neuve."""
+    results: List[PhaseResult] = []
+    session_factory, counter = _session_factory(db_path, profile, echo=echo)
+    library = LibraryServices(
+        session_factory, extraction_workers=workers,
+        duplicate_policy=DuplicatePolicy.REPORT, extract_covers=False
+    )
+
+    with _measure(results, "import complet", counter) as state:
+        result = library.import_from_directory(corpus)
+        state["files"] = result.imported + len(result.errors)
+    _check_imported(result.imported, files)
+
+    with _measure(results, "réimport incrémental", counter) as state:
+        result = library.import_from_directory(corpus, incremental=True)
+        state["files"] = result.skipped + result.updated + result.imported
+
+    paths = sorted(FileImporter().scan_directory(corpus))[:syncs]
+    with _measure(results, "sync unitaire", counter) as state:
+        for path in paths:
+            library.sync_paths([path], [])
+        state["files"] = len(paths)
+
+    best: Optional[PhaseResult] = None
+    for _ in range(repeat):
+        loads: List[PhaseResult] = []
+        with _measure(loads, "chargement", counter) as state:
+            with session_factory() as session:
+                state["files"] = len(TrackReadService(session).get_tracks())
+        if best is None or loads[0].seconds < best.seconds:
+            best = loads[0]
+    results.append(best)
+
+    return results
+
+
+def _print_comparison(measures: Dict[str, List[PhaseResult]]) -> None:
+    names = list(measures)
+    header = f"{'phase':<22}{'fichiers':>10}" + "".join(f"{name + ' (s)':>22}" for name in names) + f"{'gain':>8}"
+    print("\n" + header)
+    for rows in zip(*measures.values()):
+        before, after = rows[0], rows[-1]
+        gain = before.seconds / after.seconds if after.seconds else 0.0
+        timings = "".join(f"{r.seconds:>22.3f}" for r in rows)
+        print(f"{before.phase:<22}{before.files:>10}{timings}{gain:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pragmas SQLite par défaut contre profil de l'application")
+    parser.add_argument("--files", type=int, default=1000, help="nombre de fichiers du corpus")
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS), choices=FORMATS)
+    parser.add_argument("--syncs", type=int, default=100, help="synchronisations unitaires mesurées")
+    parser.add_argument("--repeat", type=int, default=3, help="passes de chargement (meilleure retenue)")
+    parser.add_argument("--workers", type=int, default=None, help="process d'extraction (défaut : nb de cœurs)")
+    args = parser.parse_args()
+
+    # Les traces par fichier fausseraient la mesure
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory(prefix="funkytunes-bench-") as workdir:
+        corpus = os.path.join(workdir, "corpus")
+        print(f"Génération de {args.files} fichiers ({', '.join(args.formats)})...")
+        generate_corpus(corpus, CorpusSpec(files=args.files, formats=args.formats))
+
+        measures: Dict[str, List[PhaseResult]] = {}
+        for index, (name, (profile, echo)) in enumerate(PROFILES.items()):
+            print(f"Profil {name}...")
+            db_path = os.path.join(workdir, f"profile-{index}.db")
+            # L'écho SQL écrit sur stdout : son coût est mesuré, sa sortie jetée
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                measures[name] = run_profile(
+                    profile, echo, corpus, args.files, db_path, args.workers, args.syncs, args.repeat
+                )
+
+    _print_comparison(measures)
+
+
+if __name__ == "__main__":
+    main()
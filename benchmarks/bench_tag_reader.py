@@ -0,0 +1,92 @@
+# benchmarks/bench_tag_reader.py
+
+
+"""
+Micro-benchmark : lecture rapide des en-têtes (FastTagReader) contre Mutagen.
+
+Rôle :
+- Générer un corpus synthétique (MP3 CBR/Xing, FLAC, Ogg Vorbis, WAV) dans un dossier temporaire
+- Lire chaque fichier par les deux chemins, format par format
+- Vérifier que les deux chemins donnent les mêmes valeurs et afficher fichiers/s et gain
+
+Usage :
+    python -m benchmarks.bench_tag_reader --files 2000 --cover-bytes 200000
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+from benchmarks.corpus import FORMATS, CorpusSpec, generate_corpus
+from app.application.import_track.file_importer import FileImporter
+
+from core.logger import logger
+
+
+def _time_reads(paths: List[str], read: Callable[[str], object], repeat: int) -> float:
+    """Meilleur temps (secondes) sur repeat passes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            read(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _mismatches(paths: List[str], file_importer: FileImporter) -> List[str]:
+    """Fichiers pour lesquels les deux chemins divergent (durée à la microseconde près)."""
+    mismatched = []
+    for path in paths:
+        fast = file_importer.tag_reader.read(path)
+        if fast is None:
+            continue
+        slow = file_importer._read_with_mutagen(path)
+        fast_length, slow_length = fast.pop("length"), slow.pop("length")
+        if fast != slow or abs(fast_length - slow_length) > 1e-6:
+            mismatched.append(path)
+    return mismatched
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FastTagReader contre Mutagen")
+    parser.add_argument("--files", type=int, default=1000, help="nombre de fichiers du corpus")
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS), choices=FORMATS)
+    parser.add_argument("--cover-bytes", type=int, default=0, help="taille de la pochette embarquée")
+    parser.add_argument("--repeat", type=int, default=3, help="passes par mesure (meilleure retenue)")
+    args = parser.parse_args()
+
+    # Les traces par fichier fausseraient la mesure
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory(prefix="funkytunes-tags-") as root:
+        spec = CorpusSpec(files=args.files, formats=args.formats, cover_bytes=args.cover_bytes)
+        print(f"Génération de {spec.files} fichiers ({', '.join(spec.formats)}), pochette {spec.cover_bytes} o...")
+        paths = generate_corpus(root, spec)
+
+        by_format: Dict[str, List[str]] = defaultdict(list)
+        for path in paths:
+            by_format[path.rsplit(".", 1)[-1]].append(path)
+
+        file_importer = FileImporter()
+        reader = file_importer.tag_reader
+
+        print(f"\n{'format':<8}{'fichiers':>10}{'rapide (f/s)':>16}{'mutagen (f/s)':>16}{'gain':>8}{'replis':>8}{'écarts':>8}")
+        for ext, format_paths in sorted(by_format.items()):
+            fast = _time_reads(format_paths, reader.read, args.repeat)
+            slow = _time_reads(format_paths, file_importer._read_with_mutagen, args.repeat)
+            fallbacks = sum(1 for path in format_paths if reader.read(path) is None)
+            mismatched = _mismatches(format_paths, file_importer)
+            print(
+                f"{ext:<8}{len(format_paths):>10}{len(format_paths) / fast:>16.0f}"
+                f"{len(format_paths) / slow:>16.0f}{slow / fast:>7.1f}x{fallbacks:>8}{len(mismatched):>8}"
+            )
+            for path in mismatched[:5]:
+                print(f"    écart : {path}")
+
+
+if __name__ == "__main__":
+    main()
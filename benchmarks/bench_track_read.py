@@ -0,0 +1,116 @@
+# benchmarks/bench_track_read.py
+
+
+"""
+Benchmark des lectures de la bibliothèque : objets ORM contre projections.
+
+Rôle :
+- Remplir une base migrée avec une bibliothèque synthétique (bench_search.populate)
+- Mesurer, pour chaque lecture, le débit (pistes/s, meilleur temps sur
+  --repeat passes) et le pic de mémoire Python (tracemalloc) :
+    pistes d'affichage : get_tracks (TrackORM + joinedload artist/album)
+    contre get_track_rows (colonnes choisies, une jointure, tuples)
+    chemins des fichiers : TrackORM complets contre la seule colonne file_path
+- Mesurer la mémoire des lignes gardées par la table : liste de Track
+  contre TrackStore (colonnes compactes)
+
+Usage :
+    python -m benchmarks.bench_track_read --tracks 200000
+"""
+
+import os
+import gc
+import time
+import logging
+import argparse
+import tempfile
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from sqlalchemy.orm import sessionmaker
+
+from app.view_models.track_store import TrackStore
+from benchmarks.bench_search import populate
+from app.models.track import Track as TrackORM
+from database.engine import create_sqlite_engine
+from database.migrations import migrate
+from services.file_services.library_services.track_read_service import TrackReadService
+
+from core.logger import logger
+
+
+def _orm_file_paths(service: TrackReadService) -> List[str]:
+    """Lecture d'origine des chemins : objets TrackORM complets."""
+    orm_tracks = service.db.query(TrackORM).order_by(TrackORM.album_id, TrackORM.track_number).all()
+    return [t.file_path for t in orm_tracks]
+
+
+READS: List[Tuple[str, Callable[[TrackReadService], list]]] = [
+    ("pistes : ORM (get_tracks)", lambda service: service.get_tracks()),
+    ("pistes : projection (get_track_rows)", lambda service: service.get_track_rows()),
+    ("chemins : ORM", _orm_file_paths),
+    ("chemins : projection", lambda service: service.get_track_file_paths()),
+]
+
+
+def _measure(session_factory, read: Callable[[TrackReadService], list], repeat: int) -> Tuple[float, int, float]:
+    """Retourne (meilleur temps en s, lignes lues, pic mémoire en Mo) ; session neuve à chaque passe."""
+    best, rows = float("inf"), 0
+    for _ in range(repeat):
+        with session_factory() as session:
+            start = time.perf_counter()
+            rows = len(read(TrackReadService(session)))
+            best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    with session_factory() as session:
+        result = read(TrackReadService(session))
+        peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return best, rows, peak / (1024 * 1024)
+
+
+def _retained_mb(build: Callable[[], object]) -> float:
+    """Mémoire Python encore allouée par l'objet construit (Mo)."""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return current / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Lectures de la bibliothèque : ORM contre projections")
+    parser.add_argument("--tracks", type=int, default=100000, help="nombre de pistes")
+    parser.add_argument("--repeat", type=int, default=3, help="passes par lecture (meilleur temps retenu)")
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory(prefix="funkytunes-bench-") as workdir:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(workdir, 'read.db')}")
+        migrate(engine)
+        session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+        print(f"Insertion de {args.tracks} pistes...")
+        populate(session_factory, args.tracks)
+
+        print(f"\n{'lecture':<40}{'temps (s)':>11}{'pistes/s':>12}{'pic mémoire (Mo)':>19}")
+        for name, read in READS:
+            seconds, rows, peak = _measure(session_factory, read, args.repeat)
+            print(f"{name:<40}{seconds:>11.2f}{rows / seconds:>12.0f}{peak:>19.1f}")
+
+        def read_rows() -> list:
+            with session_factory() as session:
+                return TrackReadService(session).get_track_rows()
+
+        print(f"\n{'lignes gardées par la table':<40}{'mémoire (Mo)':>14}")
+        print(f"{'liste de Track':<40}{_retained_mb(read_rows):>14.1f}")
+        print(f"{'TrackStore':<40}{_retained_mb(lambda: TrackStore(read_rows())):>14.1f}")
+
+if __name__ == "__main__":
+    main()
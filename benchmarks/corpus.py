@@ -0,0 +1,256 @@
+# benchmarks/corpus.py
+
+
+"""
+Génération de corpus audio synthétiques pour les benchmarks d'import.
+
+Rôle :
+- Écrire des fichiers MP3, FLAC, OGG (Vorbis) et WAV valides pour Mutagen,
+  sans encodeur : en-têtes et trames construits à la main, audio silencieux.
+- Amorcer la charge audio de chaque fichier (seed) : deux fichiers du corpus
+  ne sont jamais des doublons pour DuplicateDetector, même format et durée.
+- Tagger chaque fichier via Mutagen (titre, artiste, album, date, numéro de piste),
+  avec une pochette embarquée optionnelle.
+- Ranger les fichiers en arborescence artiste / album.
+"""
+
+import os
+import base64
+import struct
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from mutagen.easyid3 import EasyID3
+from mutagen.flac import FLAC, Picture
+from mutagen.id3 import ID3, APIC, TALB, TDRC, TIT2, TPE1, TRCK
+from mutagen.oggvorbis import OggVorbis
+from mutagen.ogg import OggPage
+from mutagen.wave import WAVE
+
+
+FORMATS = ("mp3", "flac", "ogg", "wav")
+
+SAMPLE_RATE = 44100
+
+# Trame MPEG-1 Layer III, 128 kbit/s, 44,1 kHz, stéréo, sans CRC ni padding
+_MP3_HEADER = b"\xff\xfb\x90\x00"
+_MP3_FRAME_LENGTH = 144 * 128000 // SAMPLE_RATE
+_MP3_SAMPLES_PER_FRAME = 1152
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Forme d'un corpus synthétique."""
+    files: int = 1000
+    formats: Sequence[str] = FORMATS
+    tracks_per_album: int = 12
+    albums_per_artist: int = 3
+    seconds: int = 30
+    # Taille de la pochette embarquée (0 = aucune)
+    cover_bytes: int = 0
+    # Tous les fichiers dans un seul dossier (au lieu d'artiste / album)
+    flat: bool = False
+
+
+# ========================== #
+#      Écriture des formats  #
+# ========================== #
+def _cover(size: int) -> bytes:
+    # Faux JPEG : seul le conteneur compte pour les lecteurs de tags
+    return b"\xff\xd8\xff\xe0" + os.urandom(max(0, size - 4))
+
+
+def _payload(size: int, seed: Optional[int]) -> bytes:
+    """Octets audio : silence, ou motif propre à seed (reproductible)."""
+    if seed is None:
+        return bytes(size)
+    block = hashlib.blake2b(seed.to_bytes(8, "little", signed=True), digest_size=16).digest()
+    return (block * (size // len(block) + 1))[:size]
+
+
+def write_mp3(
+    path: str,
+    tags: Dict[str, str],
+    seconds: int,
+    cover_bytes: int = 0,
+    xing: bool = False,
+    seed: Optional[int] = None
+) -> None:
+    """Écrit un MP3 CBR (ou VBR avec en-tête Xing) puis ses tags ID3v2.4."""
+    frames = max(1, seconds * SAMPLE_RATE // _MP3_SAMPLES_PER_FRAME)
+    frame = _MP3_HEADER + bytes(_MP3_FRAME_LENGTH - 4)
+    # Fin de la première trame amorcée (hors en-tête Xing)
+    first = bytearray(frame)
+    first[-16:] = _payload(16, seed)
+
+    with open(path, "wb") as f:
+        if xing:
+            # En-tête Xing à l'offset 36 (MPEG-1 stéréo) : nombre de trames et d'octets
+            first[36:52] = b"Xing" + struct.pack(">III", 0x3, frames, frames * _MP3_FRAME_LENGTH)
+        f.write(first)
+        f.write(frame * (frames - 1))
+
+    audio = EasyID3()
+    audio.update(tags)
+    audio.save(path, v2_version=4)
+
+    if cover_bytes:
+        id3 = ID3(path)
+        id3.add(APIC(encoding=3, mime="image/jpeg", type=3, desc="Cover", data=_cover(cover_bytes)))
+        id3.save(path, v2_version=4)
+
+
+def write_flac(path: str, tags: Dict[str, str], seconds: int, cover_bytes: int = 0, seed: Optional[int] = None) -> None:
+    """Écrit un FLAC (STREAMINFO + padding + trame vide) puis ses Vorbis comments."""
+    total_samples = seconds * SAMPLE_RATE
+    # STREAMINFO : tailles de bloc/trame, puis 20 bits fréquence, 3 bits canaux-1,
+    # 5 bits bits/échantillon-1, 36 bits nombre d'échantillons, MD5
+    packed = (SAMPLE_RATE << 44) | (1 << 41) | (15 << 36) | total_samples
+    streaminfo = struct.pack(">HH", 4096, 4096) + bytes(6) + packed.to_bytes(8, "big") + bytes(16)
+
+    with open(path, "wb") as f:
+        f.write(b"fLaC")
+        f.write(bytes([0]) + len(streaminfo).to_bytes(3, "big") + streaminfo)
+        f.write(bytes([0x80 | 1]) + (1024).to_bytes(3, "big") + bytes(1024))
+        f.write(b"\xff\xf8" + _payload(64, seed))
+
+    audio = FLAC(path)
+    audio.update(tags)
+    if cover_bytes:
+        picture = Picture()
+        picture.type = 3
+        picture.mime = "image/jpeg"
+        picture.data = _cover(cover_bytes)
+        audio.add_picture(picture)
+    audio.save()
+
+
+def write_ogg(path: str, tags: Dict[str, str], seconds: int, cover_bytes: int = 0, seed: Optional[int] = None) -> None:
+    """Écrit un Ogg Vorbis (en-têtes + une page audio) puis ses Vorbis comments."""
+    serial = 0x46554E4B
+    identification = (
+        b"\x01vorbis" + struct.pack("<IBIiiiBB", 0, 2, SAMPLE_RATE, 0, 128000, 0, 0xB8, 1)
+    )
+    comment = b"\x03vorbis" + struct.pack("<I", 0) + struct.pack("<I", 0) + b"\x01"
+    setup = b"\x05vorbis" + bytes(32)
+
+    pages = []
+    for sequence, (packets, position) in enumerate((
+        ([identification], 0),
+        ([comment, setup], 0),
+        ([_payload(256, seed)], seconds * SAMPLE_RATE),
+    )):
+        page = OggPage()
+        page.serial = serial
+        page.sequence = sequence
+        page.position = position
+        page.packets = packets
+        page.first = sequence == 0
+        page.last = sequence == 2
+        pages.append(page.write())
+
+    with open(path, "wb") as f:
+        f.write(b"".join(pages))
+
+    audio = OggVorbis(path)
+    audio.update(tags)
+    if cover_bytes:
+        picture = Picture()
+        picture.type = 3
+        picture.mime = "image/jpeg"
+        picture.data = _cover(cover_bytes)
+        audio["metadata_block_picture"] = [base64.b64encode(picture.write()).decode("ascii")]
+    audio.save()
+
+
+def write_wav(path: str, tags: Dict[str, str], seconds: int, cover_bytes: int = 0, seed: Optional[int] = None) -> None:
+    """Écrit un WAV PCM 16 bits stéréo puis un chunk ID3."""
+    data_size = seconds * SAMPLE_RATE * 4
+    fmt = struct.pack("<HHIIHH", 1, 2, SAMPLE_RATE, SAMPLE_RATE * 4, 4, 16)
+
+    with open(path, "wb") as f:
+        f.write(b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + data_size) + b"WAVE")
+        f.write(b"fmt " + struct.pack("<I", len(fmt)) + fmt)
+        f.write(b"data" + struct.pack("<I", data_size))
+        # Premiers échantillons amorcés, le reste du chunk est creux (silence)
+        data_start = f.tell()
+        f.write(_payload(min(16, data_size), seed))
+        f.truncate(data_start + data_size)
+
+    audio = WAVE(path)
+    audio.add_tags()
+    audio.tags.add(TIT2(encoding=3, text=tags["title"]))
+    audio.tags.add(TPE1(encoding=3, text=tags["artist"]))
+    audio.tags.add(TALB(encoding=3, text=tags["album"]))
+    audio.tags.add(TDRC(encoding=3, text=tags["date"]))
+    audio.tags.add(TRCK(encoding=3, text=tags["tracknumber"]))
+    if cover_bytes:
+        audio.tags.add(APIC(encoding=3, mime="image/jpeg", type=3, desc="Cover", data=_cover(cover_bytes)))
+    audio.save()
+
+
+_WRITERS = {
+    "mp3": write_mp3,
+    "flac": write_flac,
+    "ogg": write_ogg,
+    "wav": write_wav,
+}
+
+
+# ========================== #
+#     Génération du corpus   #
+# ========================== #
+def generate_corpus(root: str, spec: CorpusSpec = CorpusSpec()) -> List[str]:
+    """
+    Génère un corpus synthétique sous root.
+
+    Arborescence : Artiste NNN / Album NN / NN - Titre.ext (ou un seul dossier
+    si spec.flat), formats en alternance. La charge audio est amorcée par
+    l'index du fichier : aucun fichier n'est un doublon d'un autre.
+
+    Args:
+        root: dossier de destination (créé si besoin)
+        spec: forme du corpus
+
+    Returns:
+        List[str] : chemins des fichiers générés
+    """
+    unknown = set(spec.formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Formats non pris en charge : {', '.join(sorted(unknown))}")
+
+    paths: List[str] = []
+    tracks_per_artist = spec.tracks_per_album * spec.albums_per_artist
+
+    for index in range(spec.files):
+        artist_index, rest = divmod(index, tracks_per_artist)
+        album_index, track_index = divmod(rest, spec.tracks_per_album)
+        ext = spec.formats[index % len(spec.formats)]
+
+        if spec.flat:
+            directory = root
+        else:
+            directory = os.path.join(root, f"Artiste {artist_index:03d}", f"Album {album_index:02d}")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{track_index + 1:02d} - Titre {index}.{ext}")
+
+        tags = {
+            "title": f"Titre {index}",
+            "artist": f"Artiste {artist_index:03d}",
+            "album": f"Album {artist_index:03d}-{album_index:02d}",
+            "date": str(1970 + index % 50),
+            "tracknumber": f"{track_index + 1}/{spec.tracks_per_album}",
+        }
+
+        if ext == "mp3":
+            # Un MP3 sur deux avec en-tête Xing
+            write_mp3(
+                path, tags, spec.seconds, spec.cover_bytes,
+                xing=(index // len(spec.formats)) % 2 == 1, seed=index
+            )
+        else:
+            _WRITERS[ext](path, tags, spec.seconds, spec.cover_bytes, seed=index)
+        paths.append(path)
+
+    return paths
@@ -1,25 +1,29 @@
 # core/entities/track.py
 
 
-from typing import Optional
-
-from app.models.album import Album
-from app.models.artist import Artist
+from typing import Optional, Union
 
 
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Track:
+    """
+    Entité d'affichage d'une piste.
+    Indépendante de la base de données : aucun objet ORM n'y est retenu.
+    """
     id: int
     counttrack: int
     title: str
     file_path: str
-    artist: Artist  
-    album: Optional[Album]
+    artist: Optional[str]
+    album: Optional[str]
     duration: int
-    year: int
-
-
-    
\ No newline at end of file
+    # Année de sortie de l'album, "Indisponible" si inconnue
+    year: Union[int, str]
+    # Champs des vues de tri (album, genre, favoris)
+    album_id: Optional[int] = None
+    jacket_path: Optional[str] = None
+    genre: Optional[str] = None
+    is_favorite: bool = False
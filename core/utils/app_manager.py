@@ -1,7 +1,7 @@
 # core/app_manager.py
 
 
-from typing import Callable
+from typing import Callable, Optional
 from sqlalchemy.orm import Session
 
 from app.UI.screens.home_screen import HomeScreen
@@ -13,16 +13,24 @@ from app.controllers.player_service_controller import PlayerServiceController
 from app.controllers.playlist_controllers.playlist_controller import PlaylistController
 from app.controllers.playlist_controllers.playlist_maker_controller import PlaylistMakerController
 from app.controllers.library_navigation_controller import LibraryNavigationController
+from app.controllers.library_sync_controller import LibrarySyncController
+from app.controllers.library_search_controller import LibrarySearchController
 
 from app.presenter.library_presenter import LibraryPresenter
 
 
 # Services
+from services.file_services.library_services.library_cache import LibraryCache
 from services.file_services.library_services.library_services import LibraryServices
+from services.file_services.library_services.library_watcher import LibraryWatcher
+from services.file_services.library_services.query_executor import QueryExecutor
+from services.file_services.import_services.import_scheduler import ImportScheduler
 from services.file_services.player_services.player_services import PlayerServices
 from services.file_services.playlist_services.playlist_services import PlaylistServices
 from services.file_services.playlist_services.playlist_maker_services import PlaylistMakerServices
 
+from database import change_events
+
 from core.logger import logger
 
 class AppManager:
@@ -35,14 +43,21 @@ class AppManager:
         - Assurer le passage des dépendances.
     """
     
-    def __init__(self, session_factory: Callable[[], "Session"]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[[], "Session"],
+        read_session_factory: Optional[Callable[[], "Session"]] = None
+    ) -> None:
         logger.info("AppManager : Initialisation des composants...")
         """
         Initialise tous les composants de l'application.
 
         Args:
-            session_factory: factory SQLAlchemy pour créer de nouvelles sessions
+            session_factory: factory SQLAlchemy des écritures (imports, playlists, dossiers surveillés)
+            read_session_factory: factory SQLAlchemy en lecture seule pour l'affichage ;
+                                  ses lectures n'attendent jamais un import (défaut : session_factory)
         """
+        read_session_factory = read_session_factory or session_factory
         logger.info("AppManager : Initialisation des composants...")
         
         # Screens
@@ -54,8 +69,25 @@ class AppManager:
         logger.info("WindowManager initialisé")
         
         # Services Bibliothèque
-        self.library_service = LibraryServices(session_factory)
+        # Cœurs partagés entre les imports exécutés en parallèle par l'ImportScheduler
+        self.library_service = LibraryServices(
+            session_factory, extraction_workers=ImportScheduler.extraction_workers()
+        )
+        self.library_service.recover_interrupted_jobs()
         logger.info("LibraryServices initialisé")
+
+        # Lectures de l'affichage hors du thread GUI : la fenêtre s'affiche sans les attendre
+        self.query_executor = QueryExecutor(read_session_factory)
+        logger.info("QueryExecutor initialisé")
+
+        # Pistes de la bibliothèque partagées par les vues, invalidées à chaque commit qui les modifie
+        change_events.watch_sessions(session_factory)
+        self.library_cache = LibraryCache(self.query_executor)
+        logger.info("LibraryCache initialisé")
+
+        # File d'attente des imports (fenêtre d'import et surveillance des dossiers)
+        self.import_scheduler = ImportScheduler(self.library_service)
+        logger.info("ImportScheduler initialisé")
         
         
         # Service Playlist
@@ -81,8 +113,9 @@ class AppManager:
             ui=self.home_screen.content_stack.playlist_panel, 
             playlist_service=self.playlist_service,
             player_service=self.player_service,
-            session_factory=session_factory,
-            sort_tracks_widget=self.home_screen.top_bar.sort_tracks  
+            session_factory=read_session_factory,
+            sort_tracks_widget=self.home_screen.top_bar.sort_tracks,
+            library_cache=self.library_cache
         )
         logger.info("PlaylistController initialisé")
         
@@ -104,27 +137,51 @@ class AppManager:
         # Presenter
         self.library_presenter = LibraryPresenter(
             self.home_screen.content_stack.library_display, 
-            session_factory=session_factory
+            session_factory=read_session_factory,
+            query_executor=self.query_executor
         )
         logger.info("LibraryPresenter initialisé")
+
+
+        # Recherche plein texte (champ de recherche du HomeScreen)
+        self.library_search_controller = LibrarySearchController(
+            search_input=self.home_screen.search_input,
+            library_presenter=self.library_presenter,
+            query_executor=self.query_executor
+        )
+        logger.info("LibrarySearchController initialisé")
         
         
         # Playlist navigation Controller
         self.library_navigation_controller = LibraryNavigationController(
             menu_library=self.home_screen.content_stack.library_display.menu_library,
             home_screen=self.home_screen,
-            library_presenter=self.library_presenter 
+            library_presenter=self.library_presenter,
+            playlist_controller=self.playlist_controller
         )
         logger.info("LibraryNavigator initialisé")
         
         
+        # Surveillance des dossiers de la bibliothèque
+        self.library_watcher = LibraryWatcher(session_factory)
+        self.library_sync_controller = LibrarySyncController(
+            library_watcher=self.library_watcher,
+            import_scheduler=self.import_scheduler,
+            library_presenter=self.library_presenter
+        )
+        self.library_watcher.start()
+        logger.info("LibraryWatcher initialisé")
+        
+        
         # Controllers
         self.home_controller = HomeScreenController(
             self.home_screen,
             self.library_service,
             self.player_service,
             self.library_presenter,
-            self.window_manager
+            self.window_manager,
+            self.library_watcher,
+            self.import_scheduler
         )
         logger.info("HomeScreenController initialisé")
 
@@ -0,0 +1,141 @@
+# database/change_events.py
+
+"""
+Événements de modification des tables, publiés après chaque commit.
+
+Rôle :
+- Relever, pendant une transaction, les tables et colonnes écrites par la
+  session : objets ajoutés / modifiés / supprimés (flush) et requêtes INSERT,
+  UPDATE, DELETE exécutées par la session (écritures groupées de DBImporter,
+  des repositories et des remplissages)
+- Après le commit, prévenir les abonnés avec les modifications de la
+  transaction ; rien n'est publié si elle est annulée
+
+Les modifications sont un dictionnaire {table: colonnes modifiées}, None
+quand des lignes entières sont ajoutées ou supprimées (ou que les colonnes
+d'un UPDATE ne sont pas connues) : un abonné peut ignorer les écritures de
+colonnes qu'il n'affiche pas.
+
+Les abonnés sont appelés dans le thread qui a validé la transaction (un
+import tourne hors du thread GUI) : un abonné Qt relaie par signal.
+
+Usage :
+    watch_sessions(SessionLocal)
+    subscribe(lambda changes: ...)
+"""
+
+import threading
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ColumnProperty, ORMExecuteState, Session
+
+from core.logger import logger
+
+
+# {table: colonnes modifiées, None : lignes entières}
+Changes = Dict[str, Optional[FrozenSet[str]]]
+Listener = Callable[[Changes], None]
+
+_listeners: List[Listener] = []
+_lock = threading.Lock()
+
+# Clé de session.info : modifications depuis le début de la transaction
+_CHANGES = "table_changes"
+
+
+def subscribe(listener: Listener) -> None:
+    """Appelle listener(modifications) après chaque commit ayant écrit dans des tables."""
+    with _lock:
+        _listeners.append(listener)
+
+
+def unsubscribe(listener: Listener) -> None:
+    with _lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def watch_sessions(session_factory) -> None:
+    """Installe le relevé des écritures sur les sessions de session_factory (sessionmaker)."""
+    event.listen(session_factory, "after_flush", _after_flush)
+    event.listen(session_factory, "do_orm_execute", _on_execute)
+    event.listen(session_factory, "after_commit", _after_commit)
+    event.listen(session_factory, "after_rollback", _after_rollback)
+
+
+def _record(session: Session, table: str, columns: Optional[Iterable[str]]) -> None:
+    """Ajoute une écriture aux modifications de la transaction (None : lignes entières)."""
+    changes = session.info.setdefault(_CHANGES, {})
+    if columns is None or (table in changes and changes[table] is None):
+        changes[table] = None
+    else:
+        changes[table] = changes.get(table, frozenset()) | frozenset(columns)
+
+
+# ========================= #
+#   Listeners SQLAlchemy    #
+# ========================= #
+def _after_flush(session: Session, flush_context) -> None:
+    # L'historique des attributs est encore celui d'avant le flush
+    for instance in (*session.new, *session.deleted):
+        table = getattr(instance, "__table__", None)
+        if table is not None:
+            _record(session, table.name, None)
+
+    for instance in session.dirty:
+        table = getattr(instance, "__table__", None)
+        if table is not None and session.is_modified(instance):
+            _record(session, table.name, _modified_columns(instance))
+
+
+def _modified_columns(instance) -> Optional[List[str]]:
+    """Colonnes modifiées d'un objet ; None si une relation a changé (clés étrangères)."""
+    state = inspect(instance)
+    columns: List[str] = []
+    for prop in state.mapper.attrs:
+        if not state.attrs[prop.key].history.has_changes():
+            continue
+        if not isinstance(prop, ColumnProperty):
+            return None
+        columns.extend(column.name for column in prop.columns)
+    return columns
+
+
+def _on_execute(state: ORMExecuteState) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(state.statement, "table", None)
+    if table is None:
+        return
+    columns = _updated_columns(state) if state.is_update else None
+    _record(state.session, table.name, columns)
+
+
+def _updated_columns(state: ORMExecuteState) -> Optional[List[str]]:
+    """Colonnes d'un UPDATE : values() et paramètres (mise à jour groupée par clé primaire)."""
+    columns = [getattr(key, "key", key) for key in getattr(state.statement, "_values", None) or ()]
+    parameters = state.parameters
+    if isinstance(parameters, dict):
+        parameters = [parameters]
+    for row in parameters or ():
+        columns.extend(row)
+    return columns or None
+
+
+def _after_commit(session: Session) -> None:
+    changes = session.info.pop(_CHANGES, None)
+    if not changes:
+        return
+
+    with _lock:
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(changes)
+        except Exception:
+            logger.exception("ChangeEvents : Erreur d'un abonné")
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGES, None)
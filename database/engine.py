@@ -2,33 +2,149 @@
 
 """
 Configuration et initialisation du moteur de base de données pour l'application FunkyTunes.
+
+Les pragmas SQLite (journal WAL, synchronous, cache, mmap…) sont regroupés dans
+un SQLiteProfile appliqué à chaque nouvelle connexion. L'écho SQL est coupé par
+défaut : activable au lancement (FUNKYTUNES_SQL_ECHO=1) ou à chaud via set_sql_echo.
+
+Deux engines sur le même fichier :
+    - engine / SessionLocal : écritures (imports, synchronisation, playlists, schéma)
+    - read_engine / ReadSessionLocal : lectures de l'interface, connexions en
+      lecture seule (query_only) ; en WAL, chaque transaction lit un instantané
+      et n'attend jamais l'écrivain
 """
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import List
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
+from core.logger import logger
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATABASE_URL = f"sqlite:///{BASE_DIR / 'funkytunes.db'}"
 
 
-engine = create_engine(
-    DATABASE_URL, 
-    echo=True,
-    future=True
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """
+    Pragmas SQLite appliqués à chaque connexion.
+
+    Rôle :
+        - WAL : les lectures (interface) ne bloquent plus sur les écritures (import)
+        - synchronous=NORMAL : en WAL, plus de fsync à chaque commit (base toujours
+          cohérente ; au pire les dernières transactions sont perdues sur coupure de courant)
+        - Cache de pages, mmap et tables temporaires en mémoire pour les lectures
+        - busy_timeout : attendre un verrou plutôt qu'échouer aussitôt
+    """
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    # Taille du cache de pages, en Kio (cache_size négatif)
+    cache_size_kib: int = 64 * 1024
+    mmap_size: int = 256 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+    # Connexions en lecture seule (engine des lectures)
+    query_only: bool = False
+
+    def pragmas(self) -> List[str]:
+        pragmas = [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA cache_size=-{self.cache_size_kib}",
+            f"PRAGMA mmap_size={self.mmap_size}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+        ]
+        if self.query_only:
+            pragmas.append("PRAGMA query_only=ON")
+        return pragmas
+
+
+# Profil de l'application
+DEFAULT_PROFILE = SQLiteProfile()
+# Lectures de l'interface : même réglage, écriture refusée par SQLite
+READ_PROFILE = SQLiteProfile(query_only=True)
+# Valeurs par défaut de SQLite (comportement d'origine), pour comparaison
+SQLITE_DEFAULTS = SQLiteProfile(
+    journal_mode="DELETE",
+    synchronous="FULL",
+    cache_size_kib=2000,
+    mmap_size=0,
+    temp_store="DEFAULT",
+    busy_timeout_ms=0,
 )
 
+
+def apply_profile(target_engine: Engine, profile: SQLiteProfile) -> None:
+    """Applique les pragmas du profil à chaque nouvelle connexion de l'engine."""
+
+    @event.listens_for(target_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in profile.pragmas():
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_sqlite_engine(
+    url: str,
+    profile: SQLiteProfile = DEFAULT_PROFILE,
+    echo: bool = False,
+    **engine_options
+) -> Engine:
+    """
+    Crée un engine SQLite configuré selon un profil.
+
+    Args:
+        url: URL SQLAlchemy de la base
+        profile: pragmas à appliquer à chaque connexion
+        echo: journaliser les requêtes SQL (débogage)
+        engine_options: options du pool (pool_size, max_overflow…)
+    """
+    new_engine = create_engine(url, echo=echo, future=True, **engine_options)
+    apply_profile(new_engine, profile)
+    return new_engine
+
+
+def set_sql_echo(enabled: bool, target_engine: Engine = None) -> None:
+    """Active ou coupe à chaud la journalisation des requêtes SQL (débogage), par défaut sur les deux engines."""
+    for target in [target_engine] if target_engine is not None else [engine, read_engine]:
+        target.echo = enabled
+    logger.info(f"Engine : Écho SQL {'activé' if enabled else 'désactivé'}")
+
+
+_echo = os.environ.get("FUNKYTUNES_SQL_ECHO", "") not in ("", "0")
+
+# Écritures : SQLite n'admet qu'un écrivain à la fois, les autres attendent
+# (busy_timeout). Une connexion permanente ; le débordement sert aux imports
+# concurrents et aux sessions courtes ouvertes pendant un import (checkpoint).
+engine = create_sqlite_engine(DATABASE_URL, echo=_echo, pool_size=1, max_overflow=3)
+
+# Lectures de l'interface : pool séparé, jamais en attente d'une connexion d'écriture
+read_engine = create_sqlite_engine(DATABASE_URL, READ_PROFILE, echo=_echo, pool_size=4, max_overflow=4)
+
 SessionLocal = sessionmaker(
     bind=engine,
     autocommit=False,
     autoflush=False
 )
 
+ReadSessionLocal = sessionmaker(
+    bind=read_engine,
+    autocommit=False,
+    autoflush=False
+)
+
 def get_session():
     """
     Retourne une nouvelle session SQLAlchemy.
-    
+
     Utiliser avec un contexte `with` est conseillé pour le commit/rollback automatique.
     """
     return SessionLocal()
-
@@ -0,0 +1,219 @@
+# database/index_advisor.py
+
+"""
+Contrôle des plans d'exécution des requêtes de lecture (outil de développement).
+
+Rôle :
+- Appeler chaque méthode de lecture (get_*) des repositories et de TrackReadService
+  sur une base vide au schéma courant (ou sur une base existante avec --db)
+- Capturer les SELECT émis et les passer à EXPLAIN QUERY PLAN
+- Signaler les parcours complets (SCAN d'une table, avec ou sans index) et les
+  tris en B-tree temporaire, hors lectures volontairement complètes (EXPECTED_SCANS)
+  et parcours d'index bornés par LIMIT (première page d'une pagination par clé)
+
+Usage :
+    python -m database.index_advisor
+    python -m database.index_advisor --db sqlite:///funkytunes.db --verbose
+
+Code de sortie 1 si un parcours complet inattendu est trouvé.
+"""
+
+import re
+import inspect
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from database.migrations import migrate
+from repositories.album_repository import AlbumRepository
+from repositories.artist_repository import ArtistRepository
+from repositories.duplicate_file_repository import DuplicateFileRepository
+from repositories.import_job_repository import ImportJobRepository
+from repositories.playlist_repository import PlaylistRepository
+from repositories.track_repository import TrackRepository
+from repositories.user_repository import UserRepository
+from repositories.watched_folder_repository import WatchedFolderRepository
+from services.file_services.library_services.track_read_service import TrackReadService
+
+
+TARGETS = (
+    AlbumRepository,
+    ArtistRepository,
+    DuplicateFileRepository,
+    ImportJobRepository,
+    PlaylistRepository,
+    TrackRepository,
+    UserRepository,
+    WatchedFolderRepository,
+    TrackReadService,
+)
+
+# Lectures complètes par nature : le parcours de table est attendu
+EXPECTED_SCANS: Dict[str, str] = {
+    "TrackRepository.get_all": "pagination par offset",
+    "WatchedFolderRepository.get_all": "quelques lignes",
+    "TrackReadService.get_tracks": "chargement de la bibliothèque",
+    "TrackReadService.get_track_rows": "chargement de la bibliothèque (projection)",
+    "TrackReadService.get_track_file_paths": "tous les chemins de la bibliothèque",
+    "TrackReadService.get_tracks_window": "saut direct : index parcouru jusqu'à la position",
+}
+
+# "SCAN t" ou "SCAN t USING [COVERING] INDEX i" : toute la table est lue
+_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX \w+)?$")
+_TEMP_SORT = "USE TEMP B-TREE"
+
+
+def _bounded(statement: str, params, plan: List[str]) -> bool:
+    """
+    Parcours d'index dans l'ordre du tri, arrêté par LIMIT (première page
+    d'une pagination par clé) : seules les lignes de la page sont lues.
+    Avec un OFFSET non nul, les lignes sautées sont lues aussi : le parcours n'est pas borné.
+    """
+    statement = " ".join(statement.split())
+    if statement.endswith("OFFSET ?") and params and params[-1]:
+        return False
+    return (
+        " LIMIT " in statement
+        and all(" USING " in detail for detail in plan if detail.startswith("SCAN "))
+        and not any(detail.startswith(_TEMP_SORT) for detail in plan)
+    )
+
+
+@dataclass
+class QueryReport:
+    """Plans des requêtes émises par une méthode."""
+    method: str
+    # (requête, paramètres, détail du plan)
+    plans: List[Tuple[str, tuple, List[str]]] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def full_scans(self) -> List[str]:
+        return [
+            match.group(1)
+            for statement, params, plan in self.plans if not _bounded(statement, params, plan)
+            for detail in plan
+            for match in [_FULL_SCAN.match(detail)] if match
+        ]
+
+    @property
+    def temp_sorts(self) -> int:
+        return sum(1 for _, _, plan in self.plans for detail in plan if detail.startswith(_TEMP_SORT))
+
+    @property
+    def expected(self) -> bool:
+        return self.method in EXPECTED_SCANS
+
+
+def _sample_argument(parameter: inspect.Parameter):
+    """Valeur factice plausible pour un paramètre obligatoire, d'après son annotation."""
+    annotation = str(parameter.annotation)
+    numeric = "int" in annotation or parameter.name.endswith("_id")
+    if "Iterable" in annotation or "List" in annotation or "list" in annotation:
+        return [1, 2] if numeric else ["/musique/a.mp3", "/musique/b.mp3"]
+    if numeric:
+        return 1
+    return "/musique/"
+
+
+def _read_methods(target) -> List[Tuple[str, object]]:
+    return [
+        (name, member) for name, member in inspect.getmembers(target, inspect.isfunction)
+        if name.startswith("get_")
+    ]
+
+
+def analyse(url: str = "sqlite://") -> List[QueryReport]:
+    """
+    Exécute toutes les méthodes de lecture et retourne leurs plans.
+
+    Args:
+        url: base à analyser (défaut : base vide en mémoire, migrée)
+    """
+    if url == "sqlite://":
+        engine = create_engine(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+        migrate(engine)
+    else:
+        engine = create_engine(url)
+
+    captured: List[Tuple[str, object]] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    reports: List[QueryReport] = []
+    for target in TARGETS:
+        for name, method in _read_methods(target):
+            report = QueryReport(f"{target.__name__}.{name}")
+            reports.append(report)
+            parameters = list(inspect.signature(method).parameters.values())[1:]
+            arguments = [
+                _sample_argument(p) for p in parameters
+                if p.default is inspect.Parameter.empty and p.kind is p.POSITIONAL_OR_KEYWORD
+            ]
+
+            captured.clear()
+            with Session(engine) as session:
+                try:
+                    method(target(session), *arguments)
+                except Exception as e:
+                    report.error = str(e).splitlines()[0]
+                finally:
+                    session.rollback()
+
+            statements = list(captured)
+            with engine.connect() as connection:
+                for statement, params in statements:
+                    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", params).all()
+                    report.plans.append((statement, params, [row[-1] for row in rows]))
+
+    engine.dispose()
+    return reports
+
+
+def _print_reports(reports: List[QueryReport], verbose: bool) -> int:
+    """Affiche le rapport ; retourne le nombre de parcours complets inattendus."""
+    unexpected = 0
+    for report in reports:
+        scans = report.full_scans
+        if report.error:
+            status = f"ERREUR  {report.error}"
+        elif scans and report.expected:
+            status = f"attendu SCAN {', '.join(scans)} ({EXPECTED_SCANS[report.method]})"
+        elif scans:
+            status = f"SCAN    {', '.join(scans)}"
+            unexpected += 1
+        elif report.temp_sorts:
+            status = f"tri     {report.temp_sorts} tri(s) en B-tree temporaire"
+        else:
+            status = "ok"
+        print(f"{report.method:<52}{status}")
+
+        if verbose or (scans and not report.expected):
+            for statement, _, plan in report.plans:
+                print(f"    {' '.join(statement.split())[:160]}")
+                for detail in plan:
+                    print(f"        {detail}")
+
+    print(f"\n{len(reports)} méthodes analysées, {unexpected} parcours complets inattendus")
+    return unexpected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="EXPLAIN QUERY PLAN des requêtes de lecture")
+    parser.add_argument("--db", default="sqlite://", help="URL SQLAlchemy (défaut : base vide en mémoire)")
+    parser.add_argument("--verbose", action="store_true", help="affiche tous les plans")
+    args = parser.parse_args()
+
+    unexpected = _print_reports(analyse(args.db), args.verbose)
+    raise SystemExit(1 if unexpected else 0)
+
+
+if __name__ == "__main__":
+    main()
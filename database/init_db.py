@@ -4,25 +4,19 @@
 Initialisation de la base de données pour l'application FunkyTunes.
 """
 
-from sqlalchemy.orm import sessionmaker
-from database.engine import engine
-from database.base import Base
+from database.engine import engine, SessionLocal
+from database.migrations import BackfillRunner, migrate
 
 
-# Importation des modèles pour créer les tables
-from app.models.artist import Artist
-from app.models.album import Album
-from app.models.track import Track
-from app.models.user import User
-from app.models.playlist import Playlist
-
-
-def init_db():
+def init_db() -> BackfillRunner:
     """
-    Initialise la base de données en créant toutes les tables définies dans les modèles.
-    """
-    Base.metadata.create_all(bind=engine)
-  
+    Met le schéma à jour (migrations versionnées) puis lance en arrière-plan
+    le remplissage des colonnes dérivées.
 
-    
-    
+    Returns:
+        BackfillRunner : thread de remplissage, à arrêter à la fermeture
+    """
+    migrate(engine)
+    runner = BackfillRunner(SessionLocal)
+    runner.start()
+    return runner
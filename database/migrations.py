@@ -0,0 +1,380 @@
+# database/migrations.py
+
+"""
+Migrations versionnées du schéma de la base FunkyTunes.
+
+Rôle :
+- Appliquer sur place, au démarrage, les changements de schéma et d'index
+  d'une base existante (create_all ne modifie jamais une table déjà créée)
+- Mémoriser la version atteinte dans l'en-tête SQLite (PRAGMA user_version) :
+  sans migration en attente, le démarrage ne coûte qu'une lecture de pragma
+- Remplir les colonnes dérivées par lots, dans un thread d'arrière-plan
+  (BackfillRunner), sans bloquer l'interface ni les imports
+
+Écrire une migration :
+    @migration(2, "Description")
+    def _v2(connection: Connection) -> None:
+        ...
+
+Chaque migration s'exécute dans sa propre transaction (BEGIN IMMEDIATE) avec
+la mise à jour de user_version : interrompue, elle est rejouée entière au
+prochain démarrage. Le socle (version 1) crée les tables d'après les modèles
+courants ; les migrations suivantes doivent donc tolérer un objet déjà présent
+(add_column et create_index le vérifient).
+"""
+
+import os
+import time
+import threading
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from sqlalchemy import Column, Index, inspect, select, text, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateColumn
+
+from database.base import Base
+
+# Importation des modèles pour créer les tables
+from app.models.artist import Artist
+from app.models.album import Album
+from app.models.track import Track
+from app.models.user import User
+from app.models.playlist import Playlist
+from app.models.watched_folder import WatchedFolder
+from app.models.import_job import ImportJob
+from app.models.duplicate_file import DuplicateFile
+
+from core.logger import logger
+
+
+@dataclass(frozen=True)
+class Migration:
+    """Changement de schéma numéroté, appliqué une seule fois par base."""
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+@dataclass(frozen=True)
+class Backfill:
+    """
+    Remplissage d'une colonne dérivée, par lots.
+
+    run_batch(session, after_id, batch_size) traite au plus batch_size lignes
+    d'identifiant supérieur à after_id et retourne le dernier identifiant vu,
+    ou None quand il ne reste rien à traiter. Il ne commit pas.
+    batch_size remplace la taille de lot du runner (lots peu coûteux).
+    """
+    name: str
+    run_batch: Callable[[Session, int, int], Optional[int]]
+    batch_size: Optional[int] = None
+
+
+MIGRATIONS: List[Migration] = []
+BACKFILLS: List[Backfill] = []
+
+
+def migration(version: int, description: str):
+    """Enregistre une migration ; les versions se suivent sans trou."""
+
+    def register(upgrade: Callable[[Connection], None]) -> Callable[[Connection], None]:
+        expected = len(MIGRATIONS) + 1
+        if version != expected:
+            raise ValueError(f"Migration {version} : version {expected} attendue")
+        MIGRATIONS.append(Migration(version, description, upgrade))
+        return upgrade
+
+    return register
+
+
+def backfill(name: str, batch_size: Optional[int] = None):
+    """Enregistre un remplissage de colonne dérivée, exécuté par BackfillRunner."""
+
+    def register(run_batch: Callable[[Session, int, int], Optional[int]]):
+        BACKFILLS.append(Backfill(name, run_batch, batch_size))
+        return run_batch
+
+    return register
+
+
+# ========================= #
+#         Outils DDL        #
+# ========================= #
+def add_column(connection: Connection, table_name: str, column: Column) -> bool:
+    """Ajoute une colonne (nullable) si elle n'existe pas ; retourne True si ajoutée."""
+    existing = {c["name"] for c in inspect(connection).get_columns(table_name)}
+    if column.name in existing:
+        return False
+    ddl = CreateColumn(column).compile(dialect=connection.dialect)
+    connection.exec_driver_sql(f'ALTER TABLE "{table_name}" ADD COLUMN {ddl}')
+    return True
+
+
+def create_index(connection: Connection, index: Index) -> None:
+    """Crée un index s'il n'existe pas."""
+    index.create(bind=connection, checkfirst=True)
+
+
+# ========================= #
+#          Runner           #
+# ========================= #
+def latest_version() -> int:
+    return MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+def schema_version(connection: Connection) -> int:
+    return connection.exec_driver_sql("PRAGMA user_version").scalar() or 0
+
+
+def migrate(target_engine: Engine) -> int:
+    """
+    Applique les migrations en attente.
+
+    Args:
+        target_engine: engine d'écriture de la base
+
+    Returns:
+        int : version du schéma après migration
+    """
+    started = time.perf_counter()
+    target = latest_version()
+
+    # Connexion en autocommit : les transactions sont ouvertes explicitement,
+    # pour que le DDL (que pysqlite n'inclut pas dans ses transactions
+    # implicites) soit annulé avec le reste en cas d'échec
+    with target_engine.connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        version = schema_version(connection)
+
+        if version > target:
+            logger.warning(
+                f"Migrations : Base en version {version}, plus récente que l'application ({target})"
+            )
+            return version
+
+        for step in MIGRATIONS[version:]:
+            logger.info(f"Migrations : Version {step.version} - {step.description}")
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                step.upgrade(connection)
+                connection.exec_driver_sql(f"PRAGMA user_version = {step.version}")
+                connection.exec_driver_sql("COMMIT")
+            except Exception:
+                connection.exec_driver_sql("ROLLBACK")
+                logger.exception(f"Migrations : Échec de la version {step.version}")
+                raise
+            version = step.version
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(f"Migrations : Schéma en version {version} ({elapsed_ms:.1f} ms)")
+    return version
+
+
+class BackfillRunner(threading.Thread):
+    """
+    Exécute les remplissages enregistrés, lot par lot, en arrière-plan.
+
+    Rôle :
+        - Une transaction courte par lot : le verrou d'écriture est rendu entre
+          deux lots (imports et synchronisations passent), les lectures de
+          l'interface (WAL) ne sont jamais bloquées
+        - S'arrêter proprement entre deux lots (stop)
+    """
+
+    def __init__(self, session_factory, batch_size: int = 200, pause: float = 0.05):
+        """
+        Args:
+            session_factory: fabrique de sessions d'écriture
+            batch_size: lignes traitées par lot (et par commit)
+            pause: attente entre deux lots, en secondes
+        """
+        super().__init__(name="BackfillRunner", daemon=True)
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.pause = pause
+        self._stop_event = threading.Event()
+
+
+    def stop(self) -> None:
+        """Demande l'arrêt après le lot en cours."""
+        self._stop_event.set()
+
+
+    def run(self) -> None:
+        for task in BACKFILLS:
+            after_id, processed = 0, 0
+            batch_size = task.batch_size or self.batch_size
+            while not self._stop_event.is_set():
+                try:
+                    with self.session_factory() as session:
+                        last_id = task.run_batch(session, after_id, batch_size)
+                        session.commit()
+                except Exception:
+                    logger.exception(f"BackfillRunner : Échec du remplissage {task.name}")
+                    break
+                if last_id is None:
+                    break
+                processed += 1
+                after_id = last_id
+                self._stop_event.wait(self.pause)
+
+            if processed:
+                logger.info(f"BackfillRunner : {task.name} - {processed} lot(s) traité(s)")
+
+
+# ========================= #
+#        Migrations         #
+# ========================= #
+@migration(1, "Socle : tables, colonnes et index des modèles")
+def _v1_baseline(connection: Connection) -> None:
+    """
+    Base neuve : crée le schéma courant. Base antérieure aux migrations :
+    crée les tables manquantes et ajoute les colonnes nullables et les index
+    apparus depuis sa création.
+    """
+    Base.metadata.create_all(bind=connection)
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if column.nullable:
+                add_column(connection, table.name, column)
+        for index in table.indexes:
+            create_index(connection, index)
+
+
+@migration(2, "Index plein texte tracks_search (titre, artiste, album)")
+def _v2_tracks_search(connection: Connection) -> None:
+    """
+    Table FTS5 (rowid = tracks.id) tenue à jour par triggers : insertion,
+    suppression et modification d'un track, renommage d'un artiste ou d'un album.
+    unicode61 remove_diacritics 2 : recherche insensible à la casse et aux
+    accents ; index de préfixes 2 et 3 caractères pour la saisie en cours.
+    Les tracks existants sont indexés en arrière-plan (remplissage tracks_search).
+    """
+    connection.exec_driver_sql("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS tracks_search USING fts5(
+            title, artist, album,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+    """)
+    connection.exec_driver_sql("""
+        CREATE TRIGGER IF NOT EXISTS tracks_search_insert AFTER INSERT ON tracks BEGIN
+            INSERT INTO tracks_search (rowid, title, artist, album) VALUES (
+                new.id, new.title,
+                (SELECT name FROM artists WHERE id = new.artist_id),
+                (SELECT title FROM albums WHERE id = new.album_id)
+            );
+        END
+    """)
+    connection.exec_driver_sql("""
+        CREATE TRIGGER IF NOT EXISTS tracks_search_delete AFTER DELETE ON tracks BEGIN
+            DELETE FROM tracks_search WHERE rowid = old.id;
+        END
+    """)
+    connection.exec_driver_sql("""
+        CREATE TRIGGER IF NOT EXISTS tracks_search_update
+        AFTER UPDATE OF title, artist_id, album_id ON tracks BEGIN
+            DELETE FROM tracks_search WHERE rowid = old.id;
+            INSERT INTO tracks_search (rowid, title, artist, album) VALUES (
+                new.id, new.title,
+                (SELECT name FROM artists WHERE id = new.artist_id),
+                (SELECT title FROM albums WHERE id = new.album_id)
+            );
+        END
+    """)
+    connection.exec_driver_sql("""
+        CREATE TRIGGER IF NOT EXISTS tracks_search_artist_rename
+        AFTER UPDATE OF name ON artists BEGIN
+            UPDATE tracks_search SET artist = new.name
+            WHERE rowid IN (SELECT id FROM tracks WHERE artist_id = new.id);
+        END
+    """)
+    connection.exec_driver_sql("""
+        CREATE TRIGGER IF NOT EXISTS tracks_search_album_rename
+        AFTER UPDATE OF title ON albums BEGIN
+            UPDATE tracks_search SET album = new.title
+            WHERE rowid IN (SELECT id FROM tracks WHERE album_id = new.id);
+        END
+    """)
+
+
+@migration(3, "Clés rapides calculées sur la charge audio (hors tags)")
+def _v3_payload_quick_keys(connection: Connection) -> None:
+    """
+    Les clés rapides enregistrées incluaient les tags : elles sont effacées et
+    recalculées en arrière-plan (remplissage tracks.quick_key). Les hash
+    complets, déjà indépendants des tags, restent valables.
+    """
+    connection.exec_driver_sql("UPDATE tracks SET quick_key = NULL WHERE quick_key IS NOT NULL")
+
+
+# ========================= #
+#        Remplissages       #
+# ========================= #
+@backfill("tracks.quick_key")
+def _backfill_quick_keys(session: Session, after_id: int, batch_size: int) -> Optional[int]:
+    """
+    Clé rapide des tracks importés avant la détection des doublons (et leur
+    taille quand elle manque) : ils redeviennent comparables aux nouveaux fichiers.
+    Un fichier absent est ignoré ; il sera revu au prochain démarrage.
+    """
+    from app.application.import_track.fingerprint import FileFingerprinter
+
+    rows = session.execute(
+        select(Track.id, Track.file_path, Track.file_size)
+        .where(Track.quick_key.is_(None), Track.id > after_id)
+        .order_by(Track.id)
+        .limit(batch_size)
+    ).all()
+    if not rows:
+        return None
+
+    fingerprinter = FileFingerprinter()
+    updates = []
+    for track_id, file_path, file_size in rows:
+        try:
+            size = os.path.getsize(file_path)
+            updates.append({
+                "id": track_id,
+                "quick_key": fingerprinter.quick_key(file_path, size),
+                "file_size": size if file_size is None else file_size,
+            })
+        except OSError:
+            continue
+
+    if updates:
+        session.execute(update(Track), updates)
+    return rows[-1].id
+
+
+@backfill("tracks_search", batch_size=2000)
+def _backfill_tracks_search(session: Session, after_id: int, batch_size: int) -> Optional[int]:
+    """
+    Indexe les tracks absents de tracks_search (créés avant la migration 2).
+    Les identifiants sont lus avant l'écriture : le parcours ne retient pas
+    le verrou d'écriture.
+    """
+    ids = session.execute(
+        text(
+            "SELECT t.id FROM tracks t WHERE t.id > :after_id "
+            "AND NOT EXISTS (SELECT 1 FROM tracks_search s WHERE s.rowid = t.id) "
+            "ORDER BY t.id LIMIT :batch_size"
+        ),
+        {"after_id": after_id, "batch_size": batch_size},
+    ).scalars().all()
+    if not ids:
+        return None
+
+    session.execute(
+        text(
+            "INSERT INTO tracks_search (rowid, title, artist, album) "
+            "SELECT t.id, t.title, ar.name, al.title FROM tracks t "
+            "JOIN artists ar ON ar.id = t.artist_id JOIN albums al ON al.id = t.album_id "
+            "WHERE t.id BETWEEN :first AND :last "
+            "AND NOT EXISTS (SELECT 1 FROM tracks_search s WHERE s.rowid = t.id)"
+        ),
+        {"first": ids[0], "last": ids[-1]},
+    )
+    return ids[-1]
@@ -0,0 +1,32 @@
+# app/mappers/import_job_mapper.py
+
+
+from app.application.import_track.import_result import ImportResult, ImportStatus
+from app.models.import_job import ImportJob, ImportJobStatus
+
+
+def job_to_result(job: ImportJob) -> ImportResult:
+    """Reconstruit l'ImportResult d'un job persisté (terminé fenêtre fermée, repris…)."""
+    errors = [tuple(error) for error in job.errors or []]
+    changed = job.imported + job.updated + job.removed
+
+    if changed == 0 and job.error_count:
+        status = ImportStatus.ERROR
+    elif job.error_count:
+        status = ImportStatus.PARTIAL
+    elif changed or job.skipped:
+        status = ImportStatus.SUCCESS
+    else:
+        status = ImportStatus.EMPTY
+
+    return ImportResult(
+        status=status,
+        imported=job.imported,
+        errors=errors,
+        updated=job.updated,
+        removed=job.removed,
+        skipped=job.skipped,
+        job_id=job.id,
+        duplicates=[tuple(duplicate) for duplicate in job.duplicates or []],
+        cancelled=job.status == ImportJobStatus.CANCELLED.value,
+    )
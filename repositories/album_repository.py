@@ -1,13 +1,15 @@
 # app/repositories/album_repository
 
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.models.album import Album
 from app.models.track import Track
+from repositories.pagination import Cursor, Page, keyset_page
 
 
 class AlbumRepository:
@@ -49,6 +51,28 @@ class AlbumRepository:
     def get_by_artist(self, artist_id: int, skip: int = 0, limit: int = 100) -> List[Album]:
         return self.db.query(Album).filter_by(artist_id=artist_id).order_by(Album.title).offset(skip).limit(limit).all()
 
+
+    def get_page(self, cursor: Optional[Cursor] = None, limit: int = 100) -> Page[Album]:
+        return keyset_page(self.db.query(Album), (Album.title, Album.id), cursor, limit)
+
+
+    def get_page_by_artist(self, artist_id: int, cursor: Optional[Cursor] = None, limit: int = 100) -> Page[Album]:
+        return keyset_page(self.db.query(Album).filter_by(artist_id=artist_id), (Album.title, Album.id), cursor, limit)
+
+
+    def get_jackets(self, album_ids: Iterable[int], chunk_size: int = 500) -> Dict[int, Optional[str]]:
+        """Retourne {album_id: jacket_path} pour une liste d'albums."""
+        ids = list(album_ids)
+        jackets = {}
+
+        for start in range(0, len(ids), chunk_size):
+            rows = self.db.execute(
+                select(Album.id, Album.jacket_path).where(Album.id.in_(ids[start:start + chunk_size]))
+            )
+            jackets.update(rows.all())
+
+        return jackets
+
     
     # ========================= #
     #         UPDATE            #
@@ -63,6 +87,16 @@ class AlbumRepository:
         self.db.flush()
         
         return album
+
+
+    def set_jackets(self, jackets: Dict[int, str]) -> None:
+        """Enregistre des pochettes en une requête groupée : {album_id: jacket_path}."""
+        if jackets:
+            self.db.execute(
+                update(Album),
+                [{"id": album_id, "jacket_path": path} for album_id, path in jackets.items()]
+            )
+            self.db.flush()
     
     
     # ========================= #
@@ -4,6 +4,7 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.artist import Artist
+from repositories.pagination import Cursor, Page, keyset_page
 
 
 class ArtistRepository:
@@ -39,6 +40,10 @@ class ArtistRepository:
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Artist]:
         return self.db.query(Artist).order_by(Artist.name).offset(skip).limit(limit).all()
+
+
+    def get_page(self, cursor: Optional[Cursor] = None, limit: int = 100) -> Page[Artist]:
+        return keyset_page(self.db.query(Artist), (Artist.name, Artist.id), cursor, limit)
     
     
     # ========================= #
@@ -0,0 +1,69 @@
+# app/repositories/duplicate_file_repository.py
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.models.duplicate_file import DuplicateFile
+from repositories.track_repository import path_prefix_filter
+
+
+class DuplicateFileRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+
+    # ========================= #
+    #          CREATE           #
+    # ========================= #
+    def upsert_many(self, rows: List[dict]) -> None:
+        """
+        Enregistre des copies (file_path, track_id, content_hash, file_size, file_mtime_ns).
+        Une copie déjà connue est mise à jour.
+        """
+        if not rows:
+            return
+        stmt = sqlite_insert(DuplicateFile.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["file_path"],
+            set_={
+                "track_id": stmt.excluded.track_id,
+                "content_hash": stmt.excluded.content_hash,
+                "file_size": stmt.excluded.file_size,
+                "file_mtime_ns": stmt.excluded.file_mtime_ns,
+            }
+        )
+        self.db.execute(stmt, rows)
+        self.db.flush()
+
+
+    # ========================= #
+    #           READ            #
+    # ========================= #
+    def get_by_track(self, track_id: int) -> List[DuplicateFile]:
+        return self.db.query(DuplicateFile).filter_by(track_id=track_id).order_by(DuplicateFile.file_path).all()
+
+
+    def get_file_states(self, path_prefix: str) -> Dict[str, Tuple[int, Optional[int], Optional[int]]]:
+        """Retourne {file_path: (id, file_size, file_mtime_ns)} des copies sous un dossier, en une requête."""
+        rows = self.db.execute(
+            select(DuplicateFile.file_path, DuplicateFile.id, DuplicateFile.file_size, DuplicateFile.file_mtime_ns)
+            .where(path_prefix_filter(DuplicateFile.file_path, path_prefix))
+        )
+        return {file_path: (dup_id, size, mtime_ns) for file_path, dup_id, size, mtime_ns in rows}
+
+
+    # ========================= #
+    #          DELETE           #
+    # ========================= #
+    def delete_by_paths(self, file_paths: Iterable[str], chunk_size: int = 500) -> int:
+        paths = list(file_paths)
+        deleted = 0
+
+        for start in range(0, len(paths), chunk_size):
+            deleted += self.db.execute(
+                delete(DuplicateFile).where(DuplicateFile.file_path.in_(paths[start:start + chunk_size]))
+            ).rowcount
+        self.db.flush()
+
+        return deleted
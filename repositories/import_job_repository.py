@@ -0,0 +1,66 @@
+# app/repositories/import_job_repository.py
+
+from typing import List, Optional
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from app.models.import_job import ImportJob, ImportJobStatus, RESUMABLE_STATUSES
+
+
+class ImportJobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+
+    # ========================= #
+    #          CREATE           #
+    # ========================= #
+    def create(self, root_path: str, incremental: bool = False) -> ImportJob:
+        job = ImportJob(root_path=root_path, incremental=incremental)
+        self.db.add(job)
+        self.db.flush()
+        return job
+
+
+    # ========================= #
+    #           READ            #
+    # ========================= #
+    def get_by_id(self, job_id: int) -> Optional[ImportJob]:
+        return self.db.get(ImportJob, job_id)
+
+
+    def get_resumable(self, root_path: str) -> Optional[ImportJob]:
+        return (
+            self.db.query(ImportJob)
+            .filter(ImportJob.root_path == root_path, ImportJob.status.in_(RESUMABLE_STATUSES))
+            .order_by(ImportJob.created_at.desc())
+            .first()
+        )
+
+
+    def get_unacknowledged(self) -> List[ImportJob]:
+        """Jobs terminés dont le résultat n'a pas encore été présenté."""
+        return (
+            self.db.query(ImportJob)
+            .filter(ImportJob.status == ImportJobStatus.COMPLETED.value, ImportJob.acknowledged.is_(False))
+            .order_by(ImportJob.finished_at)
+            .all()
+        )
+
+
+    # ========================= #
+    #         UPDATE            #
+    # ========================= #
+    def mark_interrupted(self) -> int:
+        """Au démarrage : un job encore "running" a été interrompu (crash, fermeture)."""
+        return self.db.execute(
+            update(ImportJob)
+            .where(ImportJob.status == ImportJobStatus.RUNNING.value)
+            .values(status=ImportJobStatus.INTERRUPTED.value)
+        ).rowcount
+
+
+    def acknowledge(self, job_id: int) -> None:
+        job = self.get_by_id(job_id)
+        if job:
+            job.acknowledged = True
+            self.db.flush()
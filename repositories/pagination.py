@@ -0,0 +1,126 @@
+# app/repositories/pagination.py
+
+"""
+Pagination par clé (keyset / seek) des lectures des repositories.
+
+Au lieu de sauter `offset` lignes (coût proportionnel à la profondeur de la
+page), la requête reprend juste après la dernière ligne de la page précédente :
+WHERE (clé de tri) > (clé de la dernière ligne) ORDER BY clé LIMIT n.
+Servie par un index sur la clé de tri, chaque page coûte O(n), quelle que
+soit sa position.
+
+La clé de tri se termine toujours par l'identifiant : elle est unique, donc
+l'ordre est stable et aucune ligne n'est sautée ni répétée d'une page à l'autre.
+"""
+
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Position dans une lecture paginée, à repasser tel quel pour la page suivante.
+
+    Attributs :
+        key: valeurs de la clé de tri de la dernière ligne lue
+        position: nombre de lignes déjà lues (numérotation des lignes)
+    """
+    key: Tuple
+    position: int = 0
+
+
+@dataclass
+class Page(Generic[T]):
+    """Une page de résultats ; next_cursor vaut None sur la dernière page."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[Cursor] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _after(columns: Sequence, values: Sequence):
+    """
+    Condition « clé > valeurs » dans l'ordre ASC de SQLite (NULL en premier).
+
+    Écrite en OU imbriqués plutôt qu'en comparaison de tuples : une valeur
+    NULL (ex. track_number absent) rendrait la comparaison de tuples indéfinie.
+    """
+    column, value = columns[0], values[0]
+    if value is None:
+        greater, equal = column.is_not(None), column.is_(None)
+    else:
+        greater, equal = column > value, column == value
+
+    if len(columns) == 1:
+        return greater
+    return or_(greater, and_(equal, _after(columns[1:], values[1:])))
+
+
+def keyset_page(query: Query, order_by: Sequence, cursor: Optional[Cursor] = None, limit: int = 100) -> Page:
+    """
+    Lit une page d'une requête ORM, triée sur order_by, après cursor.
+
+    Args:
+        query: requête ORM (filtres déjà appliqués, sans tri ni limite)
+        order_by: attributs ORM de la clé de tri, le dernier étant l'identifiant
+        cursor: position retournée par la page précédente (None : première page)
+        limit: taille de la page
+
+    Returns:
+        Page : lignes de la page et curseur de la suivante
+    """
+    if cursor is not None:
+        condition = _after(order_by, cursor.key)
+        first = cursor.key[0]
+        if first is not None:
+            # Borne basse simple : point d'entrée de l'index pour SQLite
+            condition = and_(order_by[0] >= first, condition)
+        query = query.filter(condition)
+
+    # Une ligne de plus que demandé : indique s'il reste une page
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+    items = rows[:limit]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        position = (cursor.position if cursor else 0) + len(items)
+        next_cursor = Cursor(tuple(getattr(last, column.key) for column in order_by), position)
+
+    return Page(items, next_cursor)
+
+
+def offset_page(query: Query, order_by: Sequence, position: int, limit: int = 100) -> Page:
+    """
+    Lit une page à une position arbitraire (saut direct, ex. barre de défilement).
+
+    Coût proportionnel à position : à réserver aux sauts, les pages suivantes
+    se lisent ensuite par clé avec le curseur retourné.
+
+    Args:
+        query: requête ORM (filtres déjà appliqués, sans tri ni limite)
+        order_by: attributs ORM de la clé de tri, le dernier étant l'identifiant
+        position: nombre de lignes à sauter
+        limit: taille de la page
+
+    Returns:
+        Page : lignes de la page et curseur de la suivante (position renseignée)
+    """
+    rows = query.order_by(*order_by).offset(position).limit(limit + 1).all()
+    items = rows[:limit]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = Cursor(tuple(getattr(last, column.key) for column in order_by), position + len(items))
+
+    return Page(items, next_cursor)
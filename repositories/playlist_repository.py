@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.playlist import Playlist, playlist_track_association
 from app.models.track import Track
+from repositories.pagination import Cursor, Page, keyset_page
 
 
 class PlaylistRepository:
@@ -45,6 +46,10 @@ class PlaylistRepository:
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Playlist]:
         return self.db.query(Playlist).order_by(Playlist.name).offset(skip).limit(limit).all()
+
+
+    def get_page(self, cursor: Optional[Cursor] = None, limit: int = 100) -> Page[Playlist]:
+        return keyset_page(self.db.query(Playlist), (Playlist.name, Playlist.id), cursor, limit)
     
     
     # ========================= #
@@ -120,4 +125,16 @@ class PlaylistRepository:
             .all()
         )
         
-        
\ No newline at end of file
+        
+
+    def get_tracks_page(self, playlist_id: int, cursor: Optional[Cursor] = None, limit: int = 100) -> Page[Track]:
+        """
+        Page des tracks d'une playlist, triés par numéro de piste.
+        Le tri porte sur les seuls tracks de la playlist (taille de la playlist, pas de la bibliothèque).
+        """
+        query = (
+            self.db.query(Track)
+            .join(playlist_track_association, Track.id == playlist_track_association.c.track_id)
+            .filter(playlist_track_association.c.playlist_id == playlist_id)
+        )
+        return keyset_page(query, (Track.track_number, Track.id), cursor, limit)
@@ -1,11 +1,29 @@
 # app/repositories/tack_repository.py
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select, delete, update, and_, true
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from app.models.track import Track, playlist_track_association
+from app.models.duplicate_file import DuplicateFile
+from repositories.pagination import Cursor, Page, keyset_page
 
 
+# Ordre de la bibliothèque (album, numéro de piste), identifiant en dernier : clé unique
+LIBRARY_ORDER = (Track.album_id, Track.track_number, Track.id)
+
+
+def path_prefix_filter(column, path_prefix: str):
+    """
+    Condition « column commence par path_prefix », écrite en intervalle
+    [path_prefix, path_prefix⁺) : servie par l'index de la colonne, là où
+    LIKE 'prefix%' (insensible à la casse sous SQLite) parcourt toute la table.
+    """
+    if not path_prefix:
+        return true()
+    upper_bound = path_prefix[:-1] + chr(ord(path_prefix[-1]) + 1)
+    return and_(column >= path_prefix, column < upper_bound)
+
 
 class TrackRepository:
     def __init__(self, db: Session):
@@ -20,7 +38,9 @@ class TrackRepository:
         artist_id: int, album_id: int,
         format: Optional[str] = None,
         duration_seconds: Optional[int] = None,
-        track_number: Optional[int] = None
+        track_number: Optional[int] = None,
+        file_size: Optional[int] = None,
+        file_mtime_ns: Optional[int] = None
     ) -> Optional[Track]:
         
         track = Track(
@@ -28,7 +48,9 @@ class TrackRepository:
             artist_id=artist_id, album_id=album_id,
             format=format,
             duration_seconds=duration_seconds,
-            track_number=track_number
+            track_number=track_number,
+            file_size=file_size,
+            file_mtime_ns=file_mtime_ns
         )
         
         try:
@@ -63,13 +85,113 @@ class TrackRepository:
 
 
     def get_by_artist(self, artist_id: int, skip: int = 0, limit: int = 100) -> List[Track]:
-        return self.db.query(Track).filter_by(artist_id=artist_id).offset(skip).limit(limit).all()
+        return (
+            self.db.query(Track)
+            .filter_by(artist_id=artist_id)
+            .order_by(Track.album_id, Track.track_number)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
 
     def get_by_album(self, album_id: int, skip: int = 0, limit: int = 100) -> List[Track]:
         return self.db.query(Track).filter_by(album_id=album_id).order_by(Track.track_number).offset(skip).limit(limit).all()
 
 
+    def get_page(self, cursor: Optional[Cursor] = None, limit: int = 100) -> Page[Track]:
+        """Page de la bibliothèque, dans l'ordre (album, numéro de piste)."""
+        return keyset_page(self.db.query(Track), LIBRARY_ORDER, cursor, limit)
+
+
+    def get_page_by_artist(self, artist_id: int, cursor: Optional[Cursor] = None, limit: int = 100) -> Page[Track]:
+        return keyset_page(self.db.query(Track).filter_by(artist_id=artist_id), LIBRARY_ORDER, cursor, limit)
+
+
+    def get_page_by_album(self, album_id: int, cursor: Optional[Cursor] = None, limit: int = 100) -> Page[Track]:
+        return keyset_page(
+            self.db.query(Track).filter_by(album_id=album_id), (Track.track_number, Track.id), cursor, limit
+        )
+
+
+    def get_by_genre(self, genre: str, skip: int = 0, limit: int = 100) -> List[Track]:
+        return (
+            self.db.query(Track)
+            .filter_by(genre=genre)
+            .order_by(Track.album_id, Track.track_number)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+
+    def get_favorites(self, skip: int = 0, limit: int = 100) -> List[Track]:
+        return (
+            self.db.query(Track)
+            .filter(Track.is_favorite.is_(True))
+            .order_by(Track.album_id, Track.track_number)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+
+    def get_file_states(self, path_prefix: str) -> Dict[str, Tuple[int, Optional[int], Optional[int]]]:
+        """Retourne {file_path: (id, file_size, file_mtime_ns)} des tracks sous un dossier, en une requête."""
+        rows = self.db.execute(
+            select(Track.file_path, Track.id, Track.file_size, Track.file_mtime_ns)
+            .where(path_prefix_filter(Track.file_path, path_prefix))
+        )
+        return {file_path: (track_id, size, mtime_ns) for file_path, track_id, size, mtime_ns in rows}
+
+
+    def get_file_states_by_paths(
+        self, file_paths: Iterable[str], chunk_size: int = 500
+    ) -> Dict[str, Tuple[int, Optional[int], Optional[int]]]:
+        """Retourne {file_path: (id, file_size, file_mtime_ns)} pour une liste de chemins."""
+        paths = list(file_paths)
+        states = {}
+        
+        for start in range(0, len(paths), chunk_size):
+            rows = self.db.execute(
+                select(Track.file_path, Track.id, Track.file_size, Track.file_mtime_ns)
+                .where(Track.file_path.in_(paths[start:start + chunk_size]))
+            )
+            states.update({file_path: (track_id, size, mtime_ns) for file_path, track_id, size, mtime_ns in rows})
+        
+        return states
+
+
+    def get_fingerprint_candidates(
+        self, quick_keys: Iterable[str], sizes: Iterable[int], chunk_size: int = 500
+    ) -> List[Tuple[int, str, Optional[int], Optional[str], Optional[str]]]:
+        """
+        Tracks susceptibles d'avoir le même contenu : même clé rapide, ou même taille
+        pour les tracks importés avant le calcul des empreintes (clé encore inconnue).
+
+        Returns:
+            List[Tuple] : (id, file_path, file_size, quick_key, content_hash)
+        """
+        keys = list(quick_keys)
+        size_list = list(sizes)
+        columns = (Track.id, Track.file_path, Track.file_size, Track.quick_key, Track.content_hash)
+        candidates = {}
+
+        for start in range(0, len(keys), chunk_size):
+            rows = self.db.execute(select(*columns).where(Track.quick_key.in_(keys[start:start + chunk_size])))
+            candidates.update((row[0], tuple(row)) for row in rows)
+
+        for start in range(0, len(size_list), chunk_size):
+            rows = self.db.execute(
+                select(*columns).where(
+                    Track.quick_key.is_(None), Track.file_size.in_(size_list[start:start + chunk_size])
+                )
+            )
+            candidates.update((row[0], tuple(row)) for row in rows)
+
+        return list(candidates.values())
+
+
     def get_in_playlist(self, playlist_id: int, skip: int = 0, limit: int = 100) -> List[Track]:
         return (
             self.db.query(Track)
@@ -101,6 +223,13 @@ class TrackRepository:
         return track
     
     
+    def set_fingerprints(self, rows: List[dict]) -> None:
+        """Enregistre des empreintes calculées après coup : [{"id", "quick_key", "content_hash"}]."""
+        if rows:
+            self.db.execute(update(Track), rows)
+            self.db.flush()
+    
+    
     # ========================= #
     #          DELETE           #
     # ========================= #
@@ -115,4 +244,21 @@ class TrackRepository:
         
         return True
     
-    
\ No newline at end of file
+    
+
+    def delete_many(self, track_ids: Iterable[int], chunk_size: int = 500) -> int:
+        """Supprime des tracks (et leurs liens de playlist et copies connues) en requêtes groupées."""
+        ids = list(track_ids)
+        deleted = 0
+        
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            self.db.execute(
+                delete(playlist_track_association)
+                .where(playlist_track_association.c.track_id.in_(chunk))
+            )
+            self.db.execute(delete(DuplicateFile).where(DuplicateFile.track_id.in_(chunk)))
+            deleted += self.db.execute(delete(Track).where(Track.id.in_(chunk))).rowcount
+        self.db.flush()
+        
+        return deleted
@@ -0,0 +1,53 @@
+# app/repositories/watched_folder_repository.py
+
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from app.models.watched_folder import WatchedFolder
+
+
+class WatchedFolderRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+
+    # ========================= #
+    #          CREATE           #
+    # ========================= #
+    def create(self, path: str) -> WatchedFolder:
+        folder = WatchedFolder(path=path)
+        
+        try:
+            self.db.add(folder)
+            self.db.flush()
+        except IntegrityError:
+            self.db.rollback()
+            folder = self.db.query(WatchedFolder).filter_by(path=path).first()
+        
+        return folder
+
+
+    # ========================= #
+    #           READ            #
+    # ========================= #
+    def get_by_path(self, path: str) -> Optional[WatchedFolder]:
+        return self.db.query(WatchedFolder).filter_by(path=path).first()
+
+
+    def get_all(self) -> List[WatchedFolder]:
+        return self.db.query(WatchedFolder).order_by(WatchedFolder.path).all()
+
+
+    # ========================= #
+    #          DELETE           #
+    # ========================= #
+    def delete_by_path(self, path: str) -> bool:
+        folder = self.get_by_path(path)
+        
+        if not folder:
+            return False
+        
+        self.db.delete(folder)
+        self.db.flush()
+        
+        return True
@@ -24,7 +24,7 @@ from core.utils.style_manager import StyleManager
 
 from core.logger import logger
 
-from database.engine import SessionLocal
+from database.engine import SessionLocal, ReadSessionLocal
 from database.init_db import init_db
 
 
@@ -45,7 +45,7 @@ def main():
         #   Initialisation DB       #
         # ========================= #
         logger.info("Initialisation de la base de données...")
-        init_db()
+        backfill_runner = init_db()
 
 
         # ============================== #
@@ -53,6 +53,8 @@ def main():
         # ============================== #
         logger.info("Création de l'application Qt...")
         app = QApplication(sys.argv)
+        # Remplissage des colonnes dérivées : arrêt entre deux lots à la fermeture
+        app.aboutToQuit.connect(backfill_runner.stop)
 
         # Application de la feuille de style globale
         StyleManager.load_stylesheet(app)
@@ -65,7 +67,13 @@ def main():
         #   Manager de l'application
         # ========================= #
         logger.info("Initialisation du manager de l'application...")
-        manager = AppManager(session_factory=SessionLocal)
+        manager = AppManager(session_factory=SessionLocal, read_session_factory=ReadSessionLocal)
+        # Lectures en arrière-plan : abandon de la file, attente de celles en cours
+        app.aboutToQuit.connect(manager.query_executor.shutdown)
+        # Surveillance des dossiers : timers et indexation arrêtés à la fermeture
+        app.aboutToQuit.connect(manager.library_watcher.stop)
+        # Imports en cours : annulés, puis attendus avant la destruction de leurs threads
+        app.aboutToQuit.connect(manager.import_scheduler.shutdown)
         manager.run()
 
 
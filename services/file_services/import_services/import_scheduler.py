@@ -0,0 +1,424 @@
+# services/file_services/import_services/import_scheduler.py
+
+
+import os
+import heapq
+import itertools
+from enum import Enum, IntEnum
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
+
+from app.application.import_track.import_worker import ImportWorker
+from app.application.import_track.sync_worker import SyncWorker
+from app.application.import_track.import_result import ImportResult
+from app.application.import_track.import_progress import ImportProgress
+from services.file_services.library_services.library_services import LibraryServices
+
+from core.logger import logger
+
+
+class ImportPriority(IntEnum):
+    # Plus petit = plus prioritaire
+    WATCH = 0   # synchronisation déclenchée par la surveillance des dossiers
+    USER = 1    # import demandé depuis l'interface
+    BULK = 2    # import de masse (reprise, réimport complet…)
+
+
+class ScheduledJobState(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    FINISHED = "finished"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+
+@dataclass
+class ScheduledJob:
+    """Travail confié au scheduler : import d'un dossier ou synchronisation de fichiers isolés."""
+    key: int
+    priority: ImportPriority
+    root_path: Optional[str] = None
+    incremental: bool = False
+    changed_paths: List[str] = field(default_factory=list)
+    removed_paths: List[str] = field(default_factory=list)
+    state: ScheduledJobState = ScheduledJobState.QUEUED
+    progress: Optional[ImportProgress] = None
+    # Job persisté (import_jobs), préparé au démarrage
+    job_id: Optional[int] = None
+    # Demandes fusionnées dans ce job (dossiers inclus) : toutes reçoivent ses signaux
+    keys: Set[int] = field(default_factory=set)
+    worker: Optional[QThread] = None
+
+    @property
+    def is_sync(self) -> bool:
+        return self.root_path is None
+
+
+class ImportScheduler(QObject):
+    """
+    File d'attente des imports, partagée par toute l'application.
+
+    Rôle :
+        - Mettre en file plusieurs imports de dossiers et synchronisations
+        - En exécuter au plus max_concurrent à la fois, par priorité puis ordre d'arrivée
+        - Réserver une place aux synchronisations (WATCH) : elles passent devant
+          les imports de masse sans attendre qu'ils se terminent
+        - Fusionner les dossiers qui se recouvrent (un sous-dossier d'un import
+          en file ou en cours n'est pas importé deux fois) ; un dossier parent
+          d'un import en cours attend sa fin, puis est importé en incrémental
+        - Exposer la progression de chaque job et son annulation
+
+    Chaque demande reçoit une clé ; les signaux portent la clé de la demande.
+    """
+
+    job_queued = Signal(int)
+    job_started = Signal(int)
+    job_progress = Signal(int, object)       # clé, ImportProgress
+    job_finished = Signal(int, object)       # clé, ImportResult
+    job_cancelled = Signal(int, object)      # clé, ImportResult partiel (None si jamais démarré)
+    job_failed = Signal(int, str)
+
+    MAX_CONCURRENT = 2
+    # Places supplémentaires réservées aux synchronisations
+    WATCH_SLOTS = 1
+
+    def __init__(self, library_service: LibraryServices, max_concurrent: int = MAX_CONCURRENT, parent=None):
+        """
+        Args:
+            library_service: service d'import partagé
+            max_concurrent: imports simultanés (hors places réservées aux synchronisations)
+        """
+        super().__init__(parent)
+        self._library_service = library_service
+        self.max_concurrent = max(1, max_concurrent)
+        self._keys = itertools.count(1)
+        self._sequence = itertools.count()
+        # File : (priorité, ordre d'arrivée, clé du job)
+        self._queue: List[tuple] = []
+        self._jobs: Dict[int, ScheduledJob] = {}
+        # Clé d'une demande -> clé du job qui la sert
+        self._aliases: Dict[int, int] = {}
+        # Plus aucun job ne démarre (fermeture de l'application)
+        self._stopped = False
+
+
+    @classmethod
+    def extraction_workers(cls, cpu_count: Optional[int] = None) -> int:
+        """
+        Process d'extraction par import : les cœurs sont partagés entre les
+        places d'exécution (imports simultanés et synchronisations).
+        """
+        cpu_count = cpu_count or os.cpu_count() or 1
+        return max(1, cpu_count // (cls.MAX_CONCURRENT + cls.WATCH_SLOTS))
+
+
+    # ========================== #
+    #        Mise en file        #
+    # ========================== #
+    def enqueue_import(
+        self,
+        root_path: str,
+        incremental: bool = False,
+        priority: ImportPriority = ImportPriority.USER
+    ) -> int:
+        """
+        Met en file l'import d'un dossier.
+
+        Un dossier déjà couvert par un import en file ou en cours rejoint ce job ;
+        les imports en file de ses sous-dossiers sont absorbés par le nouveau job.
+
+        Returns:
+            int : clé de la demande (à utiliser pour les signaux et cancel)
+        """
+        key = next(self._keys)
+        root_path = os.path.normpath(root_path)
+
+        covering = self._covering_job(root_path)
+        if covering is not None:
+            covering.keys.add(key)
+            covering.incremental = covering.incremental and incremental
+            self._aliases[key] = covering.key
+            if covering.state == ScheduledJobState.QUEUED and priority < covering.priority:
+                covering.priority = priority
+                self._requeue(covering)
+            logger.info(f"ImportScheduler : {root_path} déjà couvert par le job {covering.key}")
+            self.job_queued.emit(key)
+            return key
+
+        job = ScheduledJob(key=key, priority=priority, root_path=root_path, incremental=incremental, keys={key})
+        for absorbed in self._queued_subfolder_jobs(root_path):
+            logger.info(f"ImportScheduler : Job {absorbed.key} ({absorbed.root_path}) absorbé par {root_path}")
+            self._queue = [entry for entry in self._queue if entry[2] != absorbed.key]
+            heapq.heapify(self._queue)
+            del self._jobs[absorbed.key]
+            job.keys |= absorbed.keys
+            job.priority = min(job.priority, absorbed.priority)
+            job.incremental = job.incremental and absorbed.incremental
+            for absorbed_key in absorbed.keys:
+                self._aliases[absorbed_key] = key
+
+        self._add(job)
+        return key
+
+
+    def enqueue_sync(self, changed_paths: List[str], removed_paths: List[str]) -> int:
+        """Met en file une synchronisation de fichiers isolés (prioritaire)."""
+        key = next(self._keys)
+        job = ScheduledJob(
+            key=key, priority=ImportPriority.WATCH,
+            changed_paths=list(changed_paths), removed_paths=list(removed_paths), keys={key}
+        )
+        self._add(job)
+        return key
+
+
+    def cancel(self, key: int) -> bool:
+        """
+        Annule une demande : retirée de la file si elle n'a pas démarré, sinon interrompue.
+
+        Une demande fusionnée avec d'autres (dossier inclus, même dossier) en est
+        seulement détachée : le job continue pour les autres demandes.
+
+        Returns:
+            bool : False si la demande est inconnue ou déjà terminée
+        """
+        job = self.job(key)
+        if job is None:
+            return False
+
+        if len(job.keys) > 1:
+            job.keys.discard(key)
+            self._aliases.pop(key, None)
+            logger.info(f"ImportScheduler : Demande {key} détachée du job {job.key}")
+            self.job_cancelled.emit(key, None)
+            return True
+        return self._cancel_job(job)
+
+
+    def cancel_all(self) -> None:
+        """Annule tous les jobs (en file et en cours), pour toutes leurs demandes."""
+        for job in list(self._jobs.values()):
+            self._cancel_job(job)
+
+
+    def _cancel_job(self, job: ScheduledJob) -> bool:
+        """Annule un job pour toutes les demandes qu'il sert."""
+        if job.state == ScheduledJobState.QUEUED:
+            self._queue = [entry for entry in self._queue if entry[2] != job.key]
+            heapq.heapify(self._queue)
+            job.state = ScheduledJobState.CANCELLED
+            self._finish(job, lambda k: self.job_cancelled.emit(k, None))
+            return True
+
+        if job.state == ScheduledJobState.RUNNING and isinstance(job.worker, ImportWorker):
+            logger.info(f"ImportScheduler : Annulation du job {job.key}")
+            job.worker.cancel()
+            return True
+        return False
+
+
+    def shutdown(self, timeout_ms: int = 5000) -> None:
+        """Annule tous les jobs et attend la fin des workers en cours (fermeture de l'application)."""
+        self._stopped = True
+        self.cancel_all()
+        for job in list(self._jobs.values()):
+            if job.worker is not None and not job.worker.wait(timeout_ms):
+                logger.warning(f"ImportScheduler : Job {job.key} toujours en cours à la fermeture")
+        logger.info("ImportScheduler : arrêté")
+
+
+    # ========================== #
+    #        Consultation        #
+    # ========================== #
+    def job(self, key: int) -> Optional[ScheduledJob]:
+        """Job servant une demande (None une fois terminé ou la demande annulée)."""
+        job = self._jobs.get(self._aliases.get(key, key))
+        if job is None or key not in job.keys:
+            return None
+        return job
+
+
+    def jobs(self) -> List[ScheduledJob]:
+        """Jobs en cours puis en file, dans l'ordre où ils seront traités."""
+        running = [job for job in self._jobs.values() if job.state == ScheduledJobState.RUNNING]
+        queued = [self._jobs[job_key] for _, _, job_key in sorted(self._queue)]
+        return running + queued
+
+
+    def is_busy(self) -> bool:
+        return bool(self._jobs)
+
+
+    # ========================== #
+    #        Exécution           #
+    # ========================== #
+    def _add(self, job: ScheduledJob) -> None:
+        self._jobs[job.key] = job
+        heapq.heappush(self._queue, (job.priority, next(self._sequence), job.key))
+        for key in job.keys:
+            self.job_queued.emit(key)
+        # Démarrage au retour dans la boucle d'événements : l'appelant connaît sa clé
+        # avant le premier signal du job
+        QTimer.singleShot(0, self._start_next)
+
+
+    def _requeue(self, job: ScheduledJob) -> None:
+        self._queue = [entry for entry in self._queue if entry[2] != job.key]
+        heapq.heapify(self._queue)
+        heapq.heappush(self._queue, (job.priority, next(self._sequence), job.key))
+
+
+    def _start_next(self) -> None:
+        """
+        Démarre les jobs de tête tant qu'il reste des places.
+
+        Un import dont le dossier recouvre celui d'un import en cours reste en
+        file (à sa place) jusqu'à la fin de celui-ci, puis démarre en
+        incrémental : les fichiers déjà importés sont ignorés.
+        """
+        if self._stopped:
+            return
+
+        waiting = []
+        while self._queue:
+            priority, _, job_key = self._queue[0]
+            running = sum(1 for job in self._jobs.values() if job.state == ScheduledJobState.RUNNING)
+            limit = self.max_concurrent + (self.WATCH_SLOTS if priority == ImportPriority.WATCH else 0)
+            if running >= limit:
+                break
+            entry = heapq.heappop(self._queue)
+            job = self._jobs[job_key]
+            if self._running_overlap(job) is not None:
+                job.incremental = True
+                waiting.append(entry)
+                continue
+            self._start(job)
+
+        for entry in waiting:
+            heapq.heappush(self._queue, entry)
+
+
+    def _start(self, job: ScheduledJob) -> None:
+        job.state = ScheduledJobState.RUNNING
+
+        if job.is_sync:
+            worker = SyncWorker(self._library_service, job.changed_paths, job.removed_paths)
+            worker.synced.connect(lambda result, *_: self._on_result(job, result))
+            worker.finished.connect(lambda: self._on_thread_done(job))
+        else:
+            try:
+                job.job_id, resumed = self._library_service.prepare_import_job(
+                    job.root_path, incremental=job.incremental
+                )
+            except Exception as e:
+                logger.exception(f"ImportScheduler : Préparation du job {job.key} impossible")
+                job.state = ScheduledJobState.FAILED
+                self._finish(job, lambda k: self.job_failed.emit(k, str(e)))
+                return
+            worker = ImportWorker(
+                library_service=self._library_service,
+                path=job.root_path,
+                incremental=job.incremental or resumed,
+                job_id=job.job_id
+            )
+            worker.progress_details.connect(lambda progress: self._on_progress(job, progress))
+            worker.finished.connect(lambda result: self._on_result(job, result))
+            worker.cancelled.connect(lambda result: self._on_cancelled(job, result))
+            worker.failed.connect(lambda message: self._on_failed(job, message))
+
+        job.worker = worker
+        logger.info(f"ImportScheduler : Démarrage du job {job.key} ({job.root_path or 'synchronisation'})")
+        for key in job.keys:
+            self.job_started.emit(key)
+        worker.start()
+
+
+    def _on_progress(self, job: ScheduledJob, progress: ImportProgress) -> None:
+        job.progress = progress
+        for key in job.keys:
+            self.job_progress.emit(key, progress)
+
+
+    def _on_result(self, job: ScheduledJob, result: ImportResult) -> None:
+        job.state = ScheduledJobState.FINISHED
+        if job.is_sync:
+            # Fin du thread signalée séparément (finished de QThread)
+            for key in job.keys:
+                self.job_finished.emit(key, result)
+            return
+        self._finish(job, lambda k: self.job_finished.emit(k, result))
+
+
+    def _on_cancelled(self, job: ScheduledJob, result: ImportResult) -> None:
+        job.state = ScheduledJobState.CANCELLED
+        self._finish(job, lambda k: self.job_cancelled.emit(k, result))
+
+
+    def _on_failed(self, job: ScheduledJob, message: str) -> None:
+        job.state = ScheduledJobState.FAILED
+        self._finish(job, lambda k: self.job_failed.emit(k, message))
+
+
+    def _on_thread_done(self, job: ScheduledJob) -> None:
+        """Fin d'un SyncWorker (résultat émis ou erreur)."""
+        if job.state == ScheduledJobState.RUNNING:
+            job.state = ScheduledJobState.FAILED
+            self._finish(job, lambda k: self.job_failed.emit(k, "Synchronisation interrompue"))
+            return
+        self._finish(job, None)
+
+
+    def _finish(self, job: ScheduledJob, emit) -> None:
+        """Retire le job, notifie chaque demande qu'il servait et libère sa place."""
+        self._jobs.pop(job.key, None)
+        for key in job.keys:
+            self._aliases.pop(key, None)
+            if emit:
+                emit(key)
+
+        worker, job.worker = job.worker, None
+        if worker is not None:
+            # Le signal est émis en fin de run() : le thread se termine aussitôt
+            worker.wait()
+            worker.deleteLater()
+        self._start_next()
+
+
+    # ========================== #
+    #     Recouvrement           #
+    # ========================== #
+    @staticmethod
+    def _contains(parent: str, path: str) -> bool:
+        return path == parent or path.startswith(os.path.join(parent, ""))
+
+
+    def _covering_job(self, root_path: str) -> Optional[ScheduledJob]:
+        """Import en file ou en cours dont le dossier contient root_path."""
+        for job in self._jobs.values():
+            if not job.is_sync and self._contains(job.root_path, root_path):
+                return job
+        return None
+
+
+    def _running_overlap(self, job: ScheduledJob) -> Optional[ScheduledJob]:
+        """Import en cours dont le dossier contient celui de job ou y est inclus."""
+        if job.is_sync:
+            return None
+        for running in self._jobs.values():
+            if (
+                running.state == ScheduledJobState.RUNNING and not running.is_sync
+                and (self._contains(job.root_path, running.root_path) or self._contains(running.root_path, job.root_path))
+            ):
+                return running
+        return None
+
+
+    def _queued_subfolder_jobs(self, root_path: str) -> List[ScheduledJob]:
+        """Imports encore en file dont le dossier est inclus dans root_path."""
+        return [
+            job for job in self._jobs.values()
+            if not job.is_sync and job.state == ScheduledJobState.QUEUED
+            and self._contains(root_path, job.root_path)
+        ]
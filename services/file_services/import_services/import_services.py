@@ -1,9 +1,11 @@
 # app/services/file_services/import_services/import_services.py
 
 
-from typing import Optional, Callable
+from typing import Dict, List, Optional, Callable
 
-from app.application.import_track.import_worker import ImportWorker
+from app.application.import_track.import_result import ImportResult
+from app.application.import_track.import_progress import ImportProgress
+from services.file_services.import_services.import_scheduler import ImportScheduler, ImportPriority
 
 from core.logger import logger
 
@@ -11,11 +13,15 @@ from core.logger import logger
 class ImportServices:
     """
     Service dédié à l'importation de fichiers musicaux.
-    Gère le worker, la progression, l'annulation et les callbacks.
+    Confie les imports à l'ImportScheduler partagé et relaie la progression,
+    l'annulation et les callbacks de chaque import qu'il a demandé.
     """
-    def __init__(self, library_service):
+    def __init__(self, library_service, import_scheduler: Optional[ImportScheduler] = None):
         self._library_service = library_service
-        self._worker: Optional[ImportWorker] = None
+        self._scheduler = import_scheduler or ImportScheduler(library_service)
+        # Clé de la demande -> callbacks
+        self._callbacks: Dict[int, dict] = {}
+        self._connected = False
 
 
     def start_import(
@@ -23,46 +29,106 @@ class ImportServices:
         path: str,
         progress_callback: Optional[Callable[[int], None]] = None,
         finished_callback: Optional[Callable] = None,
-        cancelled_callback: Optional[Callable] = None
-    ) -> Optional[ImportWorker]:
+        cancelled_callback: Optional[Callable] = None,
+        incremental: bool = False,
+        details_callback: Optional[Callable[[ImportProgress], None]] = None,
+        priority: ImportPriority = ImportPriority.USER,
+        failed_callback: Optional[Callable[[str], None]] = None
+    ) -> Optional[int]:
         """
-        Lance l'import depuis le chemin donné, avec callbacks pour progression et fin.
+        Met en file l'import depuis le chemin donné, avec callbacks pour progression et fin.
+
+        En mode incrémental, seuls les fichiers nouveaux ou modifiés sont relus.
+        Un import inachevé du même dossier (annulé, interrompu) est repris :
+        il repart en mode incrémental, les fichiers déjà importés sont ignorés.
+        details_callback reçoit la progression détaillée (phase, débit, temps restant).
+        cancelled_callback reçoit le résultat partiel (None si l'import n'a pas démarré).
+        failed_callback reçoit le message d'erreur d'un import en échec (à défaut,
+        cancelled_callback est appelé avec None) ; il sera repris comme un import annulé.
+        Un dossier déjà couvert par un import en file ou en cours rejoint cet import.
+
+        Returns:
+            int : clé de l'import (cancel_import, cleanup_worker)
         """
-        if self._worker and self._worker.isRunning():
-            logger.warning("Un import est déjà en cours")
-            return None
-
-        logger.info(f"Démarrage de l'import depuis {path}")
-        self._worker = ImportWorker(library_service=self._library_service, path=path)
-
-        # Connexion des callbacks
-        if progress_callback:
-            self._worker.progress.connect(progress_callback)
-        if finished_callback:
-            self._worker.finished.connect(finished_callback)
-        if cancelled_callback:
-            self._worker.cancelled.connect(cancelled_callback)
-
-        self._worker.start()
-        return self._worker
-
-    def cancel_import(self):
-        """Annule l'import en cours."""
-        if self._worker and self._worker.isRunning():
-            logger.info("Annulation de l'import demandée")
-            self._worker.cancel()
+        self._connect()
+        key = self._scheduler.enqueue_import(path, incremental=incremental, priority=priority)
+        logger.info(f"Import de {path} mis en file (demande {key})")
+        self._callbacks[key] = {
+            "progress": progress_callback,
+            "details": details_callback,
+            "finished": finished_callback,
+            "cancelled": cancelled_callback,
+            "failed": failed_callback,
+        }
+        return key
+
+    def pending_results(self) -> List[ImportResult]:
+        """Résultats des imports terminés pendant que l'interface était fermée."""
+        return self._library_service.pending_import_results()
+
+    def acknowledge(self, job_id: Optional[int]) -> None:
+        """Marque le résultat d'un import comme présenté."""
+        if job_id is not None:
+            self._library_service.acknowledge_import(job_id)
+
+    def cancel_import(self, key: Optional[int] = None):
+        """Annule un import (par défaut, tous ceux demandés par ce service)."""
+        keys = [key] if key is not None else list(self._callbacks)
+        cancelled = [k for k in keys if self._scheduler.cancel(k)]
+        if cancelled:
+            logger.info(f"Annulation de l'import demandée ({len(cancelled)})")
         else:
             logger.info("Aucun import en cours à annuler")
 
-    def cleanup_worker(self):
-        """Déconnecte les signaux et supprime le worker pour éviter les memory leaks."""
-        if self._worker:
-            try:
-                self._worker.progress.disconnect()
-                self._worker.finished.disconnect()
-                self._worker.cancelled.disconnect()
-            except TypeError:
-                pass
-            self._worker = None
-            
-            
\ No newline at end of file
+    def cleanup_worker(self, key: Optional[int] = None):
+        """Oublie les callbacks d'un import (tous par défaut) et se déconnecte du scheduler une fois inutile."""
+        if key is None:
+            self._callbacks.clear()
+        else:
+            self._callbacks.pop(key, None)
+        if self._callbacks or not self._connected:
+            return
+        try:
+            self._scheduler.job_progress.disconnect(self._on_progress)
+            self._scheduler.job_finished.disconnect(self._on_finished)
+            self._scheduler.job_cancelled.disconnect(self._on_cancelled)
+            self._scheduler.job_failed.disconnect(self._on_failed)
+        except (TypeError, RuntimeError):
+            pass
+        self._connected = False
+
+
+    # ========================== #
+    #   Relais des signaux       #
+    # ========================== #
+    def _connect(self):
+        if self._connected:
+            return
+        self._scheduler.job_progress.connect(self._on_progress)
+        self._scheduler.job_finished.connect(self._on_finished)
+        self._scheduler.job_cancelled.connect(self._on_cancelled)
+        self._scheduler.job_failed.connect(self._on_failed)
+        self._connected = True
+
+    def _call(self, key: int, name: str, *args):
+        callback = self._callbacks.get(key, {}).get(name)
+        if callback:
+            callback(*args)
+
+    def _on_progress(self, key: int, progress: ImportProgress):
+        self._call(key, "progress", progress.percent)
+        self._call(key, "details", progress)
+
+    def _on_finished(self, key: int, result: ImportResult):
+        self._call(key, "finished", result)
+
+    def _on_cancelled(self, key: int, result: Optional[ImportResult]):
+        self._call(key, "cancelled", result)
+
+    def _on_failed(self, key: int, message: str):
+        logger.error(f"Import {key} en échec : {message}")
+        # Le job persisté est marqué "failed" (RESUMABLE_STATUSES) : repris au prochain import du dossier
+        if self._callbacks.get(key, {}).get("failed"):
+            self._call(key, "failed", message)
+        else:
+            self._call(key, "cancelled", None)
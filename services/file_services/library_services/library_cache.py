@@ -0,0 +1,227 @@
+# services/file_services/library_services/library_cache.py
+
+
+from typing import Callable, List, Optional, Sequence
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from app.view_models.track_store import TrackRow, TrackStore
+from core.entities.track import Track
+from database import change_events
+from repositories.pagination import Cursor, Page
+from services.file_services.library_services.query_executor import QueryExecutor
+from services.file_services.library_services.track_read_service import TrackReadService
+
+from core.logger import logger
+
+
+class LibraryCache(QObject):
+    """
+    Cache partagé de la bibliothèque : instantané des pistes en mémoire,
+    stocké en colonnes (TrackStore, une centaine d'octets par piste).
+
+    Rôle :
+        - Lire la bibliothèque une seule fois, hors du thread GUI et page par
+          page, puis servir le même instantané à toutes les vues (tris,
+          panneau des playlists, lecteur)
+        - L'invalider quand un commit écrit une colonne affichée de la
+          bibliothèque (database.change_events : imports, synchronisations,
+          repositories) ; les remplissages de colonnes dérivées (empreintes…)
+          sont ignorés
+        - Le relire une fois les écritures calmées (RELOAD_DELAY_MS), puis
+          prévenir les vues par le signal refreshed : elles redemandent les pistes
+
+    L'instantané est un TrackStore partagé, lu au travers de vues TrackRow :
+    les consumers ne le modifient pas (une relecture en construit un nouveau)
+    et n'en gardent pas de copie en Track.
+    """
+
+    # L'instantané n'est plus à jour
+    invalidated = Signal()
+    # Instantané relu après une invalidation : les vues affichant la bibliothèque la redemandent
+    refreshed = Signal()
+    # Relais des change_events, émis dans le thread du commit
+    _tables_changed = Signal(object)
+
+    # Colonnes lues par TrackReadService (projection des pistes, jointures comprises).
+    # Sans "id" : une mise à jour groupée par clé primaire le porte dans ses paramètres
+    DISPLAYED_COLUMNS = {
+        "tracks": frozenset({
+            "title", "file_path", "duration_seconds", "track_number",
+            "genre", "is_favorite", "artist_id", "album_id",
+        }),
+        "artists": frozenset({"name"}),
+        "albums": frozenset({"title", "release_year", "jacket_path"}),
+    }
+    # Calme attendu après la dernière invalidation avant de relire (imports par lots)
+    RELOAD_DELAY_MS = 1000
+    # Lecture progressive : première page, puis pages suivantes
+    FIRST_PAGE = 200
+    PAGE_SIZE = 5000
+
+    def __init__(self, query_executor: QueryExecutor, parent=None):
+        """
+        Args:
+            query_executor: exécuteur des lectures hors du thread GUI
+        """
+        super().__init__(parent)
+        self.query_executor = query_executor
+        self._snapshot: Optional[TrackStore] = None
+        # Pistes déjà lues par le chargement en cours (None : aucun chargement)
+        self._loading: Optional[TrackStore] = None
+        # Une écriture est arrivée pendant le chargement : son résultat n'est pas gardé
+        self._stale_load = False
+        # Relecture d'un chargement croisé par une écriture en cours
+        self._retrying = False
+        self._waiters: List[Callable[[TrackStore], None]] = []
+        # [callback, première page déjà remise]
+        self._streams: List[list] = []
+        # Des vues ont reçu des pistes : elles sont prévenues des relectures
+        self._in_use = False
+        # Chargement lancé par la relecture automatique : refreshed à sa fin
+        self._refreshing = False
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(self.RELOAD_DELAY_MS)
+        self._reload_timer.timeout.connect(self._reload)
+
+        self._tables_changed.connect(self._on_tables_changed)
+        change_events.subscribe(self._tables_changed.emit)
+
+
+    @property
+    def snapshot(self) -> Optional[TrackStore]:
+        """Instantané courant, None s'il n'est pas chargé ou n'est plus à jour."""
+        return self._snapshot
+
+
+    # ========================= #
+    #   API publique            #
+    # ========================= #
+    def request_tracks(self, on_tracks: Callable[[TrackStore], None]) -> None:
+        """
+        Remet toutes les pistes (TrackStore, lignes TrackRow) à on_tracks :
+        immédiatement si l'instantané est à jour, sinon à la fin de sa lecture.
+        """
+        self._in_use = True
+        if self._snapshot is not None:
+            on_tracks(self._snapshot)
+            return
+        self._waiters.append(on_tracks)
+        self._ensure_loading()
+
+
+    def stream_tracks(self, on_page: Callable[[Sequence[TrackRow], bool], None]) -> None:
+        """
+        Remet les pistes à on_page(lignes, première) au fil de leur lecture :
+        l'instantané entier s'il est à jour, sinon les pages déjà lues en une
+        fois, puis chaque page suivante.
+        """
+        self._in_use = True
+        if self._snapshot is not None:
+            on_page(self._snapshot, True)
+            return
+
+        stream = [on_page, False]
+        if self._loading:
+            on_page(self._loading.rows(), True)
+            stream[1] = True
+        self._streams.append(stream)
+        self._ensure_loading()
+
+
+    def invalidate(self) -> None:
+        """
+        Oublie l'instantané ; un chargement en cours est relu une fois avant
+        d'être remis à ses waiters, et n'est pas gardé s'il reste croisé.
+        Les pistes sont relues après RELOAD_DELAY_MS sans nouvelle invalidation.
+        """
+        self._snapshot = None
+        if self._loading is not None:
+            self._stale_load = True
+        if self._in_use:
+            self._reload_timer.start()
+        logger.debug("LibraryCache : instantané invalidé")
+        self.invalidated.emit()
+
+
+    # ========================= #
+    #   Chargement              #
+    # ========================= #
+    def _ensure_loading(self) -> None:
+        if self._loading is not None:
+            return
+        self._loading = TrackStore()
+        self._stale_load = False
+        self._request_page(None, self.FIRST_PAGE)
+
+
+    def _request_page(self, cursor: Optional[Cursor], limit: int) -> None:
+        self.query_executor.submit(
+            lambda session: TrackReadService(session).get_tracks_page(cursor, limit),
+            on_result=self._on_page,
+            on_error=self._on_failed,
+        )
+
+
+    def _on_page(self, page: Page[Track]) -> None:
+        # Les Track de la page ne sont pas gardées : copiées dans le store
+        start = len(self._loading)
+        self._loading.extend(page.items)
+        for stream in self._streams:
+            on_page, delivered = stream
+            if delivered:
+                on_page(self._loading.rows(start), False)
+            else:
+                on_page(self._loading.rows(), True)
+                stream[1] = True
+
+        if page.has_more:
+            self._request_page(page.next_cursor, self.PAGE_SIZE)
+            return
+
+        tracks = self._loading
+        self._loading, self._streams = None, []
+        if self._stale_load and not self._retrying:
+            # Lecture croisée par une écriture : relue une fois avant d'être remise
+            self._retrying = True
+            self._ensure_loading()
+            return
+
+        self._retrying = False
+        waiters, self._waiters = self._waiters, []
+        if self._stale_load:
+            # Écritures continues (import) : pistes remises, relues au calme
+            self._reload_timer.start()
+        else:
+            self._snapshot = tracks
+            logger.info(f"LibraryCache : {len(tracks)} tracks en cache")
+        for on_tracks in waiters:
+            on_tracks(tracks)
+
+        if self._snapshot is not None and self._refreshing:
+            self._refreshing = False
+            self.refreshed.emit()
+
+
+    def _on_failed(self, message: str) -> None:
+        logger.error(f"LibraryCache : Échec de lecture de la bibliothèque : {message}")
+        self._loading, self._waiters, self._streams = None, [], []
+        self._refreshing = self._retrying = False
+
+
+    def _reload(self) -> None:
+        """Relecture automatique après invalidation ; un chargement en cours en tient lieu."""
+        if self._snapshot is not None:
+            return
+        self._refreshing = True
+        self._ensure_loading()
+
+
+    def _on_tables_changed(self, changes: change_events.Changes) -> None:
+        for table, columns in changes.items():
+            displayed = self.DISPLAYED_COLUMNS.get(table)
+            if displayed is not None and (columns is None or columns & displayed):
+                self.invalidate()
+                return
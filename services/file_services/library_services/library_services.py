@@ -1,11 +1,25 @@
 # services/file_services/library_services/library_services.py
 
 
-from typing import Callable, Iterator
+import os
+from typing import Callable, Collection, Iterator, List, Optional, Set, Tuple
 
 from app.application.import_track.file_importer import FileImporter
+from app.application.import_track.metadata_extractor import ParallelMetadataExtractor
 from app.application.import_track.db_importer import DBImporter
-from app.application.import_track.import_result import ImportResult, ImportStatus
+from app.application.import_track.identity_cache import ImportIdentityCache
+from app.application.import_track.import_result import BatchImportResult, ImportResult, ImportStatus
+from app.application.import_track.duplicate_detector import Duplicate, DuplicateDetector, DuplicatePolicy
+from app.application.import_track.cover_art import CoverArtExtractor
+from app.application.import_track.cancellation import CancellationToken
+from app.application.import_track.import_checkpoint import ImportCheckpoint
+from app.application.import_track.import_progress import ImportPhase, ImportProgress, ProgressReporter
+from app.models.import_job import ImportJobStatus
+from repositories.import_job_repository import ImportJobRepository
+from mappers.import_job_mapper import job_to_result
+from repositories.track_repository import TrackRepository
+from repositories.duplicate_file_repository import DuplicateFileRepository
+from repositories.album_repository import AlbumRepository
 
 from core.logger import logger
 
@@ -19,94 +33,569 @@ class LibraryServices:
         - Suivi de progression via callback
         - Annulation de l'import en cours
         - Fournir les pistes pour l'affichage ou le player
+        - Synchroniser des fichiers isolés (surveillance des dossiers)
+        - Suivre les jobs d'import persistés (reprise, résultats différés)
+        - Détecter les doublons de contenu (ignorés, liés ou signalés)
+        - Mettre en cache les pochettes des albums importés
     """
 
-    def __init__(self, session_factory):
+    # En deçà, la synchronisation extrait les métadonnées dans le thread appelant
+    SYNC_PARALLEL_THRESHOLD = 64
+
+    def __init__(
+        self,
+        session_factory,
+        extraction_workers: Optional[int] = None,
+        duplicate_policy: DuplicatePolicy = DuplicatePolicy.SKIP,
+        extract_covers: bool = True
+    ):
         """
         Initialise le service avec une session SQLAlchemy.
 
         Args:
             session_factory: callable retournant un contexte SQLAlchemy
+            extraction_workers: nombre de process pour l'extraction des métadonnées
+                                (défaut : nombre de cœurs, 1 = extraction dans le thread d'import)
+            duplicate_policy: traitement des fichiers dont le contenu est déjà dans la bibliothèque
+            extract_covers: extraire les pochettes des albums sans vignette en cache
         """
         self.session_factory = session_factory
-        self._cancelled = False
+        self.extraction_workers = extraction_workers
+        self.duplicate_policy = duplicate_policy
+        self.extract_covers = extract_covers
+        # Jetons d'annulation des imports en cours (plusieurs possibles en parallèle)
+        self._active_imports: Set[CancellationToken] = set()
         
     
     # ========================== #
     #       Importation          #
     # ========================== #     
-    def cancel_import(self):
-        """Annulation de l'importation en cours."""
+    def cancel_import(self, cancel_token: Optional[CancellationToken] = None):
+        """
+        Annulation d'un import en cours.
+
+        Scan, extraction et écriture s'arrêtent à leur prochaine vérification
+        du jeton (entrée de dossier, fichier, tranche), sans attendre la fin du lot.
+
+        Args:
+            cancel_token: jeton passé à import_from_directory ; sans argument,
+                          tous les imports en cours sont annulés
+        """
         logger.info("LibraryServices : Import annulé demandé")
-        self._cancelled = True
+        tokens = [cancel_token] if cancel_token is not None else list(self._active_imports)
+        for token in tokens:
+            token.cancel()
         
     
-    def _iter_files(self, root_path: str) -> Iterator[str]:
+    def _iter_files(self, file_importer: FileImporter, root_path: str, cancel_token: CancellationToken) -> Iterator[str]:
         """Itérateur paresseux pour tous les fichiers audio du dossier."""
-        file_importer = FileImporter()
-        for file_path in file_importer.scan_directory(root_path):
+        for file_path in file_importer.scan_directory(root_path, cancel_token):
+            if cancel_token.cancelled:
+                return
             yield file_path
             
             
     def import_from_directory(
-        self, root_path: str, progress_callback: Callable[[int], None] = None
+        self,
+        root_path: str,
+        progress_callback: Callable[[ImportProgress], None] = None,
+        incremental: bool = False,
+        job_id: Optional[int] = None,
+        duplicate_policy: Optional[DuplicatePolicy] = None,
+        cancel_token: Optional[CancellationToken] = None
     ) -> ImportResult:
         """
         Importation de tous les fichiers audio depuis un dossier donné.
 
+        Le scan est consommé au fil de l'eau : les chemins sont répartis par lots
+        sur un pool de process pour l'extraction Mutagen, et les métadonnées
+        reviennent (dans l'ordre d'achèvement) à ce thread, seul à écrire en base,
+        qui les insère par lots via DBImporter.import_batch.
+
+        En mode incrémental, l'état connu des fichiers du dossier (taille, mtime)
+        est chargé en une requête : seuls les fichiers nouveaux ou modifiés sont
+        relus, les fichiers modifiés sont mis à jour en place et les tracks dont
+        le fichier a disparu sont supprimés.
+
+        Avec un job_id, l'avancement est enregistré après chaque lot dans la
+        table import_jobs : le résultat retourné cumule alors toutes les
+        exécutions du job (reprise après fermeture ou plantage).
+
+        Les nouveaux fichiers passent par DuplicateDetector : un fichier dont la
+        charge audio existe déjà sous un autre chemin est ignoré, lié au track
+        existant ou importé et signalé, selon duplicate_policy. Les copies
+        ignorées ou liées sont enregistrées (duplicate_files) : inchangées, un
+        import incrémental ne les relit pas.
+
+        Les pochettes des albums rencontrés (sans vignette en cache) sont extraites
+        en tâche de fond par CoverArtExtractor ; ce thread enregistre les chemins.
+
+        Annulation (cancel_token) : le scan s'arrête à l'entrée de dossier suivante,
+        l'extraction au fichier suivant, l'écriture avant la tranche suivante.
+        Une tranche commencée est validée ou annulée en entier : imported/updated
+        comptent exactement les tracks conservés (ImportResult.kept).
+
         Args:
             root_path (str): dossier racine à scanner
-            progress_callback (Callable[[int], None], optional): fonction appelée avec un entier % pour la progression
+            progress_callback (Callable[[ImportProgress], None], optional): fonction appelée avec
+                la progression (%, phase, débit, temps restant, erreurs), au plus 20 fois par seconde
+            incremental (bool): ignorer les fichiers inchangés depuis le dernier import
+            job_id (int, optional): job d'import persisté à mettre à jour
+            duplicate_policy (DuplicatePolicy, optional): remplace la politique du service
+            cancel_token (CancellationToken, optional): annulation propre à cet import
+                (plusieurs imports peuvent tourner en parallèle, cf. cancel_import)
 
         Returns:
-            ImportResult : contient le statut (SUCCESS, PARTIAL, EMPTY, FAILED),
-                           le nombre de fichiers importés et les erreurs éventuelles
+            ImportResult : contient le statut (SUCCESS, PARTIAL, EMPTY, ERROR), l'annulation,
+                           le nombre de fichiers importés, les doublons et les erreurs éventuelles
         """
-        self._cancelled = False
-        logger.info(f"LibraryServices : Scan du dossier {root_path}")
+        policy = duplicate_policy or self.duplicate_policy
+        cancel_token = cancel_token or CancellationToken()
+        extractor = ParallelMetadataExtractor(workers=self.extraction_workers)
+        self._active_imports.add(cancel_token)
+        root_path = os.path.normpath(root_path)
+        logger.info(f"LibraryServices : Scan du dossier {root_path} (incrémental={incremental})")
+
+        reporter = ProgressReporter(progress_callback) if progress_callback else None
+        file_importer = FileImporter(
+            progress_callback=(lambda percent: reporter.update(scan_percent=percent)) if reporter else None
+        )
+        imported = updated = removed = skipped = 0
+        errors = []
+        # Doublons détectés : (fichier, fichier d'origine)
+        duplicates = []
+        total = 0
+        # Tracks connus sous le dossier : {file_path: (id, taille, mtime_ns)}
+        known_files = {}
+        # Copies déjà liées à un track : {file_path: (id, taille, mtime_ns)}, et celles à réexaminer
+        known_copies = {}
+        changed_copies = set()
+        # Fichiers modifiés à mettre à jour en place : {file_path: track_id}
+        modified = {}
+        # Fichiers passés par l'extraction (réussie ou non)
+        extracted = 0
+        last_path = None
+        checkpoint = ImportCheckpoint(self.session_factory, job_id) if job_id is not None else None
+        covers = CoverArtExtractor() if self.extract_covers else None
+
+        def counters() -> dict:
+            return {
+                "processed": extracted + skipped, "imported": imported, "updated": updated,
+                "removed": removed, "skipped": skipped, "error_count": len(errors),
+            }
+
+        def files_to_extract() -> Iterator[str]:
+            nonlocal total, skipped
+            for file_path in self._iter_files(file_importer, root_path, cancel_token):
+                total += 1
+                if reporter:
+                    reporter.update(discovered=total, processed=extracted + skipped)
+                known = known_files.pop(file_path, None)
+                copy = known_copies.pop(file_path, None) if known is None else None
+                if known is None and copy is None:
+                    yield file_path
+                    continue
+
+                _, size, mtime_ns = known or copy
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    # L'extraction rapportera l'erreur
+                    yield file_path
+                    continue
+
+                if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                    skipped += 1
+                elif known is not None:
+                    modified[file_path] = known[0]
+                    yield file_path
+                else:
+                    # Copie modifiée : redevient un nouveau fichier à dédoublonner
+                    changed_copies.add(file_path)
+                    yield file_path
+
+        try:
+            # On garde la session ouverte pendant toute la boucle
+            with self.session_factory() as session:
+                # Artistes/albums connus préchargés : résolus sans SQL pendant l'import
+                identity_cache = ImportIdentityCache()
+                identity_cache.warm(session)
+                db_importer = DBImporter(session, identity_cache=identity_cache, cancel_token=cancel_token)
+                detector = DuplicateDetector(session)
+
+                if incremental:
+                    prefix = os.path.join(root_path, "")
+                    known_files = TrackRepository(session).get_file_states(prefix)
+                    known_copies = DuplicateFileRepository(session).get_file_states(prefix)
+                    logger.info(
+                        f"LibraryServices : {len(known_files)} tracks et {len(known_copies)} copies "
+                        f"déjà connus sous {root_path}"
+                    )
+
+                for metadata_batch, batch_errors in extractor.extract(files_to_extract(), cancel_token):
+                    if cancel_token.cancelled:
+                        # Lot extrait après l'annulation : rien n'est écrit, il sera relu à la reprise
+                        logger.info("LibraryServices : Import annulé en cours")
+                        break
+                    errors.extend(batch_errors)
+                    extracted += len(metadata_batch) + len(batch_errors)
+                    if metadata_batch:
+                        last_path = metadata_batch[-1]["file_path"]
+
+                    new_rows = []
+                    changed_rows = []
+                    for metadata in metadata_batch:
+                        track_id = modified.pop(metadata["file_path"], None)
+                        if track_id is None:
+                            new_rows.append(metadata)
+                        else:
+                            changed_rows.append({**metadata, "track_id": track_id})
+
+                    # Insertion groupée : une transaction par lot, erreurs rapportées par fichier
+                    if new_rows:
+                        batch_result, batch_duplicates = self._import_new_rows(
+                            session, db_importer, detector, new_rows, policy, changed_copies
+                        )
+                        imported += batch_result.imported
+                        extracted -= batch_result.interrupted
+                        errors.extend(batch_result.errors)
+                        duplicates.extend((d.file_path, d.original_path) for d in batch_duplicates)
+                    if changed_rows:
+                        batch_result = db_importer.update_batch(changed_rows)
+                        updated += batch_result.imported
+                        extracted -= batch_result.interrupted
+                        errors.extend(batch_result.errors)
+                    if covers:
+                        self._queue_covers(session, db_importer, covers, metadata_batch)
+                        self._save_covers(db_importer, covers)
+
+                    if checkpoint:
+                        checkpoint.save(counters(), errors, last_path, duplicates=duplicates)
+                    if reporter:
+                        reporter.update(
+                            phase=ImportPhase.IMPORTING, processed=extracted + skipped,
+                            discovered=total, errors=len(errors)
+                        )
 
-        files = list(self._iter_files(root_path))
-        if not files:
+                    if cancel_token.cancelled:
+                        logger.info("LibraryServices : Import annulé en cours")
+                        break
+
+                # Fichiers disparus : uniquement après un scan complet, hors dossiers illisibles
+                if incremental and (known_files or known_copies) and not cancel_token.cancelled:
+                    if reporter:
+                        reporter.update(phase=ImportPhase.CLEANUP)
+                    unreadable = tuple(os.path.join(d, "") for d in file_importer.unreadable_dirs)
+                    vanished = [
+                        track_id for file_path, (track_id, _, _) in known_files.items()
+                        if not file_path.startswith(unreadable)
+                    ]
+                    vanished_copies = [path for path in known_copies if not path.startswith(unreadable)]
+                    try:
+                        if vanished:
+                            removed = db_importer.delete_tracks(vanished)
+                        if vanished_copies:
+                            db_importer.forget_duplicates(vanished_copies)
+                    except Exception as e:
+                        errors.append((root_path, str(e)))
+
+                if covers:
+                    self._save_covers(db_importer, covers, wait=not cancel_token.cancelled)
+
+        except Exception:
+            if checkpoint:
+                checkpoint.finish(ImportJobStatus.FAILED, counters(), errors, last_path, duplicates)
+            raise
+        finally:
+            self._active_imports.discard(cancel_token)
+            if covers:
+                covers.shutdown(cancel=True)
+
+        if reporter:
+            reporter.update(processed=extracted + skipped, errors=len(errors))
+            reporter.finish()
+
+        if checkpoint:
+            job_status = ImportJobStatus.CANCELLED if cancel_token.cancelled else ImportJobStatus.COMPLETED
+            result = checkpoint.finish(job_status, counters(), errors, last_path, duplicates)
+            logger.info(
+                f"LibraryServices : Job {job_id} ({result.status.name}), {result.imported} importés, "
+                f"{result.updated} mis à jour, {result.removed} supprimés, {result.skipped} inchangés, "
+                f"{len(result.duplicates)} doublons"
+            )
+            return result
+
+        if total == 0 and removed == 0:
             logger.info("LibraryServices : Aucun fichier trouvé")
-            return ImportResult(status=ImportStatus.EMPTY)
+            return ImportResult(status=ImportStatus.EMPTY, cancelled=cancel_token.cancelled)
+
+        # Déterminer le statut final
+        changed = imported + updated + removed
+        if changed == 0 and errors:
+            status = ImportStatus.ERROR
+        elif errors:
+            status = ImportStatus.PARTIAL
+        else:
+            status = ImportStatus.SUCCESS
+
+        logger.info(
+            f"LibraryServices : Import {'annulé' if cancel_token.cancelled else 'terminé'} ({status.name}), "
+            f"{imported}/{total} fichiers importés, "
+            f"{updated} mis à jour, {removed} supprimés, {skipped} inchangés, "
+            f"{len(duplicates)} doublons ({policy.value})"
+        )
+        return ImportResult(
+            status=status, imported=imported, errors=errors,
+            updated=updated, removed=removed, skipped=skipped,
+            duplicates=duplicates, cancelled=cancel_token.cancelled
+        )
+
+
+    def _import_new_rows(
+        self,
+        session,
+        db_importer: DBImporter,
+        detector: DuplicateDetector,
+        rows: List[dict],
+        policy: DuplicatePolicy,
+        changed_copies: Collection[str] = ()
+    ) -> Tuple[BatchImportResult, List[Duplicate]]:
+        """
+        Dédoublonne puis insère des fichiers absents de la base, selon la politique de doublons.
+
+        Args:
+            session: session de l'import
+            db_importer: importeur de l'import en cours
+            detector: détecteur de l'import en cours (mémorise les fichiers déjà retenus)
+            rows: métadonnées extraites
+            policy: SKIP, LINK ou REPORT
+            changed_copies: copies liées dont le fichier a changé depuis
+
+        Returns:
+            Tuple : (résultat de l'insertion, doublons détectés)
+        """
+        unique, found = detector.split(rows)
+        to_import = unique + [m for m, _ in found] if policy == DuplicatePolicy.REPORT else unique
+
+        # Copies modifiées qui ne sont plus liées : l'ancien lien est oublié
+        stale = [m["file_path"] for m in to_import if m["file_path"] in changed_copies]
+        if stale:
+            db_importer.forget_duplicates(stale)
+
+        result = db_importer.import_batch(to_import) if to_import else BatchImportResult()
+        if policy == DuplicatePolicy.REPORT or not found:
+            return result, [duplicate for _, duplicate in found]
+
+        # Lien vers le track d'origine, inséré au besoin dans ce même lot : une copie
+        # enregistrée (SKIP comme LINK) n'est plus relue par les imports incrémentaux
+        pending = [d.original_path for _, d in found if d.original_id is None]
+        original_ids = TrackRepository(session).get_file_states_by_paths(pending) if pending else {}
+
+        links = []
+        linked = []
+        unlinked = []
+        for metadata, duplicate in found:
+            track_id = duplicate.original_id
+            if track_id is None and duplicate.original_path in original_ids:
+                track_id = original_ids[duplicate.original_path][0]
+            if track_id is None:
+                # Original rejeté par l'insertion : la copie est importée à sa place (LINK)
+                # ou ignorée sans être enregistrée, elle sera réexaminée (SKIP)
+                if policy == DuplicatePolicy.LINK:
+                    unlinked.append(metadata)
+                continue
+            linked.append(duplicate)
+            links.append({
+                "file_path": metadata["file_path"],
+                "track_id": track_id,
+                "content_hash": metadata["content_hash"],
+                "file_size": metadata.get("file_size"),
+                "file_mtime_ns": metadata.get("file_mtime_ns"),
+            })
 
-        imported = 0
+        if links:
+            try:
+                db_importer.link_duplicates(links)
+            except Exception as e:
+                if policy == DuplicatePolicy.SKIP:
+                    # Copies ignorées quand même : seulement relues au prochain import
+                    return result, [duplicate for _, duplicate in found]
+                result.errors.extend((link["file_path"], str(e)) for link in links)
+                linked = []
+        if unlinked:
+            extra = db_importer.import_batch(unlinked)
+            result.imported += extra.imported
+            result.interrupted += extra.interrupted
+            result.errors.extend(extra.errors)
+
+        if policy == DuplicatePolicy.SKIP:
+            return result, [duplicate for _, duplicate in found]
+        return result, linked
+
+
+    def _queue_covers(self, session, db_importer: DBImporter, covers: CoverArtExtractor, metadata_batch: List[dict]) -> None:
+        """Soumet à l'extraction les albums du lot dont la pochette n'est pas déjà en cache."""
+        albums = {
+            album_id: file_paths for album_id, file_paths in db_importer.album_files(metadata_batch).items()
+            if album_id not in covers.requested
+        }
+        if not albums:
+            return
+
+        jackets = AlbumRepository(session).get_jackets(albums)
+        for album_id, file_paths in albums.items():
+            jacket = jackets.get(album_id)
+            if jacket and os.path.exists(jacket):
+                covers.requested.add(album_id)
+            else:
+                covers.submit(album_id, file_paths)
+
+
+    def _save_covers(self, db_importer: DBImporter, covers: CoverArtExtractor, wait: bool = False) -> None:
+        """Enregistre les pochettes prêtes (toutes si wait) ; un échec n'affecte pas l'import."""
+        jackets = covers.results(wait=wait)
+        if not jackets:
+            return
+        try:
+            db_importer.set_album_jackets(jackets)
+        except Exception as e:
+            logger.warning(f"LibraryServices : {len(jackets)} pochettes non enregistrées ({e})")
+    
+    
+    # ========================== #
+    #     Jobs d'import          #
+    # ========================== #
+    def recover_interrupted_jobs(self) -> int:
+        """Au démarrage : les jobs restés "running" ont été interrompus (fermeture, plantage)."""
+        with self.session_factory() as session:
+            count = ImportJobRepository(session).mark_interrupted()
+            session.commit()
+
+        if count:
+            logger.info(f"LibraryServices : {count} imports interrompus, reprise possible")
+        return count
+
+
+    def prepare_import_job(self, root_path: str, incremental: bool = False) -> Tuple[int, bool]:
+        """
+        Retourne le job à exécuter pour ce dossier : le dernier job inachevé s'il existe,
+        sinon un nouveau job.
+
+        Returns:
+            Tuple[int, bool] : (identifiant du job, True s'il s'agit d'une reprise)
+        """
+        root_path = os.path.normpath(root_path)
+        with self.session_factory() as session:
+            repo = ImportJobRepository(session)
+            job = repo.get_resumable(root_path)
+            resumed = job is not None
+            if not resumed:
+                job = repo.create(root_path, incremental=incremental)
+            session.commit()
+            job_id = job.id
+
+        if resumed:
+            logger.info(f"LibraryServices : Reprise du job d'import {job_id} pour {root_path}")
+        return job_id, resumed
+
+
+    def pending_import_results(self) -> List[ImportResult]:
+        """Résultats des imports terminés qui n'ont pas encore été présentés."""
+        with self.session_factory() as session:
+            return [job_to_result(job) for job in ImportJobRepository(session).get_unacknowledged()]
+
+
+    def acknowledge_import(self, job_id: int) -> None:
+        """Marque le résultat d'un job comme présenté à l'utilisateur."""
+        with self.session_factory() as session:
+            ImportJobRepository(session).acknowledge(job_id)
+            session.commit()
+
+
+    # ========================== #
+    #   Synchronisation ciblée   #
+    # ========================== #
+    def sync_paths(self, changed_paths: List[str], removed_paths: List[str]) -> ImportResult:
+        """
+        Répercute en base une liste de fichiers modifiés/créés et supprimés.
+
+        Utilisé par la surveillance des dossiers : seuls les chemins concernés
+        passent par FileImporter/DBImporter, sans rescanner la bibliothèque.
+        Indépendant de l'état d'un import en cours (ni annulation ni extracteur partagés).
+
+        Args:
+            changed_paths: fichiers audio créés ou modifiés
+            removed_paths: fichiers audio supprimés
+
+        Returns:
+            ImportResult : imported (nouveaux), updated (modifiés), removed (supprimés), doublons
+        """
+        imported = updated = removed = 0
         errors = []
-        total = len(files)
+        duplicates = []
+
+        # Petits lots (cas courant) : pas de coût de démarrage d'un pool de process
+        workers = 1 if len(changed_paths) < self.SYNC_PARALLEL_THRESHOLD else self.extraction_workers
+        extractor = ParallelMetadataExtractor(workers=workers)
+
+        covers = CoverArtExtractor() if self.extract_covers else None
 
-        # On garde la session ouverte pendant toute la boucle
         with self.session_factory() as session:
             db_importer = DBImporter(session)
-            file_importer = FileImporter(progress_callback=None)  # callback géré ici
+            detector = DuplicateDetector(session)
+            touched = changed_paths + removed_paths
+            known_files = TrackRepository(session).get_file_states_by_paths(touched)
+            # Copies liées touchées : oubliées, puis redétectées si le fichier existe encore
+            if touched:
+                try:
+                    db_importer.forget_duplicates(touched)
+                except Exception as e:
+                    errors.append((touched[0], str(e)))
+
+            for metadata_batch, batch_errors in extractor.extract(changed_paths):
+                errors.extend(batch_errors)
 
-            for i, file_path in enumerate(files, start=1):
-                if self._cancelled:
-                    logger.info("LibraryServices : Import annulé en cours")
-                    break
+                new_rows = [m for m in metadata_batch if m["file_path"] not in known_files]
+                changed_rows = [
+                    {**m, "track_id": known_files[m["file_path"]][0]}
+                    for m in metadata_batch if m["file_path"] in known_files
+                ]
 
+                if new_rows:
+                    batch_result, batch_duplicates = self._import_new_rows(
+                        session, db_importer, detector, new_rows, self.duplicate_policy
+                    )
+                    imported += batch_result.imported
+                    errors.extend(batch_result.errors)
+                    duplicates.extend((d.file_path, d.original_path) for d in batch_duplicates)
+                if changed_rows:
+                    batch_result = db_importer.update_batch(changed_rows)
+                    updated += batch_result.imported
+                    errors.extend(batch_result.errors)
+                if covers:
+                    self._queue_covers(session, db_importer, covers, metadata_batch)
+
+            if covers:
+                self._save_covers(db_importer, covers, wait=True)
+                covers.shutdown()
+
+            vanished = [known_files[path][0] for path in removed_paths if path in known_files]
+            if vanished:
                 try:
-                    metadata = file_importer.extract_metadata(file_path)
-                    db_importer.import_track(metadata)
-                    imported += 1
-                    # Callback thread-safe
-                    if progress_callback:
-                        percent = int((i / total) * 100)
-                        progress_callback(percent)
+                    removed = db_importer.delete_tracks(vanished)
                 except Exception as e:
-                    logger.exception(f"Erreur sur le fichier {file_path}")
-                    errors.append((file_path, str(e)))
+                    errors.append((removed_paths[0], str(e)))
 
-        # Déterminer le statut final
-        if imported == 0 and errors:
-            status = ImportStatus.FAILED
-        elif imported > 0 and errors:
-            status = ImportStatus.PARTIAL
-        elif imported > 0 and not errors:
-            status = ImportStatus.SUCCESS
+        if imported + updated + removed + len(duplicates) == 0:
+            status = ImportStatus.ERROR if errors else ImportStatus.EMPTY
         else:
-            status = ImportStatus.EMPTY
+            status = ImportStatus.PARTIAL if errors else ImportStatus.SUCCESS
 
-        logger.info(f"LibraryServices : Import terminé ({status.name}), {imported}/{total} fichiers importés")
-        return ImportResult(status=status, imported=imported, errors=errors)
-    
-    
\ No newline at end of file
+        logger.info(
+            f"LibraryServices : Synchronisation ({status.name}), {imported} ajoutés, "
+            f"{updated} mis à jour, {removed} supprimés, {len(duplicates)} doublons"
+        )
+        return ImportResult(
+            status=status, imported=imported, errors=errors,
+            updated=updated, removed=removed, duplicates=duplicates
+        )
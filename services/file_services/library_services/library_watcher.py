@@ -0,0 +1,368 @@
+# services/file_services/library_services/library_watcher.py
+
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, QTimer, QFileSystemWatcher, Signal
+
+from app.application.import_track.file_importer import FileImporter
+from repositories.watched_folder_repository import WatchedFolderRepository
+
+from core.logger import logger
+
+
+# État d'un fichier audio : (taille, mtime_ns)
+FileState = Tuple[int, int]
+# Index d'un dossier : {dossier: ({fichier: état}, {sous-dossiers})}
+DirectoryIndex = Dict[str, Tuple[Dict[str, FileState], Set[str]]]
+
+
+class LibraryWatcher(QObject):
+    """
+    Surveillance des dossiers racines de la bibliothèque.
+
+    Rôle :
+        - Enregistrer / retirer des dossiers racines (persistés en base)
+        - Surveiller chaque dossier via QFileSystemWatcher (inotify sous Linux),
+          avec repli sur un scrutin périodique des dossiers refusés (limite de watches…)
+        - Regrouper les événements (anti-rebond) et n'émettre que les fichiers
+          réellement créés, modifiés ou supprimés
+
+    Limite : seules les modifications d'entrées d'un dossier sont notifiées ;
+    une réécriture en place sans renommage n'est vue qu'au prochain événement du dossier.
+
+    Signaux :
+        changes_detected(list, list) : (fichiers créés/modifiés, fichiers supprimés)
+    """
+
+    # ============== #
+    #    Signaux     #
+    # ============== #
+    changes_detected = Signal(list, list)
+    _index_ready = Signal(str, object)
+    _subtrees_ready = Signal(str, object)
+
+    DEBOUNCE_MS = 1500
+    POLL_INTERVAL_MS = 10000
+
+    def __init__(self, session_factory, parent=None):
+        """
+        Initialise la surveillance.
+
+        Args:
+            session_factory: factory SQLAlchemy (persistance des dossiers surveillés)
+        """
+        super().__init__(parent)
+        self.session_factory = session_factory
+
+        self._roots: Set[str] = set()
+        self._files: Dict[str, Dict[str, FileState]] = {}
+        self._subdirs: Dict[str, Set[str]] = {}
+        # Dossiers en scrutin périodique : {dossier: mtime_ns}
+        self._polled: Dict[str, int] = {}
+        self._pending_dirs: Set[str] = set()
+        # Dossiers dont les nouvelles sous-arborescences sont en cours d'indexation
+        self._indexing_dirs: Set[str] = set()
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self._flush)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self._poll_timer.timeout.connect(self._poll)
+
+        # Indexation des racines et des sous-arborescences copiées hors du thread GUI
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Interrompt une indexation en cours à l'arrêt (fermeture de l'application)
+        self._stopping = threading.Event()
+        self._index_ready.connect(self._on_index_ready)
+        self._subtrees_ready.connect(self._on_subtrees_ready)
+
+
+    # ========================== #
+    #      API publique          #
+    # ========================== #
+    def start(self) -> None:
+        """Charge les dossiers enregistrés et démarre leur surveillance."""
+        with self.session_factory() as session:
+            paths = [folder.path for folder in WatchedFolderRepository(session).get_all()]
+
+        for path in paths:
+            self._index_root(path)
+        logger.info(f"LibraryWatcher : {len(paths)} dossiers surveillés")
+
+
+    def add_root(self, path: str) -> None:
+        """Enregistre un dossier racine et commence à le surveiller."""
+        path = os.path.normpath(path)
+        with self.session_factory() as session:
+            WatchedFolderRepository(session).create(path)
+            session.commit()
+
+        if path not in self._roots:
+            self._index_root(path)
+            logger.info(f"LibraryWatcher : Dossier ajouté à la surveillance {path}")
+
+
+    def remove_root(self, path: str) -> None:
+        """Retire un dossier racine de la surveillance."""
+        path = os.path.normpath(path)
+        with self.session_factory() as session:
+            WatchedFolderRepository(session).delete_by_path(path)
+            session.commit()
+
+        self._roots.discard(path)
+        self._forget_tree(path)
+        logger.info(f"LibraryWatcher : Dossier retiré de la surveillance {path}")
+
+
+    def stop(self) -> None:
+        """Arrête toute surveillance et l'indexation en cours (fermeture de l'application)."""
+        self._stopping.set()
+        self._debounce_timer.stop()
+        self._poll_timer.stop()
+        directories = self._watcher.directories()
+        if directories:
+            self._watcher.removePaths(directories)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+    @property
+    def roots(self) -> List[str]:
+        return sorted(self._roots)
+
+
+    # ========================== #
+    #        Indexation          #
+    # ========================== #
+    def _index_root(self, root: str) -> None:
+        if self._stopping.is_set():
+            return
+        self._roots.add(root)
+        self._executor.submit(self._run_indexing, self._index_ready, root, lambda: self._build_index(root))
+
+
+    @staticmethod
+    def _read_directory(directory: str) -> Tuple[Dict[str, FileState], Set[str]]:
+        """Lit un seul niveau de dossier : fichiers audio et sous-dossiers."""
+        files: Dict[str, FileState] = {}
+        subdirs: Set[str] = set()
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.add(entry.path)
+                    elif entry.is_file() and entry.name.lower().endswith(FileImporter.SUPPORTED_EXTENSIONS):
+                        stat = entry.stat()
+                        files[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                except OSError:
+                    continue
+
+        return files, subdirs
+
+
+    def _index_subtrees(self, directory: str, new_dirs: Set[str]) -> None:
+        """Indexe hors du thread GUI les nouvelles sous-arborescences d'un dossier."""
+        if self._stopping.is_set():
+            return
+        self._indexing_dirs.add(directory)
+        self._executor.submit(
+            self._run_indexing, self._subtrees_ready, directory,
+            lambda: {new_dir: self._build_index(new_dir) for new_dir in new_dirs}
+        )
+
+
+    def _run_indexing(self, ready, directory: str, build) -> None:
+        """Méthode exécutée dans le thread d'indexation ; rien n'est émis après stop()."""
+        index = build()
+        if not self._stopping.is_set():
+            ready.emit(directory, index)
+
+
+    def _build_index(self, root: str) -> DirectoryIndex:
+        """Indexe récursivement une arborescence (un parcours os.scandir)."""
+        index: DirectoryIndex = {}
+        pending = [root]
+
+        while pending and not self._stopping.is_set():
+            directory = pending.pop()
+            try:
+                files, subdirs = self._read_directory(directory)
+            except OSError as e:
+                logger.warning(f"LibraryWatcher : Dossier inaccessible {directory} ({e})")
+                continue
+            index[directory] = (files, subdirs)
+            pending.extend(subdirs)
+
+        return index
+
+
+    def _on_index_ready(self, root: str, index: DirectoryIndex) -> None:
+        if root not in self._roots:
+            return
+        self._store_index(index)
+        logger.info(f"LibraryWatcher : {len(index)} dossiers indexés sous {root}")
+
+
+    def _store_index(self, index: DirectoryIndex) -> None:
+        for directory, (files, subdirs) in index.items():
+            self._files[directory] = files
+            self._subdirs[directory] = subdirs
+        self._watch_dirs(index.keys())
+
+
+    def _watch_dirs(self, directories: Iterable[str]) -> None:
+        """Surveillance native, et scrutin périodique pour les dossiers refusés."""
+        directories = list(directories)
+        if not directories:
+            return
+
+        failed = self._watcher.addPaths(directories)
+        for directory in failed:
+            try:
+                self._polled[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+
+        if failed:
+            logger.warning(f"LibraryWatcher : {len(failed)} dossiers en scrutin périodique")
+            if not self._poll_timer.isActive():
+                self._poll_timer.start()
+
+
+    def _forget_tree(self, directory: str) -> List[str]:
+        """Oublie un dossier et ses descendants ; retourne les fichiers qu'ils contenaient."""
+        files: List[str] = []
+        pending = [directory]
+
+        while pending:
+            current = pending.pop()
+            files.extend(self._files.pop(current, {}))
+            pending.extend(self._subdirs.pop(current, ()))
+            self._polled.pop(current, None)
+            self._watcher.removePath(current)
+
+        return files
+
+
+    # ========================== #
+    #   Événements / anti-rebond #
+    # ========================== #
+    def _on_directory_changed(self, directory: str) -> None:
+        """Regroupe les événements : le traitement a lieu après DEBOUNCE_MS de calme."""
+        self._pending_dirs.add(directory)
+        self._debounce_timer.start()
+
+
+    def _poll(self) -> None:
+        """Repli : compare la date de modification des dossiers non surveillés nativement."""
+        for directory, mtime_ns in list(self._polled.items()):
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime_ns:
+                if current is not None:
+                    self._polled[directory] = current
+                self._on_directory_changed(directory)
+
+
+    def _flush(self) -> None:
+        """Compare les dossiers signalés à leur index et émet les fichiers concernés."""
+        directories, self._pending_dirs = self._pending_dirs, set()
+        changed: List[str] = []
+        removed: List[str] = []
+
+        for directory in directories:
+            self._diff_directory(directory, changed, removed)
+
+        if self._pending_dirs:
+            # Fichiers encore en cours d'écriture : nouvel essai plus tard
+            self._debounce_timer.start()
+
+        if changed or removed:
+            logger.info(f"LibraryWatcher : {len(changed)} fichiers modifiés, {len(removed)} supprimés")
+            self.changes_detected.emit(changed, removed)
+
+
+    def _on_subtrees_ready(self, directory: str, indexes: Dict[str, DirectoryIndex]) -> None:
+        """Reprend la comparaison d'un dossier une fois ses nouvelles sous-arborescences indexées."""
+        self._indexing_dirs.discard(directory)
+        changed: List[str] = []
+        removed: List[str] = []
+        self._diff_directory(directory, changed, removed, indexes)
+
+        if self._pending_dirs and not self._debounce_timer.isActive():
+            self._debounce_timer.start()
+
+        if changed or removed:
+            logger.info(f"LibraryWatcher : {len(changed)} fichiers modifiés, {len(removed)} supprimés")
+            self.changes_detected.emit(changed, removed)
+
+
+    def _diff_directory(
+        self,
+        directory: str,
+        changed: List[str],
+        removed: List[str],
+        subtree_indexes: Optional[Dict[str, DirectoryIndex]] = None
+    ) -> None:
+        """
+        Compare un dossier à son index.
+
+        Les nouvelles sous-arborescences (album copié…) sont d'abord indexées en
+        arrière-plan : la comparaison reprend avec subtree_indexes
+        (_on_subtrees_ready).
+        """
+        old_files = self._files.get(directory)
+        if old_files is None or (subtree_indexes is None and directory in self._indexing_dirs):
+            # Dossier oublié, ou comparaison reprise à la fin de l'indexation en cours
+            return
+
+        try:
+            files, subdirs = self._read_directory(directory)
+        except OSError:
+            # Dossier supprimé ou démonté
+            removed.extend(self._forget_tree(directory))
+            return
+
+        old_subdirs = self._subdirs.get(directory, set())
+        dir_changed = [path for path, state in files.items() if old_files.get(path) != state]
+        # Nouvelles sous-arborescences (album copié…) : indexées et entièrement signalées
+        new_dirs = subdirs - old_subdirs
+        if not new_dirs <= (subtree_indexes or {}).keys():
+            self._index_subtrees(directory, new_dirs)
+            return
+        new_indexes = [subtree_indexes[new_dir] for new_dir in new_dirs]
+        new_states = [files[path] for path in dir_changed] + [
+            state for index in new_indexes for new_files, _ in index.values() for state in new_files.values()
+        ]
+
+        # Un fichier modifié pendant la fenêtre d'anti-rebond est sans doute en cours de copie
+        recent_ns = time.time_ns() - self.DEBOUNCE_MS * 1_000_000
+        if any(mtime_ns > recent_ns for _, mtime_ns in new_states):
+            self._pending_dirs.add(directory)
+            return
+
+        changed.extend(dir_changed)
+        removed.extend(path for path in old_files if path not in files)
+        self._files[directory] = files
+        self._subdirs[directory] = subdirs
+
+        for gone in old_subdirs - subdirs:
+            removed.extend(self._forget_tree(gone))
+
+        for index in new_indexes:
+            for new_files, _ in index.values():
+                changed.extend(new_files)
+            self._store_index(index)
@@ -0,0 +1,136 @@
+# services/file_services/library_services/query_executor.py
+
+
+import itertools
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from sqlalchemy.orm import Session
+
+from core.logger import logger
+
+
+Query = Callable[[Session], Any]
+
+
+class _QueryTask(QRunnable):
+    """Exécute une lecture dans un thread du pool, avec sa propre session."""
+
+    def __init__(self, executor: "QueryExecutor", key: int, query: Query):
+        super().__init__()
+        # Le QueryExecutor garde la référence jusqu'au résultat
+        self.setAutoDelete(False)
+        self._executor = executor
+        self._key = key
+        self._query = query
+
+    def run(self):
+        """Méthode exécutée dans le thread."""
+        try:
+            with self._executor.session_factory() as session:
+                result = self._query(session)
+        except Exception as e:
+            logger.exception(f"QueryExecutor : Échec de la lecture {self._key}")
+            self._executor.failed.emit(self._key, str(e))
+            return
+        self._executor.finished.emit(self._key, result)
+
+
+class QueryExecutor(QObject):
+    """
+    Exécuteur des lectures de la BDD hors du thread GUI.
+
+    Rôle :
+        - Exécuter chaque lecture dans un pool de threads, avec une session
+          ouverte et fermée dans ce thread
+        - Rendre le résultat au thread GUI par signal (finished / failed),
+          puis aux callbacks passés à submit
+        - Annuler une lecture pas encore démarrée (cancel) : son résultat
+          n'est plus attendu
+
+    Une lecture reçoit une clé ; les signaux portent la clé de la lecture.
+    """
+
+    finished = Signal(int, object)   # clé, résultat
+    failed = Signal(int, str)        # clé, message d'erreur
+
+    MAX_THREADS = 2
+
+    def __init__(self, session_factory: Callable[[], Session], max_threads: int = MAX_THREADS, parent=None):
+        """
+        Args:
+            session_factory: factory SQLAlchemy en lecture seule
+            max_threads: lectures exécutées en parallèle
+        """
+        super().__init__(parent)
+        self.session_factory = session_factory
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._keys = itertools.count(1)
+        self._tasks: Dict[int, _QueryTask] = {}
+        self._callbacks: Dict[int, Tuple[Optional[Callable], Optional[Callable]]] = {}
+
+        # Émis depuis les threads du pool : reçus dans le thread GUI
+        self.finished.connect(self._on_finished)
+        self.failed.connect(self._on_failed)
+
+
+    def submit(
+        self,
+        query: Query,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        priority: int = 0
+    ) -> int:
+        """
+        Met une lecture en file.
+
+        Args:
+            query: fonction recevant la session du thread, retournant le résultat
+                   (objets détachés de la session : dataclasses, tuples, valeurs)
+            on_result: appelée dans le thread GUI avec le résultat
+            on_error: appelée dans le thread GUI avec le message d'erreur
+            priority: les lectures de plus haute priorité démarrent d'abord
+
+        Returns:
+            int : clé de la lecture
+        """
+        key = next(self._keys)
+        task = _QueryTask(self, key, query)
+        self._tasks[key] = task
+        self._callbacks[key] = (on_result, on_error)
+        self._pool.start(task, priority)
+        return key
+
+
+    def cancel(self, key: int) -> None:
+        """Retire une lecture de la file ; si elle a démarré, son résultat est ignoré."""
+        self._callbacks.pop(key, None)
+        task = self._tasks.get(key)
+        if task is not None and self._pool.tryTake(task):
+            del self._tasks[key]
+
+
+    def shutdown(self, timeout_ms: int = 3000) -> None:
+        """Abandonne les lectures en file et attend celles en cours (fermeture de l'application)."""
+        self._callbacks.clear()
+        self._pool.clear()
+        self._pool.waitForDone(timeout_ms)
+        logger.info("QueryExecutor : arrêté")
+
+
+    # ========================= #
+    #   Slots (thread GUI)      #
+    # ========================= #
+    def _on_finished(self, key: int, result: Any) -> None:
+        self._tasks.pop(key, None)
+        on_result, _ = self._callbacks.pop(key, (None, None))
+        if on_result is not None:
+            on_result(result)
+
+
+    def _on_failed(self, key: int, message: str) -> None:
+        self._tasks.pop(key, None)
+        _, on_error = self._callbacks.pop(key, (None, None))
+        if on_error is not None:
+            on_error(message)
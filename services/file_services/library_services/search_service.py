@@ -0,0 +1,97 @@
+# services/file_services/library_services/search_service.py
+
+import re
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.entities.track import Track as TrackDataClass
+from services.file_services.library_services.track_read_service import TrackReadService
+
+from core.logger import logger
+
+
+class SearchService:
+    """
+    Recherche plein texte dans la bibliothèque (index FTS5 tracks_search).
+
+    Rôle :
+        - Chercher dans les titres, artistes et albums, sans tenir compte de
+          la casse ni des accents ("beyonce" trouve "Beyoncé")
+        - Traiter chaque mot saisi comme un préfixe ("bea ab" trouve
+          "The Beatles - Abbey Road") ; tous les mots doivent correspondre.
+          Un mot d'une lettre est cherché tel quel (pas d'index de préfixe
+          d'une lettre : il énumérerait tout le vocabulaire)
+        - Classer les résultats par pertinence (bm25), un mot trouvé dans le
+          titre pesant plus que dans l'artiste, puis dans l'album. Seuls les
+          RANKED_CANDIDATES premiers résultats sont classés : une saisie très
+          large (début de frappe) reste rapide, au prix d'un classement partiel
+    """
+
+    # Poids bm25 des colonnes : titre, artiste, album
+    WEIGHTS = (10.0, 5.0, 3.0)
+    DEFAULT_LIMIT = 500
+    RANKED_CANDIDATES = 20000
+    MIN_PREFIX = 2
+
+    _WORD = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self, session: Session):
+        self.db = session
+
+
+    @classmethod
+    def build_query(cls, user_text: str) -> str:
+        """
+        Traduit la saisie en requête FTS5 : mots entre guillemets (la syntaxe
+        FTS5 de la saisie est neutralisée), en préfixe à partir de MIN_PREFIX lettres.
+
+        Returns:
+            str : requête MATCH, vide si la saisie ne contient aucun mot
+        """
+        return " ".join(
+            f'"{word}"*' if len(word) >= cls.MIN_PREFIX else f'"{word}"'
+            for word in cls._WORD.findall(user_text)
+        )
+
+
+    def search_ids(self, user_text: str, limit: int = DEFAULT_LIMIT) -> List[int]:
+        """
+        Retourne les identifiants des tracks correspondant à la saisie, classés.
+
+        Args:
+            user_text: texte saisi
+            limit: nombre maximal de résultats
+        """
+        query = self.build_query(user_text)
+        if not query:
+            return []
+
+        weights = ", ".join(str(w) for w in self.WEIGHTS)
+        return self.db.execute(
+            text(
+                "SELECT rowid FROM ("
+                f"SELECT rowid, bm25(tracks_search, {weights}) AS score FROM tracks_search "
+                "WHERE tracks_search MATCH :query LIMIT :candidates"
+                ") ORDER BY score LIMIT :limit"
+            ),
+            {"query": query, "candidates": self.RANKED_CANDIDATES, "limit": limit},
+        ).scalars().all()
+
+
+    def search(self, user_text: str, limit: int = DEFAULT_LIMIT) -> List[TrackDataClass]:
+        """
+        Retourne les pistes correspondant à la saisie, les plus pertinentes d'abord.
+
+        Args:
+            user_text: texte saisi
+            limit: nombre maximal de résultats
+
+        Returns:
+            List[TrackDataClass]: pistes pour affichage UI
+        """
+        track_ids = self.search_ids(user_text, limit)
+        tracks = TrackReadService(self.db).get_tracks_by_ids(track_ids) if track_ids else []
+        logger.debug(f"SearchService : {len(tracks)} résultats pour '{user_text}'")
+        return tracks
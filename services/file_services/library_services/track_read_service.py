@@ -1,18 +1,36 @@
 # app/file_service/library_services/track_read_service.py
 
-from typing import List
+from typing import List, Optional
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 
 from core.entities.track import Track as TrackDataClass
 from app.models.track import Track as TrackORM
+from app.models.artist import Artist
+from app.models.album import Album
+from repositories.pagination import Cursor, Page, keyset_page, offset_page
+from repositories.track_repository import LIBRARY_ORDER
 
 from core.logger import logger
 
 
+# Colonnes lues pour l'affichage : la clé de tri (LIBRARY_ORDER) puis les champs de la ligne
+_ROW_COLUMNS = (
+    TrackORM.album_id, TrackORM.track_number, TrackORM.id,
+    TrackORM.title, TrackORM.file_path, TrackORM.duration_seconds, TrackORM.genre, TrackORM.is_favorite,
+    Artist.name.label("artist_name"), Album.title.label("album_title"), Album.release_year, Album.jacket_path,
+)
+
+
 class TrackReadService():
     """
     Service de lecture des tracks depuis la BDD.
+
+    Les lectures d'affichage (get_track_rows, pages, recherche) sont des
+    projections : seules les colonnes affichées sont lues, en une jointure,
+    et les pistes sont construites directement depuis les tuples du résultat,
+    sans objets ORM.
     """
     
     def __init__(self, session: Session):
@@ -20,7 +38,8 @@ class TrackReadService():
     
     def get_tracks(self) -> List[TrackDataClass]:
         """
-        Retourne toutes les pistes sous forme de dataclasses pour affichage UI.
+        Retourne toutes les pistes sous forme de dataclasses pour affichage UI,
+        avec la pochette de leur album (jacket_path).
 
         Args:
             session (Session): session SQLAlchemy active
@@ -35,22 +54,156 @@ class TrackReadService():
             .all()
         )
 
-        tracks = [
+        tracks = self._to_dataclasses(orm_tracks)
+
+        logger.info(f"LibraryServices : {len(tracks)} tracks chargées depuis la BDD")
+        return tracks
+    
+    
+    def get_track_rows(self) -> List[TrackDataClass]:
+        """
+        Retourne toutes les pistes pour affichage, par projection, dans l'ordre de get_tracks.
+
+        Returns:
+            List[TrackDataClass]: pistes avec titre, artiste, album, durée, année et
+                                  champs des vues de tri (pochette, genre, favori)
+        """
+        tracks = self._to_rows(self._rows_query().order_by(*LIBRARY_ORDER))
+
+        logger.info(f"LibraryServices : {len(tracks)} tracks lues depuis la BDD")
+        return tracks
+
+
+    def get_tracks_page(self, cursor: Optional[Cursor] = None, limit: int = 500) -> Page[TrackDataClass]:
+        """
+        Retourne une page de la bibliothèque (pagination par clé), dans l'ordre de get_tracks.
+
+        Args:
+            cursor (Optional[Cursor]): next_cursor de la page précédente (None : première page)
+            limit (int): nombre de pistes de la page
+
+        Returns:
+            Page[TrackDataClass]: pistes numérotées à la suite des pages précédentes
+        """
+        page = keyset_page(self._rows_query(), LIBRARY_ORDER, cursor, limit)
+        start = (cursor.position if cursor else 0) + 1
+        return Page(self._to_rows(page.items, start), page.next_cursor)
+
+
+    def get_tracks_window(self, position: int, limit: int = 500) -> Page[TrackDataClass]:
+        """
+        Retourne la page commençant à la ligne position (saut direct), dans l'ordre de get_tracks.
+
+        Args:
+            position (int): index de la première piste (0 : début de la bibliothèque)
+            limit (int): nombre de pistes de la page
+
+        Returns:
+            Page[TrackDataClass]: pistes numérotées à partir de position + 1 ; next_cursor
+            permet de lire la suite par clé
+        """
+        page = offset_page(self._rows_query(), LIBRARY_ORDER, position, limit)
+        return Page(self._to_rows(page.items, position + 1), page.next_cursor)
+
+
+    def count_tracks(self) -> int:
+        """Retourne le nombre de pistes de la bibliothèque (COUNT(*), sans charger les lignes)."""
+        return self.db.query(func.count(TrackORM.id)).scalar()
+
+
+    def get_tracks_by_paths(self, file_paths: List[str], chunk_size: int = 500) -> List[TrackDataClass]:
+        """
+        Retourne les pistes correspondant à une liste de chemins (mise à jour incrémentale de l'UI).
+
+        Args:
+            file_paths (List[str]): chemins des fichiers audio
+
+        Returns:
+            List[TrackDataClass]: pistes trouvées (counttrack à renuméroter par l'appelant)
+        """
+        rows = []
+        for start in range(0, len(file_paths), chunk_size):
+            rows.extend(
+                self._rows_query()
+                .filter(TrackORM.file_path.in_(file_paths[start:start + chunk_size]))
+                .order_by(TrackORM.album_id, TrackORM.track_number)
+                .all()
+            )
+        return self._to_rows(rows)
+
+
+    def get_tracks_by_ids(self, track_ids: List[int], chunk_size: int = 500) -> List[TrackDataClass]:
+        """
+        Retourne les pistes d'une liste d'identifiants, dans l'ordre de la liste
+        (résultats de recherche classés).
+
+        Args:
+            track_ids (List[int]): identifiants des tracks
+
+        Returns:
+            List[TrackDataClass]: pistes trouvées, numérotées dans l'ordre donné
+        """
+        by_id = {}
+        for start in range(0, len(track_ids), chunk_size):
+            for row in self._rows_query().filter(TrackORM.id.in_(track_ids[start:start + chunk_size])):
+                by_id[row.id] = row
+        return self._to_rows([by_id[i] for i in track_ids if i in by_id])
+
+
+    def _rows_query(self):
+        """Projection des colonnes d'affichage (sans tri), artiste et album en jointure externe."""
+        return (
+            self.db.query(*_ROW_COLUMNS)
+            .outerjoin(Artist, Artist.id == TrackORM.artist_id)
+            .outerjoin(Album, Album.id == TrackORM.album_id)
+        )
+
+
+    @staticmethod
+    def _to_rows(rows, start: int = 1) -> List[TrackDataClass]:
+        """Construit les pistes d'affichage depuis les tuples de _rows_query, numérotées à partir de start."""
+        return [
+            TrackDataClass(
+                id=track_id,
+                counttrack=i,
+                title=title,
+                file_path=file_path,
+                artist=artist_name,
+                album=album_title,
+                duration=duration or 0,
+                year=release_year if release_year is not None else "Indisponible",
+                album_id=album_id,
+                jacket_path=jacket_path,
+                genre=genre,
+                is_favorite=bool(is_favorite)
+            )
+            for i, (
+                album_id, _, track_id, title, file_path, duration, genre, is_favorite,
+                artist_name, album_title, release_year, jacket_path
+            ) in enumerate(rows, start=start)
+        ]
+
+
+    @staticmethod
+    def _to_dataclasses(orm_tracks, start: int = 1) -> List[TrackDataClass]:
+        """Convertit des TrackORM (artist/album chargés) en dataclasses pour l'UI, numérotées à partir de start."""
+        return [
             TrackDataClass(
                 id=t.id,
                 counttrack=i,
                 title=t.title,
                 file_path=t.file_path,
-                artist=t.artist.name,
-                album=t.album,
+                artist=t.artist.name if t.artist else None,
+                album=t.album.title if t.album else None,
                 duration=t.duration_seconds or 0,
-                year=getattr(t.album, "year", "Indisponible")
+                year=t.album.release_year if t.album and t.album.release_year is not None else "Indisponible",
+                album_id=t.album_id,
+                jacket_path=t.album.jacket_path if t.album else None,
+                genre=t.genre,
+                is_favorite=t.is_favorite
             )
-            for i, t in enumerate(orm_tracks, start=1)
+            for i, t in enumerate(orm_tracks, start=start)
         ]
-
-        logger.info(f"LibraryServices : {len(tracks)} tracks chargées depuis la BDD")
-        return tracks
     
     
     def get_track_file_paths(self) -> list[str]:
@@ -63,8 +216,7 @@ class TrackReadService():
         Returns:
             list[str]: chemins des fichiers audio
         """
-        orm_tracks = self.db.query(TrackORM).order_by(TrackORM.album_id, TrackORM.track_number).all()
-        paths = [t.file_path for t in orm_tracks]
+        paths = self.db.scalars(select(TrackORM.file_path).order_by(*LIBRARY_ORDER)).all()
 
         logger.info(f"LibraryServices : {len(paths)} tracks pour le PlayerServices")
         return paths
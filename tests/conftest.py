@@ -0,0 +1,15 @@
+# tests/conftest.py
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Application Qt partagée (timers et signaux du scheduler)."""
+    return QCoreApplication.instance() or QCoreApplication([])
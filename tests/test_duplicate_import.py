@@ -0,0 +1,81 @@
+# tests/test_duplicate_import.py
+
+import shutil
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.application.import_track.duplicate_detector import DuplicatePolicy
+from benchmarks.corpus import write_flac
+from database.engine import create_sqlite_engine
+from database.migrations import migrate
+from services.file_services.library_services import library_services
+from services.file_services.library_services.library_services import LibraryServices
+
+
+TAGS = {"artist": "Artiste", "album": "Album", "date": "2001"}
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'library.db'}")
+    migrate(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def music(tmp_path):
+    """Deux fichiers et une copie de chacun (même charge audio, autre chemin)."""
+    root = tmp_path / "music"
+    root.mkdir()
+    for index, seconds in enumerate((30, 45)):
+        path = str(root / f"{index}.flac")
+        write_flac(path, {**TAGS, "title": f"Titre {index}", "tracknumber": str(index + 1)}, seconds, seed=index)
+        shutil.copy2(path, str(root / f"{index} - copie.flac"))
+    return str(root)
+
+
+@pytest.fixture
+def extracted(monkeypatch):
+    """Chemins passés à l'extraction des métadonnées."""
+    paths = []
+    extractor = library_services.ParallelMetadataExtractor
+
+    class RecordingExtractor(extractor):
+        def extract(self, file_paths, cancel_token=None):
+            def record():
+                for path in file_paths:
+                    paths.append(path)
+                    yield path
+            return super().extract(record(), cancel_token)
+
+    monkeypatch.setattr(library_services, "ParallelMetadataExtractor", RecordingExtractor)
+    return paths
+
+
+@pytest.mark.parametrize("policy", [DuplicatePolicy.SKIP, DuplicatePolicy.LINK])
+def test_incremental_import_does_not_extract_known_copies(session_factory, music, extracted, policy):
+    library = LibraryServices(session_factory, extraction_workers=1, duplicate_policy=policy, extract_covers=False)
+
+    first = library.import_from_directory(music)
+    assert first.imported == 2
+    assert len(first.duplicates) == 2
+
+    extracted.clear()
+    second = library.import_from_directory(music, incremental=True)
+    assert extracted == []
+    assert second.skipped == 4
+    assert (second.imported, second.removed, second.duplicates) == (0, 0, [])
+
+
+def test_modified_copy_is_examined_again(session_factory, music, extracted):
+    library = LibraryServices(session_factory, extraction_workers=1, extract_covers=False)
+    copy, _ = library.import_from_directory(music).duplicates[0]
+    write_flac(copy, {**TAGS, "title": "Autre", "tracknumber": "3"}, 60, seed=2)
+
+    extracted.clear()
+    result = library.import_from_directory(music, incremental=True)
+    assert extracted == [copy]
+    assert result.imported == 1
+    assert result.skipped == 3
@@ -0,0 +1,218 @@
+# tests/test_import_scheduler.py
+
+import os
+
+import pytest
+
+from services.file_services.import_services.import_scheduler import (
+    ImportPriority,
+    ImportScheduler,
+    ScheduledJobState,
+)
+
+
+class _Scheduler(ImportScheduler):
+    """Scheduler sans worker : un job démarré reste en cours jusqu'à complete()."""
+
+    def __init__(self, max_concurrent: int = ImportScheduler.MAX_CONCURRENT):
+        super().__init__(library_service=None, max_concurrent=max_concurrent)
+        self.started = []
+
+    def _start(self, job):
+        job.state = ScheduledJobState.RUNNING
+        self.started.append(job.root_path or "sync")
+
+    def complete(self, key: int):
+        job = self.job(key)
+        job.state = ScheduledJobState.FINISHED
+        self._finish(job, None)
+
+
+def _path(*parts):
+    return os.path.normpath(os.path.join(os.sep, "music", *parts))
+
+
+@pytest.fixture
+def scheduler(qapp):
+    return _Scheduler()
+
+
+def _run_pending(qapp):
+    # Démarrages différés (QTimer.singleShot(0))
+    qapp.processEvents()
+
+
+# ========================== #
+#        Recouvrement        #
+# ========================== #
+def test_subfolder_joins_queued_parent(scheduler, qapp):
+    parent = scheduler.enqueue_import(_path("A"))
+    child = scheduler.enqueue_import(_path("A", "Album"))
+
+    assert scheduler.job(child) is scheduler.job(parent)
+    _run_pending(qapp)
+    assert scheduler.started == [_path("A")]
+
+
+def test_subfolder_joins_running_parent(scheduler, qapp):
+    parent = scheduler.enqueue_import(_path("A"))
+    _run_pending(qapp)
+    child = scheduler.enqueue_import(_path("A", "Album"))
+
+    assert scheduler.job(child) is scheduler.job(parent)
+    assert scheduler.started == [_path("A")]
+
+
+def test_parent_absorbs_queued_subfolders(scheduler, qapp):
+    child = scheduler.enqueue_import(_path("A", "Album"), incremental=True, priority=ImportPriority.USER)
+    parent = scheduler.enqueue_import(_path("A"), priority=ImportPriority.BULK)
+
+    job = scheduler.job(parent)
+    assert scheduler.job(child) is job
+    assert job.keys == {child, parent}
+    assert job.priority == ImportPriority.USER
+    assert job.incremental is False
+    _run_pending(qapp)
+    assert scheduler.started == [_path("A")]
+
+
+def test_sibling_folders_are_not_merged(scheduler, qapp):
+    first = scheduler.enqueue_import(_path("A"))
+    second = scheduler.enqueue_import(_path("AB"))
+
+    assert scheduler.job(first) is not scheduler.job(second)
+
+
+def test_parent_waits_for_running_subfolder(scheduler, qapp):
+    child = scheduler.enqueue_import(_path("A", "Album"))
+    _run_pending(qapp)
+    parent = scheduler.enqueue_import(_path("A"))
+    other = scheduler.enqueue_import(_path("B"))
+    _run_pending(qapp)
+
+    # Le dossier parent attend, le dossier indépendant prend la place libre
+    assert scheduler.started == [_path("A", "Album"), _path("B")]
+    assert scheduler.job(parent).state == ScheduledJobState.QUEUED
+
+    scheduler.complete(other)
+    assert scheduler.started == [_path("A", "Album"), _path("B")]
+
+    scheduler.complete(child)
+    assert scheduler.started[-1] == _path("A")
+    assert scheduler.job(parent).incremental is True
+
+
+# ========================== #
+#         Priorités          #
+# ========================== #
+def test_queue_order_follows_priority_then_arrival(qapp):
+    scheduler = _Scheduler(max_concurrent=1)
+    bulk = scheduler.enqueue_import(_path("bulk"), priority=ImportPriority.BULK)
+    first = scheduler.enqueue_import(_path("first"))
+    second = scheduler.enqueue_import(_path("second"))
+    _run_pending(qapp)
+
+    assert scheduler.started == [_path("first")]
+    assert [job.key for job in scheduler.jobs()] == [first, second, bulk]
+
+    scheduler.complete(first)
+    scheduler.complete(second)
+    assert scheduler.started == [_path("first"), _path("second"), _path("bulk")]
+
+
+def test_sync_uses_reserved_slot(qapp):
+    scheduler = _Scheduler(max_concurrent=1)
+    scheduler.enqueue_import(_path("A"))
+    scheduler.enqueue_import(_path("B"))
+    _run_pending(qapp)
+    scheduler.enqueue_sync(["/music/A/new.mp3"], [])
+    _run_pending(qapp)
+
+    # Import de B en attente d'une place ; la synchronisation passe devant
+    assert scheduler.started == [_path("A"), "sync"]
+
+
+def test_joining_request_raises_queued_priority(qapp):
+    scheduler = _Scheduler(max_concurrent=1)
+    scheduler.enqueue_import(_path("running"))
+    _run_pending(qapp)
+    bulk = scheduler.enqueue_import(_path("A"), priority=ImportPriority.BULK)
+    user = scheduler.enqueue_import(_path("B"))
+    scheduler.enqueue_import(_path("A", "Album"), priority=ImportPriority.WATCH)
+
+    assert scheduler.job(bulk).priority == ImportPriority.WATCH
+    assert [job.key for job in scheduler.jobs()][1:] == [bulk, user]
+
+
+# ========================== #
+#     Annulation / arrêt     #
+# ========================== #
+def _cancelled(scheduler):
+    cancelled = []
+    scheduler.job_cancelled.connect(lambda key, result: cancelled.append((key, result)))
+    return cancelled
+
+
+def _queued_merged_requests(qapp):
+    """Scheduler plein, et un job en file servant deux demandes (dossier et sous-dossier)."""
+    scheduler = _Scheduler(max_concurrent=1)
+    scheduler.enqueue_import(_path("running"))
+    _run_pending(qapp)
+    parent = scheduler.enqueue_import(_path("A"))
+    child = scheduler.enqueue_import(_path("A", "Album"))
+    return scheduler, parent, child
+
+
+def test_cancel_merged_request_detaches_only_it(qapp):
+    scheduler, parent, child = _queued_merged_requests(qapp)
+    cancelled = _cancelled(scheduler)
+
+    assert scheduler.cancel(child) is True
+    assert cancelled == [(child, None)]
+    assert scheduler.job(child) is None
+    assert scheduler.cancel(child) is False
+
+    job = scheduler.job(parent)
+    assert job.state == ScheduledJobState.QUEUED
+    assert job.keys == {parent}
+
+    assert scheduler.cancel(parent) is True
+    assert cancelled == [(child, None), (parent, None)]
+    assert not any(job.root_path == _path("A") for job in scheduler.jobs())
+
+
+def test_cancel_job_own_key_keeps_serving_merged_request(qapp):
+    scheduler, parent, child = _queued_merged_requests(qapp)
+    cancelled = _cancelled(scheduler)
+
+    assert scheduler.cancel(parent) is True
+    assert cancelled == [(parent, None)]
+    assert scheduler.job(parent) is None
+    assert scheduler.job(child).keys == {child}
+
+
+def test_cancel_all_notifies_every_merged_request(qapp):
+    scheduler, parent, child = _queued_merged_requests(qapp)
+    cancelled = _cancelled(scheduler)
+
+    scheduler.cancel_all()
+    assert sorted(cancelled) == [(parent, None), (child, None)]
+    assert scheduler.job(parent) is None
+
+
+def test_shutdown_starts_nothing_more(qapp):
+    scheduler = _Scheduler(max_concurrent=1)
+    running = scheduler.enqueue_import(_path("A"))
+    scheduler.enqueue_import(_path("B"))
+    _run_pending(qapp)
+
+    scheduler.shutdown()
+    scheduler.complete(running)
+    assert scheduler.started == [_path("A")]
+    assert not scheduler.is_busy()
+
+
+def test_extraction_workers_share_cores():
+    slots = ImportScheduler.MAX_CONCURRENT + ImportScheduler.WATCH_SLOTS
+    assert ImportScheduler.extraction_workers(cpu_count=4 * slots) == 4
+    assert ImportScheduler.extraction_workers(cpu_count=1) == 1
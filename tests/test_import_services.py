@@ -0,0 +1,30 @@
+# tests/test_import_services.py
+
+import os
+
+from services.file_services.import_services.import_services import ImportServices
+from tests.test_import_scheduler import _Scheduler
+
+
+MUSIC = os.path.normpath("/music/A")
+
+
+def test_failed_import_reports_its_message(qapp):
+    scheduler = _Scheduler()
+    service = ImportServices(library_service=None, import_scheduler=scheduler)
+    failed, cancelled = [], []
+    key = service.start_import(MUSIC, cancelled_callback=cancelled.append, failed_callback=failed.append)
+
+    scheduler.job_failed.emit(key, "disque plein")
+    assert failed == ["disque plein"]
+    assert cancelled == []
+
+
+def test_failed_import_without_failed_callback_is_reported_as_cancelled(qapp):
+    scheduler = _Scheduler()
+    service = ImportServices(library_service=None, import_scheduler=scheduler)
+    cancelled = []
+    key = service.start_import(MUSIC, cancelled_callback=cancelled.append)
+
+    scheduler.job_failed.emit(key, "disque plein")
+    assert cancelled == [None]
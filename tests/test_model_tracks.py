@@ -0,0 +1,34 @@
+# tests/test_model_tracks.py
+
+from app.view_models.model_tracks import TracksTableModel
+from app.view_models.track_store import TrackStore
+from tests.test_track_store import TRACKS, _fields
+
+
+def test_shared_store_is_copied_before_changes(qapp):
+    store = TrackStore(TRACKS)
+    model = TracksTableModel()
+    model.set_tracks(store)
+    assert model.track_at(0)._store is store
+
+    model.remove_paths([TRACKS[0].file_path])
+    model.append_tracks(TRACKS[:1])
+
+    assert [_fields(row) for row in store] == [_fields(track) for track in TRACKS]
+    assert model.rowCount() == len(TRACKS)
+    assert model.track_at(len(TRACKS) - 1).id == TRACKS[0].id
+
+
+def test_share_tracks_adopts_a_store_with_the_same_rows(qapp):
+    model = TracksTableModel(TRACKS[:2])
+    model.append_tracks(TRACKS[2:])
+    resets = []
+    model.modelReset.connect(lambda: resets.append(1))
+
+    store = TrackStore(TRACKS)
+    assert model.share_tracks(store) is True
+    assert model.track_at(0)._store is store
+    assert resets == []
+
+    assert model.share_tracks(TrackStore(TRACKS[:1])) is False
+    assert model.track_at(0)._store is store
@@ -0,0 +1,91 @@
+# tests/test_pagination.py
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.album import Album
+from app.models.artist import Artist
+from app.models.track import Track
+from database.engine import create_sqlite_engine
+from database.migrations import migrate
+from repositories.pagination import keyset_page, offset_page
+from repositories.track_repository import LIBRARY_ORDER
+
+
+# (album, numéro de piste) : numéros absents (NULL) en tête, au milieu et en fin d'album
+TRACKS = [
+    ("B", 2), ("A", None), ("A", 3), ("B", None), ("A", 1),
+    ("A", None), ("C", None), ("B", 1), ("A", 2), ("C", None),
+    ("B", None), ("C", 1),
+]
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'library.db'}")
+    migrate(engine)
+    with sessionmaker(bind=engine)() as session:
+        artist = Artist(name="Artiste")
+        albums = {title: Album(title=title, artist=artist) for title in "ABC"}
+        session.add_all(albums.values())
+        session.add_all(
+            Track(
+                title=f"Piste {i}", file_path=f"/music/{i}.mp3",
+                artist=artist, album=albums[album], track_number=number
+            )
+            for i, (album, number) in enumerate(TRACKS)
+        )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _expected_ids(session):
+    return [track.id for track in session.query(Track).order_by(*LIBRARY_ORDER)]
+
+
+def _read_all(session, limit):
+    ids, cursor = [], None
+    while True:
+        page = keyset_page(session.query(Track), LIBRARY_ORDER, cursor, limit)
+        ids.extend(track.id for track in page.items)
+        if not page.has_more:
+            return ids, page
+        assert page.next_cursor.position == len(ids)
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 5, len(TRACKS), len(TRACKS) + 1])
+def test_keyset_pages_follow_sqlite_order_with_null_track_numbers(session, limit):
+    ids, last_page = _read_all(session, limit)
+
+    assert ids == _expected_ids(session)
+    assert last_page.next_cursor is None
+
+
+def test_null_track_numbers_come_first_within_album(session):
+    page = keyset_page(session.query(Track), LIBRARY_ORDER, None, len(TRACKS))
+    numbers = [(track.album.title, track.track_number) for track in page.items]
+
+    assert numbers[:5] == [("A", None), ("A", None), ("A", 1), ("A", 2), ("A", 3)]
+
+
+@pytest.mark.parametrize("position", [0, 1, 4, 7, 11])
+def test_offset_page_continues_by_key(session, position):
+    expected = _expected_ids(session)
+    page = offset_page(session.query(Track), LIBRARY_ORDER, position, 2)
+    ids = [track.id for track in page.items]
+
+    while page.has_more:
+        assert page.next_cursor.position == position + len(ids)
+        page = keyset_page(session.query(Track), LIBRARY_ORDER, page.next_cursor, 2)
+        ids.extend(track.id for track in page.items)
+
+    assert ids == expected[position:]
+
+
+def test_empty_query_has_no_next_page(session):
+    page = keyset_page(session.query(Track).filter(Track.id < 0), LIBRARY_ORDER, None, 10)
+
+    assert page.items == []
+    assert page.has_more is False
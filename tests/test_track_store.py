@@ -0,0 +1,119 @@
+# tests/test_track_store.py
+
+import pytest
+
+from app.view_models.track_store import UNKNOWN_YEAR, TrackStore
+from core.entities.track import Track
+
+
+def _track(track_id: int, **fields) -> Track:
+    values = dict(
+        id=track_id, counttrack=track_id, title=f"Titre {track_id}",
+        file_path=f"/music/Artiste/Album/{track_id:02d} Titre.flac",
+        artist="Artiste", album="Album", duration=180 + track_id, year=2001,
+        album_id=1, jacket_path="/covers/1.jpg", genre="Rock",
+    )
+    values.update(fields)
+    return Track(**values)
+
+
+def _fields(track):
+    return (
+        track.id, track.counttrack, track.title, track.file_path,
+        track.artist, track.album, track.duration, track.year,
+        track.album_id, track.jacket_path, track.genre, track.is_favorite,
+    )
+
+
+TRACKS = [
+    _track(1),
+    _track(2, title="Déjà vu — 東京", artist="Beyoncé", genre="Électro", is_favorite=True),
+    _track(3, artist=None, album=None, year=UNKNOWN_YEAR, duration=0, album_id=None, jacket_path=None, genre=None),
+    _track(4, file_path="C:\\Musique\\Album\\04.mp3"),
+    _track(5, file_path="sans_dossier.ogg", title=""),
+    _track(6, year=1999, album_id=2, jacket_path="/covers/2.jpg", is_favorite=True),
+]
+
+
+def test_extend_round_trips_every_field():
+    store = TrackStore(TRACKS)
+
+    assert len(store) == len(TRACKS)
+    assert [_fields(row) for row in store] == [_fields(track) for track in TRACKS]
+
+
+def test_to_track_copies_every_field():
+    store = TrackStore(TRACKS)
+
+    assert [row.to_track() for row in store] == TRACKS
+
+
+def test_extend_appends_after_existing_rows():
+    store = TrackStore(TRACKS[:2])
+    store.extend(TRACKS[2:])
+    store.extend([])
+
+    assert [row.id for row in store] == [track.id for track in TRACKS]
+    assert _fields(store[len(TRACKS) - 1]) == _fields(TRACKS[-1])
+
+
+def test_extend_accepts_rows_of_another_store():
+    copy = TrackStore(TrackStore(TRACKS))
+
+    assert [_fields(row) for row in copy] == [_fields(track) for track in TRACKS]
+
+
+def test_set_replaces_a_row_and_keeps_its_number():
+    store = TrackStore(TRACKS)
+    replacement = _track(
+        42, counttrack=99, title="Nouveau titre", artist="Autre", album=None, file_path="/autre/x.wav",
+        album_id=None, jacket_path=None, genre="Jazz", is_favorite=False
+    )
+    store.set(1, replacement)
+
+    assert _fields(store[1]) == (
+        42, 2, "Nouveau titre", "/autre/x.wav", "Autre", None, 222, 2001, None, None, "Jazz", False
+    )
+    assert _fields(store[0]) == _fields(TRACKS[0])
+    assert _fields(store[2]) == _fields(TRACKS[2])
+
+
+def test_set_with_number_then_set_back():
+    store = TrackStore(TRACKS)
+    store.set(0, TRACKS[3], counttrack=7)
+    store.set(0, TRACKS[0], counttrack=1)
+
+    assert [_fields(row) for row in store] == [_fields(track) for track in TRACKS]
+
+
+def test_delete_shifts_following_rows():
+    store = TrackStore(TRACKS)
+    store.delete(0)
+    store.delete(2)
+
+    expected = [TRACKS[1], TRACKS[2], TRACKS[4], TRACKS[5]]
+    assert [_fields(row) for row in store] == [_fields(track) for track in expected]
+
+
+def test_delete_then_extend_and_set():
+    store = TrackStore(TRACKS)
+    store.delete(len(store) - 1)
+    store.extend([TRACKS[-1]])
+    store.set(2, TRACKS[2])
+
+    assert [_fields(row) for row in store] == [_fields(track) for track in TRACKS]
+
+
+def test_out_of_range_year_is_unknown():
+    store = TrackStore([_track(1, year=40000), _track(2, year=-5), _track(3, year="2001")])
+
+    assert [row.year for row in store] == [UNKNOWN_YEAR] * 3
+
+
+def test_index_out_of_range():
+    store = TrackStore(TRACKS[:1])
+
+    with pytest.raises(IndexError):
+        store[1]
+    with pytest.raises(IndexError):
+        store[-1]